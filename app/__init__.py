@@ -1,14 +1,21 @@
 from flask import Flask
-from .extensions import db, ma, limiter, cache
+from .extensions import db, ma, limiter, cache, async_db, metrics, diagnostics, compression
 from .models import Base
+from . import migrations
 from .blueprints.customer import customer_bp
 from .blueprints.mechanic import mechanic_bp
 from .blueprints.service_ticket import ticket_bp
 from .blueprints.inventory import inventory_bp
+from .blueprints.health import health_bp
+from .blueprints.async_api import async_bp
+from .blueprints.reports import reports_bp
+from .blueprints.search import search_bp
+from .utils.json_provider import CompactJSONProvider
 from flask_swagger_ui import get_swaggerui_blueprint
 
 def create_app(config_name="DevelopmentConfig"):
     app = Flask(__name__)
+    app.json = CompactJSONProvider(app)
 
     if not isinstance(config_name, str):
         app.config.from_object(config_name)
@@ -16,9 +23,13 @@ def create_app(config_name="DevelopmentConfig"):
         app.config.from_object(f"config.{config_name}")
 
     db.init_app(app)
+    metrics.init_app(app)
+    diagnostics.init_app(app)
     ma.init_app(app)
     limiter.init_app(app)
     cache.init_app(app)
+    async_db.init_app(app)
+    compression.init_app(app)
 
     SWAGGER_URL = '/api/docs'
     API_URL = '/static/swagger.yaml'
@@ -33,9 +44,14 @@ def create_app(config_name="DevelopmentConfig"):
     app.register_blueprint(mechanic_bp, url_prefix="/mechanics")
     app.register_blueprint(ticket_bp, url_prefix="/service-tickets")
     app.register_blueprint(inventory_bp, url_prefix="/inventory")
+    app.register_blueprint(health_bp, url_prefix="/health")
+    app.register_blueprint(async_bp, url_prefix="/async")
+    app.register_blueprint(reports_bp, url_prefix="/reports")
+    app.register_blueprint(search_bp, url_prefix="/search")
     app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
     with app.app_context():
         Base.metadata.create_all(db.engine)
+        migrations.upgrade(db.engine)
 
     return app
@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+async_bp = Blueprint("async_bp", __name__)
+
+from . import routes
\ No newline at end of file
@@ -0,0 +1,73 @@
+from flask import jsonify
+from sqlalchemy import select
+from app.extensions import async_db
+from app.models import ServiceTicket, Inventory
+from app.blueprints.service_ticket.routes import ticket_list_query
+from app.blueprints.service_ticket.schemas import service_ticket_query
+from app.blueprints.inventory.schemas import inventory_schema, inventory_query, inventory_load_options
+from . import async_bp
+from app.utils.auth import token_required
+from app.utils.pagination import paginate_async, PaginationError
+from app.utils.query_params import QueryParamError
+
+
+# Async counterparts of the ticket and inventory read endpoints, backed by
+# the async engine. They accept the same query params and return the same
+# payloads; responses are not cached so every request reaches the database.
+
+
+# Get all service tickets
+@async_bp.route("/service-tickets", methods=["GET"])
+async def get_service_tickets():
+    try:
+        params, query, sort = ticket_list_query()
+        tickets, headers = await paginate_async(async_db.session, query, ServiceTicket, sort=sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(tickets), 200, headers
+
+
+# Get tickets for the logged in customer
+@async_bp.route("/service-tickets/my-tickets", methods=["GET"])
+@token_required
+async def get_my_tickets(customer_id):
+    try:
+        params = service_ticket_query.parse()
+        query = (
+            select(ServiceTicket)
+            .where(ServiceTicket.customer_id == customer_id, *params.filters)
+            .options(*params.load_options)
+        )
+        tickets, headers = await paginate_async(async_db.session, query, ServiceTicket, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(tickets), 200, headers
+
+
+# Get all inventory items
+@async_bp.route("/inventory", methods=["GET"])
+@token_required
+async def get_inventory(customer_id):
+    try:
+        params = inventory_query.parse()
+        query = select(Inventory).where(*params.filters).options(*params.load_options)
+        parts, headers = await paginate_async(async_db.session, query, Inventory, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(parts), 200, headers
+
+
+# Get inventory item by ID
+@async_bp.route("/inventory/<int:part_id>", methods=["GET"])
+@token_required
+async def get_inventory_item(customer_id, part_id):
+    async with async_db.session() as session:
+        part = await session.get(Inventory, part_id, options=inventory_load_options)
+
+    if not part:
+        return jsonify({"error": "Part not found"}), 404
+
+    return inventory_schema.jsonify(part), 200
@@ -1,11 +1,18 @@
 from flask import request, jsonify
 from app.extensions import db
-from app.models import Customer
+from app.models import Customer, ServiceTicket, service_mechanics
 from sqlalchemy import select
 from marshmallow import ValidationError
-from .schemas import customer_schema, customers_schema, login_schema
+from .schemas import customer_schema, login_schema, customer_query
 from . import customer_bp
 from app.utils.auth import encode_token, token_required
+from app.utils.pagination import paginate, PaginationError
+from app.utils.query_params import QueryParamError
+from app.utils.caching import cached_view, invalidate, ALL_RESOURCES
+from app.utils.bulk import parse_rows, bulk_import, BulkPayloadError
+from app.utils.scheduling import recount_load
+from app.utils.stock import release_parts
+from app.utils.passwords import hash_password, hash_passwords, verify_password, HashingBusy
 
 
 # Create customer
@@ -22,34 +29,37 @@ def create_customer():
     if existing_customer:
         return jsonify({"error": "Email already associated with an account."}), 400
 
+    try:
+        customer_data["password"] = hash_password(customer_data["password"])
+    except HashingBusy as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
     new_customer = Customer(**customer_data)
 
     db.session.add(new_customer)
     db.session.commit()
+    invalidate("customers")
 
     return customer_schema.jsonify(new_customer), 201
 
 
-# Get all customers, updated with pagination
+# Get all customers, updated with keyset pagination
 @customer_bp.route("", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
 def get_customers():
     try:
-        page = int(request.args.get("page"))
-        per_page = int(request.args.get("per_page"))
-
-        query = select(Customer)
-        customers = db.paginate(query, page=page, per_page=per_page)
-
-        return customers_schema.jsonify(customers.items), 200
+        params = customer_query.parse()
+        query = select(Customer).where(*params.filters).options(*params.load_options)
+        customers, headers = paginate(query, Customer, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
 
-    except Exception:
-        query = select(Customer)
-        customers = db.session.execute(query).scalars().all()
-        return customers_schema.jsonify(customers), 200
+    return params.serializer.jsonify(customers), 200, headers
 
 
 # Get customer by ID
 @customer_bp.route("/<int:customer_id>", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
 def get_customer(customer_id):
     customer = db.session.get(Customer, customer_id)
 
@@ -72,10 +82,17 @@ def update_customer(customer_id):
     except ValidationError as e:
         return jsonify(e.messages), 400
 
+    if "password" in customer_data:
+        try:
+            customer_data["password"] = hash_password(customer_data["password"])
+        except HashingBusy as e:
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
     for key, value in customer_data.items():
         setattr(customer, key, value)
 
     db.session.commit()
+    invalidate("customers")
 
     return customer_schema.jsonify(customer), 200
 
@@ -88,8 +105,25 @@ def delete_customer(customer_id):
     if not customer:
         return jsonify({"error": "Customer not found."}), 404
 
+    # Their tickets' assignments go with them, and reserved parts go back
+    # into stock
+    ticket_ids = db.session.execute(
+        select(ServiceTicket.id).where(ServiceTicket.customer_id == customer_id)
+    ).scalars().all()
+    release_parts(ticket_ids)
+
+    mechanic_ids = db.session.execute(
+        select(service_mechanics.c.mechanic_id)
+        .join(ServiceTicket, ServiceTicket.id == service_mechanics.c.ticket_id)
+        .where(ServiceTicket.customer_id == customer_id)
+        .distinct()
+    ).scalars().all()
+
     db.session.delete(customer)
+    db.session.flush()
+    recount_load(mechanic_ids)
     db.session.commit()
+    invalidate("customers")
 
     return jsonify({"message": f"Customer id {customer_id}, successfully deleted."}), 200
 
@@ -108,13 +142,40 @@ def login():
     query = select(Customer).where(Customer.email == email)
     customer = db.session.execute(query).scalars().first()
 
-    if not customer or customer.password != password:
+    try:
+        matches, new_hash = verify_password(customer.password if customer else None, password)
+    except HashingBusy as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
+    if not matches:
         return jsonify({"error": "Invalid email or password"}), 401
 
+    # Upgrade plaintext or old-method hashes now that we know the password
+    if new_hash:
+        customer.password = new_hash
+        db.session.commit()
+
     token = encode_token(customer.id)
 
     return jsonify({
         "status": "success",
         "message": "Successfully logged in",
         "auth_token": token
-    }), 200
\ No newline at end of file
+    }), 200
+
+
+# Bulk import customers (JSON array or CSV upload)
+@customer_bp.route("/bulk", methods=["POST"])
+def bulk_create_customers():
+    try:
+        rows = parse_rows()
+    except BulkPayloadError as e:
+        return jsonify({"error": str(e)}), 400
+
+    created, errors = bulk_import(
+        Customer, customer_schema, rows, unique_field="email", prepare=hash_passwords
+    )
+    if created:
+        invalidate("customers")
+
+    return jsonify({"created": created, "errors": errors}), 201 if created else 400
\ No newline at end of file
@@ -1,5 +1,8 @@
 from app.extensions import ma
-from app.models import Customer
+from app.models import Customer, ServiceTicket
+from sqlalchemy.orm import selectinload
+from app.utils.serializers import FastSerializer
+from app.utils.query_params import ListQuery
 from marshmallow import fields
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
@@ -10,6 +13,7 @@ class CustomerSchema(ma.SQLAlchemyAutoSchema):
         include_fk = True
         load_instance = False
         dump_only = ("service_tickets",)
+        load_only = ("password",)
         unknown = "exclude"
         
     email = fields.Email(required=False)
@@ -21,6 +25,19 @@ class CustomerSchema(ma.SQLAlchemyAutoSchema):
 
 customer_schema = CustomerSchema()
 customers_schema = CustomerSchema(many=True)
+customers_serializer = FastSerializer(customers_schema)
+
+# Eager loads for each nested field (service_tickets nests mechanics, parts
+# and lines).
+customer_loaders = {
+    "service_tickets": (
+        selectinload(Customer.service_tickets).selectinload(ServiceTicket.mechanics),
+        selectinload(Customer.service_tickets).selectinload(ServiceTicket.parts),
+        selectinload(Customer.service_tickets).selectinload(ServiceTicket.lines),
+    ),
+}
+
+customer_query = ListQuery(Customer, customers_serializer, customer_loaders)
 
 
 class LoginSchema(ma.Schema):
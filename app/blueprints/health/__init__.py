@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+health_bp = Blueprint("health_bp", __name__)
+
+from . import routes
\ No newline at end of file
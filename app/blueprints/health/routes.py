@@ -0,0 +1,39 @@
+import time
+from flask import jsonify, current_app
+from app.extensions import db
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from . import health_bp
+from app.utils.pool_monitor import pool_stats
+
+
+# Internal endpoints, off unless HEALTH_ENDPOINTS_ENABLED is set; they
+# report pool internals, so a disabled one answers 404 like any unknown URL
+@health_bp.before_request
+def require_enabled():
+    if not current_app.config.get("HEALTH_ENDPOINTS_ENABLED", False):
+        return jsonify({"error": "Not found."}), 404
+
+
+# Database health and connection pool metrics
+@health_bp.route("/db", methods=["GET"])
+def db_health():
+    start = time.perf_counter()
+
+    try:
+        with db.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        return jsonify({
+            "status": "error",
+            "error": str(e.__class__.__name__),
+            "pool": pool_stats(db.engine.pool),
+        }), 503
+
+    latency = (time.perf_counter() - start) * 1000
+
+    return jsonify({
+        "status": "ok",
+        "latency_ms": round(latency, 3),
+        "pool": pool_stats(db.engine.pool),
+    }), 200
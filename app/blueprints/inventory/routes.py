@@ -1,11 +1,16 @@
 from flask import request, jsonify
 from app.extensions import db
-from app.models import Inventory
+from app.models import Inventory, InventoryEvent
 from sqlalchemy import select
 from marshmallow import ValidationError
-from .schemas import inventory_schema, inventories_schema
+from .schemas import inventory_schema, inventory_query, inventory_events_schema
 from . import inventory_bp
 from app.utils.auth import token_required
+from app.utils.pagination import paginate, PaginationError
+from app.utils.query_params import QueryParamError
+from app.utils.caching import cached_view, invalidate, ALL_RESOURCES
+from app.utils.bulk import parse_rows, bulk_import, BulkPayloadError
+from app.utils.stock import is_low, low_stock, record_transitions
 
 
 # Create inventory item
@@ -21,34 +26,73 @@ def create_inventory(customer_id):
 
     db.session.add(new_part)
     db.session.commit()
+    invalidate("inventory")
 
     return inventory_schema.jsonify(new_part), 201
 
 
-# Get all inventory items, updated with pagination
+# Get all inventory items, updated with keyset pagination
 @inventory_bp.route("", methods=["GET"])
 @token_required
+@cached_view(*ALL_RESOURCES)
 def get_inventory(customer_id):
+    try:
+        params = inventory_query.parse()
+        query = select(Inventory).where(*params.filters).options(*params.load_options)
+        parts, headers = paginate(query, Inventory, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(parts), 200, headers
+
+
+# Parts at or below their reorder threshold, read from the partial
+# low-stock index; same query params and pagination as the full list
+@inventory_bp.route("/low-stock", methods=["GET"])
+@token_required
+@cached_view(*ALL_RESOURCES)
+def get_low_stock(customer_id):
+    try:
+        params = inventory_query.parse()
+        query = select(Inventory).where(low_stock(), *params.filters).options(*params.load_options)
+        parts, headers = paginate(query, Inventory, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(parts), 200, headers
+
 
+# Low-stock / restocked events after ?since=<event id> (default 0), oldest
+# first, at most ?limit= per call. X-Last-Event-Id is the watermark to
+# pass as since on the next call.
+@inventory_bp.route("/events", methods=["GET"])
+@token_required
+def get_inventory_events(customer_id):
     try:
-        page = int(request.args.get("page"))
-        per_page = int(request.args.get("per_page"))
+        since = int(request.args.get("since", 0))
+        limit = int(request.args.get("limit", 100))
+    except ValueError:
+        return jsonify({"error": "since and limit must be integers."}), 400
 
-        query = select(Inventory)
-        parts = db.paginate(query, page=page, per_page=per_page)
+    if limit < 1:
+        return jsonify({"error": "limit must be a positive integer."}), 400
 
-        return inventories_schema.jsonify(parts.items), 200
+    events = db.session.execute(
+        select(InventoryEvent)
+        .where(InventoryEvent.id > since)
+        .order_by(InventoryEvent.id)
+        .limit(min(limit, 1000))
+    ).scalars().all()
 
-    except Exception:
-        query = select(Inventory)
-        parts = db.session.execute(query).scalars().all()
+    last_id = events[-1].id if events else since
 
-        return inventories_schema.jsonify(parts), 200
+    return inventory_events_schema.jsonify(events), 200, {"X-Last-Event-Id": str(last_id)}
 
 
 # Get inventory item by ID
 @inventory_bp.route("/<int:part_id>", methods=["GET"])
 @token_required
+@cached_view(*ALL_RESOURCES)
 def get_inventory_item(customer_id, part_id):
 
     part = db.session.get(Inventory, part_id)
@@ -74,10 +118,14 @@ def update_inventory(customer_id, part_id):
     except ValidationError as e:
         return jsonify(e.messages), 400
 
+    was_low = is_low(part.quantity, part.reorder_threshold)
+
     for key, value in update_data.items():
         setattr(part, key, value)
 
+    record_transitions([(part.id, was_low, part.quantity, part.reorder_threshold)])
     db.session.commit()
+    invalidate("inventory")
 
     return inventory_schema.jsonify(part), 200
 
@@ -93,5 +141,22 @@ def delete_inventory(customer_id, part_id):
 
     db.session.delete(part)
     db.session.commit()
+    invalidate("inventory")
+
+    return jsonify({"message": f"Part {part_id} deleted successfully."}), 200
+
+
+# Bulk import inventory items (JSON array or CSV upload)
+@inventory_bp.route("/bulk", methods=["POST"])
+@token_required
+def bulk_create_inventory(customer_id):
+    try:
+        rows = parse_rows()
+    except BulkPayloadError as e:
+        return jsonify({"error": str(e)}), 400
+
+    created, errors = bulk_import(Inventory, inventory_schema, rows)
+    if created:
+        invalidate("inventory")
 
-    return jsonify({"message": f"Part {part_id} deleted successfully."}), 200
\ No newline at end of file
+    return jsonify({"created": created, "errors": errors}), 201 if created else 400
\ No newline at end of file
@@ -1,6 +1,9 @@
 from app.extensions import ma
-from app.models import Inventory
-from marshmallow import fields
+from app.models import Inventory, InventoryEvent, ServiceTicket
+from sqlalchemy.orm import selectinload
+from app.utils.serializers import FastSerializer
+from app.utils.query_params import ListQuery
+from marshmallow import fields, validate
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
 
@@ -12,8 +15,29 @@ class InventorySchema(ma.SQLAlchemyAutoSchema):
         dump_only = ("tickets",)
         unknown = "exclude"
 
-    tickets = fields.List(fields.Nested("ServiceTicketSchema", exclude=("parts",)), dump_only=True)
+    tickets = fields.List(fields.Nested("ServiceTicketSchema", exclude=("parts", "lines")), dump_only=True)
+
+    reorder_threshold = fields.Integer(validate=validate.Range(min=0))
 
 
 inventory_schema = InventorySchema()
 inventories_schema = InventorySchema(many=True)
+inventories_serializer = FastSerializer(inventories_schema)
+
+# Eager loads for each nested field (tickets nests customer and mechanics).
+inventory_loaders = {
+    "tickets": (
+        selectinload(Inventory.tickets).joinedload(ServiceTicket.customer),
+        selectinload(Inventory.tickets).selectinload(ServiceTicket.mechanics),
+    ),
+}
+inventory_load_options = tuple(option for options in inventory_loaders.values() for option in options)
+
+inventory_query = ListQuery(Inventory, inventories_serializer, inventory_loaders)
+
+
+class InventoryEventSchema(ma.SQLAlchemyAutoSchema):
+    class Meta:
+        model = InventoryEvent
+
+inventory_events_schema = InventoryEventSchema(many=True)
@@ -1,10 +1,15 @@
+from datetime import date
 from flask import request, jsonify
 from app.extensions import db
-from app.models import Mechanic
-from sqlalchemy import select
+from app.models import Mechanic, ServiceTicket, service_mechanics
+from sqlalchemy import select, func, and_
 from marshmallow import ValidationError
-from .schemas import mechanic_schema, mechanics_schema
+from .schemas import mechanic_schema, mechanic_rankings_schema, mechanic_query
 from . import mechanic_bp
+from app.utils.pagination import paginate, PaginationError
+from app.utils.query_params import QueryParamError
+from app.utils.caching import cached_view, invalidate, ALL_RESOURCES
+from app.utils.bulk import parse_rows, bulk_import, BulkPayloadError
 
 
 # Create mechanic
@@ -28,31 +33,29 @@ def create_mechanic():
 
     db.session.add(new_mechanic)
     db.session.commit()
+    invalidate("mechanics")
 
     return mechanic_schema.jsonify(new_mechanic), 201
 
 
 
-# Get all mechanics, updated with pagination
+# Get all mechanics, updated with keyset pagination
 @mechanic_bp.route("", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
 def get_mechanics():
     try:
-        page = int(request.args.get("page"))
-        per_page = int(request.args.get("per_page"))
+        params = mechanic_query.parse()
+        query = select(Mechanic).where(*params.filters).options(*params.load_options)
+        mechanics, headers = paginate(query, Mechanic, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
 
-        query = select(Mechanic)
-        mechanics = db.paginate(query, page=page, per_page=per_page)
-
-        return mechanics_schema.jsonify(mechanics.items), 200
-
-    except Exception:
-        query = select(Mechanic)
-        mechanics = db.session.execute(query).scalars().all()
-        return mechanics_schema.jsonify(mechanics), 200
+    return params.serializer.jsonify(mechanics), 200, headers
 
 
 # Get mechanic by ID
 @mechanic_bp.route("/<int:mechanic_id>", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
 def get_mechanic(mechanic_id):
     mechanic = db.session.get(Mechanic, mechanic_id)
 
@@ -82,6 +85,7 @@ def update_mechanic(mechanic_id):
         setattr(mechanic, key, value)
 
     db.session.commit()
+    invalidate("mechanics")
 
     return mechanic_schema.jsonify(mechanic), 200
 
@@ -96,16 +100,86 @@ def delete_mechanic(mechanic_id):
 
     db.session.delete(mechanic)
     db.session.commit()
+    invalidate("mechanics")
 
     return jsonify({"message": f"mechanic id {mechanic_id}, successfully deleted."}), 200
 
 
 # Most active mechanic
+# Ranks mechanics by ticket count with a single GROUP BY over service_mechanics.
+# Optional query params: limit (top-N), from / to (ISO dates on service_date).
 @mechanic_bp.route("/most-active", methods=["GET"])
+@cached_view("mechanics", "service_tickets")
 def get_most_active_mechanic():
-    query = select(Mechanic)
-    mechanics = db.session.execute(query).scalars().all()
+    limit = request.args.get("limit")
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            return jsonify({"error": "limit must be an integer."}), 400
+        if limit < 1:
+            return jsonify({"error": "limit must be a positive integer."}), 400
+
+    try:
+        start = request.args.get("from")
+        end = request.args.get("to")
+
+        if start:
+            start = date.fromisoformat(start)
+        if end:
+            end = date.fromisoformat(end)
+    except ValueError:
+        return jsonify({"error": "Invalid 'from' or 'to' date, expected YYYY-MM-DD."}), 400
+
+    rankings = rank_mechanics(limit=limit, start=start, end=end)
+
+    return mechanic_rankings_schema.jsonify(rankings), 200
+
+
+def rank_mechanics(limit=None, start=None, end=None):
+    ticket_join = service_mechanics.c.mechanic_id == Mechanic.id
+
+    # Date filters go into the ON clause so mechanics without matching
+    # tickets still show up with a count of zero.
+    if start or end:
+        ticket_filters = []
+        if start:
+            ticket_filters.append(ServiceTicket.service_date >= start)
+        if end:
+            ticket_filters.append(ServiceTicket.service_date <= end)
+
+        ticket_join = and_(
+            ticket_join,
+            service_mechanics.c.ticket_id.in_(
+                select(ServiceTicket.id).where(and_(*ticket_filters))
+            ),
+        )
+
+    ticket_count = func.count(service_mechanics.c.ticket_id).label("ticket_count")
+
+    query = (
+        select(Mechanic.id, Mechanic.name, ticket_count)
+        .outerjoin(service_mechanics, ticket_join)
+        .group_by(Mechanic.id, Mechanic.name)
+        .order_by(ticket_count.desc(), Mechanic.id)
+    )
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return db.session.execute(query).mappings().all()
+
+
+# Bulk import mechanics (JSON array or CSV upload)
+@mechanic_bp.route("/bulk", methods=["POST"])
+def bulk_create_mechanics():
+    try:
+        rows = parse_rows()
+    except BulkPayloadError as e:
+        return jsonify({"error": str(e)}), 400
 
-    mechanics.sort(key=lambda mechanic: len(mechanic.tickets), reverse=True)
+    created, errors = bulk_import(Mechanic, mechanic_schema, rows, unique_field="email")
+    if created:
+        invalidate("mechanics")
 
-    return mechanics_schema.jsonify(mechanics), 200
\ No newline at end of file
+    return jsonify({"created": created, "errors": errors}), 201 if created else 400
\ No newline at end of file
@@ -1,5 +1,8 @@
 from app.extensions import ma
-from app.models import Mechanic
+from app.models import Mechanic, ServiceTicket
+from sqlalchemy.orm import selectinload
+from app.utils.serializers import FastSerializer
+from app.utils.query_params import ListQuery
 from marshmallow import fields
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
@@ -9,7 +12,7 @@ class MechanicSchema(ma.SQLAlchemyAutoSchema):
         model = Mechanic
         include_fk = True
         load_instance = False
-        dump_only = ("tickets",)
+        dump_only = ("tickets", "ticket_load")
         unknown = "exclude"
         
     email = ma.Email(required=False)
@@ -21,3 +24,23 @@ class MechanicSchema(ma.SQLAlchemyAutoSchema):
 
 mechanic_schema = MechanicSchema()
 mechanics_schema = MechanicSchema(many=True)
+mechanics_serializer = FastSerializer(mechanics_schema)
+
+# Eager loads for each nested field (tickets nests customer, parts and lines).
+mechanic_loaders = {
+    "tickets": (
+        selectinload(Mechanic.tickets).joinedload(ServiceTicket.customer),
+        selectinload(Mechanic.tickets).selectinload(ServiceTicket.parts),
+        selectinload(Mechanic.tickets).selectinload(ServiceTicket.lines),
+    ),
+}
+
+mechanic_query = ListQuery(Mechanic, mechanics_serializer, mechanic_loaders)
+
+
+class MechanicRankingSchema(ma.Schema):
+    id = fields.Integer()
+    name = fields.String()
+    ticket_count = fields.Integer()
+
+mechanic_rankings_schema = MechanicRankingSchema(many=True)
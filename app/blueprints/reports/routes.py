@@ -0,0 +1,110 @@
+from datetime import date
+from flask import request, jsonify
+from app.extensions import db
+from app.models import Mechanic, Inventory, ReportDailyRevenue, ReportPartUsage
+from sqlalchemy import select, func
+from .schemas import daily_revenue_schema, revenue_totals_schema, part_usage_schema
+from . import reports_bp
+from app.blueprints.mechanic.schemas import mechanic_rankings_schema
+from app.utils.auth import token_required
+from app.utils.caching import cached_view, ALL_RESOURCES
+
+# Every endpoint reads the aggregates kept by app.utils.reporting (and
+# mechanics.ticket_load), never service_ticket_inventory itself.
+
+
+def _limit():
+    limit = request.args.get("limit")
+    if limit is None:
+        return None
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise ValueError("limit must be an integer.")
+    if limit < 1:
+        raise ValueError("limit must be a positive integer.")
+    return limit
+
+
+# Parts revenue, units and tickets per service day
+# Optional query params: from / to (ISO dates)
+@reports_bp.route("/revenue", methods=["GET"])
+@token_required
+@cached_view(*ALL_RESOURCES)
+def get_revenue_report(customer_id):
+    try:
+        start = request.args.get("from")
+        end = request.args.get("to")
+
+        filters = []
+        if start:
+            filters.append(ReportDailyRevenue.day >= date.fromisoformat(start))
+        if end:
+            filters.append(ReportDailyRevenue.day <= date.fromisoformat(end))
+    except ValueError:
+        return jsonify({"error": "Invalid 'from' or 'to' date, expected YYYY-MM-DD."}), 400
+
+    days = db.session.execute(
+        select(ReportDailyRevenue).where(*filters).order_by(ReportDailyRevenue.day)
+    ).scalars().all()
+
+    totals = db.session.execute(
+        select(
+            func.coalesce(func.sum(ReportDailyRevenue.tickets), 0).label("tickets"),
+            func.coalesce(func.sum(ReportDailyRevenue.units), 0).label("units"),
+            func.round(func.coalesce(func.sum(ReportDailyRevenue.revenue), 0.0), 2).label("revenue"),
+        ).where(*filters)
+    ).mappings().one()
+
+    return jsonify({
+        "days": daily_revenue_schema.dump(days),
+        "totals": revenue_totals_schema.dump(totals),
+    }), 200
+
+
+# Units, tickets and revenue per part, most used first
+# Optional query params: limit (top-N)
+@reports_bp.route("/parts", methods=["GET"])
+@token_required
+@cached_view(*ALL_RESOURCES)
+def get_parts_report(customer_id):
+    try:
+        limit = _limit()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Outer join: usage of deleted parts is still reported, without a name
+    query = (
+        select(
+            ReportPartUsage.inventory_id,
+            Inventory.name,
+            ReportPartUsage.units,
+            ReportPartUsage.tickets,
+            ReportPartUsage.revenue,
+        )
+        .outerjoin(Inventory, Inventory.id == ReportPartUsage.inventory_id)
+        .order_by(ReportPartUsage.units.desc(), ReportPartUsage.inventory_id)
+        .limit(limit)
+    )
+
+    return part_usage_schema.jsonify(db.session.execute(query).mappings().all()), 200
+
+
+# Tickets currently assigned per mechanic, busiest first
+# Optional query params: limit (top-N)
+@reports_bp.route("/mechanics", methods=["GET"])
+@token_required
+@cached_view(*ALL_RESOURCES)
+def get_mechanics_report(customer_id):
+    try:
+        limit = _limit()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    query = (
+        select(Mechanic.id, Mechanic.name, Mechanic.ticket_load.label("ticket_count"))
+        .order_by(Mechanic.ticket_load.desc(), Mechanic.id)
+        .limit(limit)
+    )
+
+    return mechanic_rankings_schema.jsonify(db.session.execute(query).mappings().all()), 200
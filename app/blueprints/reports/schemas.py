@@ -0,0 +1,28 @@
+from app.extensions import ma
+from app.models import ReportDailyRevenue
+from marshmallow import fields
+
+
+class DailyRevenueSchema(ma.SQLAlchemyAutoSchema):
+    class Meta:
+        model = ReportDailyRevenue
+
+daily_revenue_schema = DailyRevenueSchema(many=True)
+
+
+class RevenueTotalsSchema(ma.Schema):
+    tickets = fields.Integer()
+    units = fields.Integer()
+    revenue = fields.Float()
+
+revenue_totals_schema = RevenueTotalsSchema()
+
+
+class PartUsageSchema(ma.Schema):
+    inventory_id = fields.Integer()
+    name = fields.String(allow_none=True)
+    units = fields.Integer()
+    tickets = fields.Integer()
+    revenue = fields.Float()
+
+part_usage_schema = PartUsageSchema(many=True)
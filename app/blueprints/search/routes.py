@@ -0,0 +1,54 @@
+from flask import request, jsonify, current_app
+from app.extensions import db
+from sqlalchemy import select
+from . import search_bp
+from app.blueprints.customer.schemas import customer_query
+from app.blueprints.service_ticket.schemas import service_ticket_query
+from app.blueprints.inventory.schemas import inventory_query
+from app.utils.auth import token_required
+from app.utils.pagination import paginate_ranked, PaginationError
+from app.utils.query_params import QueryParamError
+from app.utils.caching import cached_view, ALL_RESOURCES
+from app.utils.search import SEARCH_INDEXES, MAX_CANDIDATES, SearchError, parse_terms
+
+
+# Runs ?q= against one search index, best match first, with keyset
+# pagination (after / limit / count). The list's filter[...] / fields /
+# include params apply too; results are always ordered by relevance, and
+# at most SEARCH_MAX_CANDIDATES matches are ranked.
+def _search(name, list_query):
+    index = SEARCH_INDEXES[name]
+
+    try:
+        terms = parse_terms(request.args.get("q"))
+        params = list_query.parse()
+        query = select(index.model).where(*params.filters).options(*params.load_options)
+        max_candidates = current_app.config.get("SEARCH_MAX_CANDIDATES", MAX_CANDIDATES)
+        query, rank = index.search(query, terms, db.engine.dialect.name, max_candidates)
+        items, headers = paginate_ranked(query, index.model, rank)
+    except (SearchError, QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(items), 200, headers
+
+
+# Search customers by name, email or phone
+@search_bp.route("/customers", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
+def search_customers():
+    return _search("customers", customer_query)
+
+
+# Search service tickets by VIN or description
+@search_bp.route("/tickets", methods=["GET"])
+@cached_view(*ALL_RESOURCES)
+def search_tickets():
+    return _search("tickets", service_ticket_query)
+
+
+# Search parts by name
+@search_bp.route("/parts", methods=["GET"])
+@token_required
+@cached_view(*ALL_RESOURCES)
+def search_parts(customer_id):
+    return _search("parts", inventory_query)
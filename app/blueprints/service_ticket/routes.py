@@ -1,11 +1,27 @@
-from flask import request, jsonify
-from app.extensions import db, limiter, cache
-from app.models import ServiceTicket, Customer, Mechanic, Inventory
-from sqlalchemy import select
+from datetime import date
+from flask import request, jsonify, current_app, Response, stream_with_context
+from app.extensions import db, limiter
+from app.models import ServiceTicket, Customer, Mechanic, Inventory, service_mechanics, service_ticket_inventory
+from sqlalchemy import select, insert, update
+from sqlalchemy.exc import IntegrityError
 from marshmallow import ValidationError
-from .schemas import service_ticket_schema, service_tickets_schema
+from .schemas import (
+    service_ticket_schema,
+    service_ticket_query,
+    service_ticket_load_options,
+    mechanic_ids_schema,
+    part_ids_schema,
+    part_quantity_schema,
+    auto_assign_schema,
+)
 from . import ticket_bp
 from app.utils.auth import token_required
+from app.utils.pagination import paginate, PaginationError
+from app.utils.query_params import QueryParamError
+from app.utils.caching import cached_view, conditional, invalidate, ALL_RESOURCES
+from app.utils.scheduling import adjust_load, least_loaded
+from app.utils.reporting import record_ticket, record_parts
+from app.utils.stock import is_low, record_transitions
 
 
 # Create service ticket
@@ -24,7 +40,9 @@ def create_service_ticket(customer_id):
     new_ticket = ServiceTicket(**ticket_data)
 
     db.session.add(new_ticket)
+    record_ticket(new_ticket.service_date)
     db.session.commit()
+    invalidate("service_tickets")
 
     return service_ticket_schema.jsonify(new_ticket), 201
 
@@ -45,7 +63,40 @@ def assign_mechanic(ticket_id, mechanic_id):
         return jsonify({"message": "Mechanic already assigned to this ticket."}), 200
 
     ticket.mechanics.append(mechanic)
+    adjust_load([mechanic_id], 1)
     db.session.commit()
+    invalidate("service_tickets")
+
+    return service_ticket_schema.jsonify(ticket), 200
+
+
+# Assign several mechanics to a ticket in one request
+@ticket_bp.route("/<int:ticket_id>/mechanics", methods=["PUT"])
+@limiter.limit("3 per hour")
+def assign_mechanics(ticket_id):
+    try:
+        data = mechanic_ids_schema.load(request.json)
+    except ValidationError as e:
+        return jsonify(e.messages), 400
+
+    ticket = db.session.get(ServiceTicket, ticket_id)
+    if not ticket:
+        return jsonify({"error": "Service ticket not found."}), 404
+
+    mechanic_ids = set(data["mechanic_ids"])
+    missing = _missing_ids(Mechanic, mechanic_ids)
+    if missing:
+        return jsonify({"error": "Mechanics not found.", "mechanic_ids": missing}), 404
+
+    try:
+        new_ids = _link_to_ticket(service_mechanics, "mechanic_id", ticket_id, mechanic_ids)
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Ticket mechanics changed concurrently, try again."}), 409
+
+    adjust_load(new_ids, 1)
+    db.session.commit()
+    invalidate("service_tickets")
 
     return service_ticket_schema.jsonify(ticket), 200
 
@@ -65,46 +116,162 @@ def remove_mechanic(ticket_id, mechanic_id):
         return jsonify({"message": "Mechanic is not assigned to this ticket."}), 400
 
     ticket.mechanics.remove(mechanic)
+    adjust_load([mechanic_id], -1)
     db.session.commit()
+    invalidate("service_tickets")
 
     return service_ticket_schema.jsonify(ticket), 200
 
 
-# Get all service tickets, updated with pagination
+# Assign the least loaded mechanic(s) not already on the ticket
+# Optional body: {"count": n} (default 1). Meant to run on every new ticket,
+# so the rate limit is a per-client ceiling set by AUTO_ASSIGN_RATE_LIMIT.
+AUTO_ASSIGN_RATE_LIMIT = "120 per minute"
+
+@ticket_bp.route("/<int:ticket_id>/auto-assign", methods=["POST"])
+@limiter.limit(lambda: current_app.config.get("AUTO_ASSIGN_RATE_LIMIT", AUTO_ASSIGN_RATE_LIMIT))
+def auto_assign_mechanics(ticket_id):
+    try:
+        data = auto_assign_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify(e.messages), 400
+
+    ticket = db.session.get(ServiceTicket, ticket_id)
+    if not ticket:
+        return jsonify({"error": "Service ticket not found."}), 404
+
+    mechanics = least_loaded(ticket_id, data["count"])
+    if not mechanics:
+        return jsonify({"error": "No mechanic available."}), 409
+
+    # A concurrent auto-assign may pick the same mechanics; only the ids
+    # this request actually linked count toward their load
+    try:
+        new_ids = _link_to_ticket(
+            service_mechanics, "mechanic_id", ticket_id, {mechanic.id for mechanic in mechanics}
+        )
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Ticket mechanics changed concurrently, try again."}), 409
+
+    if not new_ids:
+        db.session.rollback()
+        return jsonify({"error": "No mechanic available."}), 409
+
+    adjust_load(new_ids, 1)
+    db.session.commit()
+    invalidate("service_tickets")
+
+    return service_ticket_schema.jsonify(ticket), 200
+
+
+# Shorthand sort orders accepted by ?order= on the ticket list; ?sort= wins
+TICKET_ORDERS = {
+    "id": [],
+    "service_date": [(ServiceTicket.service_date, False)],
+    "-service_date": [(ServiceTicket.service_date, True)],
+}
+
+
+# Builds the ticket list query from the request's query string; shared
+# with the async views. Returns (params, query, sort).
+# Optional query params: from / to (ISO dates on service_date), order, and
+# the shared filter[...] / sort / fields / include params
+def ticket_list_query():
+    params = service_ticket_query.parse()
+    query = select(ServiceTicket).where(*params.filters).options(*params.load_options)
+
+    try:
+        start = request.args.get("from")
+        end = request.args.get("to")
+
+        if start:
+            query = query.where(ServiceTicket.service_date >= date.fromisoformat(start))
+        if end:
+            query = query.where(ServiceTicket.service_date <= date.fromisoformat(end))
+    except ValueError:
+        raise QueryParamError("Invalid 'from' or 'to' date, expected YYYY-MM-DD.")
+
+    order = request.args.get("order", "id")
+    if order not in TICKET_ORDERS:
+        raise QueryParamError(f"order must be one of: {', '.join(TICKET_ORDERS)}.")
+
+    return params, query, params.sort or TICKET_ORDERS[order]
+
+
+# Get all service tickets, updated with keyset pagination
 @ticket_bp.route("", methods=["GET"])
-@cache.cached(timeout=30)
+@cached_view(*ALL_RESOURCES)
 def get_service_tickets():
-
     try:
-        page = int(request.args.get("page"))
-        per_page = int(request.args.get("per_page"))
+        params, query, sort = ticket_list_query()
+        tickets, headers = paginate(query, ServiceTicket, sort=sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return params.serializer.jsonify(tickets), 200, headers
+
+
+# Export all service tickets as NDJSON, streamed in batches so memory
+# stays flat regardless of table size. This is the nightly full export, so
+# it is not scoped to the caller: the token only gates access to it.
+EXPORT_BATCH_SIZE = 500
+
+@ticket_bp.route("/export", methods=["GET"])
+@token_required
+def export_service_tickets(_customer_id):
+    batch_size = current_app.config.get("EXPORT_BATCH_SIZE", EXPORT_BATCH_SIZE)
+
+    query = (
+        select(ServiceTicket)
+        .options(*service_ticket_load_options)
+        .order_by(ServiceTicket.id)
+        .execution_options(yield_per=batch_size, stream_results=True)
+    )
 
-        query = select(ServiceTicket)
-        tickets = db.paginate(query, page=page, per_page=per_page)
+    def generate():
+        result = db.session.execute(query).scalars()
 
-        return service_tickets_schema.jsonify(tickets.items), 200
+        for batch in result.partitions():
+            yield "".join(
+                current_app.json.dumps(service_ticket_schema.dump(ticket)) + "\n"
+                for ticket in batch
+            )
+            # Drop the batch from the identity map before loading the next one
+            for ticket in batch:
+                db.session.expunge(ticket)
 
-    except Exception:
-        query = select(ServiceTicket)
-        tickets = db.session.execute(query).scalars().all()
-        return service_tickets_schema.jsonify(tickets), 200
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
 
 
 # Get logged in customers tickets
 @ticket_bp.route("/my-tickets", methods=["GET"])
 @token_required
+@conditional(*ALL_RESOURCES)
 def get_my_tickets(customer_id):
 
-    query = select(ServiceTicket).where(ServiceTicket.customer_id == customer_id)
-    tickets = db.session.execute(query).scalars().all()
+    try:
+        params = service_ticket_query.parse()
+        query = (
+            select(ServiceTicket)
+            .where(ServiceTicket.customer_id == customer_id, *params.filters)
+            .options(*params.load_options)
+        )
+        tickets, headers = paginate(query, ServiceTicket, sort=params.sort)
+    except (QueryParamError, PaginationError) as e:
+        return jsonify({"error": str(e)}), 400
 
-    return service_tickets_schema.jsonify(tickets), 200
+    return params.serializer.jsonify(tickets), 200, headers
 
 
-# Add inventory item
+# Add inventory item, reserving stock (optional body: {"quantity": n}, default 1)
 @ticket_bp.route("/<int:ticket_id>/add-part/<int:part_id>", methods=["PUT"])
 @token_required
 def add_part_to_ticket(customer_id, ticket_id, part_id):
+    try:
+        data = part_quantity_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify(e.messages), 400
 
     ticket = db.session.get(ServiceTicket, ticket_id)
     if not ticket:
@@ -120,7 +287,113 @@ def add_part_to_ticket(customer_id, ticket_id, part_id):
     if part in ticket.parts:
         return jsonify({"error": "Part already assigned to this ticket."}), 400
 
-    ticket.parts.append(part)
+    short = _reserve_parts({part_id}, data["quantity"])
+    if short:
+        db.session.rollback()
+        return jsonify({"error": "Not enough stock.", "part_ids": short}), 409
+
+    try:
+        db.session.execute(insert(service_ticket_inventory).values(
+            ticket_id=ticket_id, inventory_id=part_id, quantity=data["quantity"]
+        ))
+        record_parts(ticket, {part_id: data["quantity"]})
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent request linked the same part first; its reservation stands
+        db.session.rollback()
+        return jsonify({"error": "Part already assigned to this ticket."}), 400
+
+    invalidate("service_tickets", "inventory")
+
+    return service_ticket_schema.jsonify(ticket), 200
+
+
+# Add several inventory items to a ticket in one request
+@ticket_bp.route("/<int:ticket_id>/parts", methods=["PUT"])
+@token_required
+def add_parts_to_ticket(customer_id, ticket_id):
+    try:
+        data = part_ids_schema.load(request.json)
+    except ValidationError as e:
+        return jsonify(e.messages), 400
+
+    ticket = db.session.get(ServiceTicket, ticket_id)
+    if not ticket:
+        return jsonify({"error": "Service ticket not found."}), 404
+
+    if ticket.customer_id != int(customer_id):
+        return jsonify({"error": "Not authorized to modify this ticket"}), 403
+
+    part_ids = set(data["part_ids"])
+    missing = _missing_ids(Inventory, part_ids)
+    if missing:
+        return jsonify({"error": "Parts not found.", "part_ids": missing}), 404
+
+    try:
+        new_ids = _link_to_ticket(service_ticket_inventory, "inventory_id", ticket_id, part_ids)
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Ticket parts changed concurrently, try again."}), 409
+
+    # One unit of each newly linked part; all-or-nothing
+    short = _reserve_parts(new_ids)
+    if short:
+        db.session.rollback()
+        return jsonify({"error": "Not enough stock.", "part_ids": short}), 409
+
+    record_parts(ticket, dict.fromkeys(new_ids, 1))
     db.session.commit()
+    invalidate("service_tickets", "inventory")
+
+    return service_ticket_schema.jsonify(ticket), 200
+
 
-    return service_ticket_schema.jsonify(ticket), 200
\ No newline at end of file
+# Returns the ids (sorted) that have no row in model, with one IN query
+def _missing_ids(model, ids):
+    found = db.session.execute(select(model.id).where(model.id.in_(ids))).scalars()
+    return sorted(ids - set(found))
+
+
+# Inserts association rows for the ids not yet linked to the ticket,
+# in a single multi-row INSERT; returns the ids it linked
+def _link_to_ticket(table, column, ticket_id, ids):
+    linked = db.session.execute(
+        select(table.c[column]).where(
+            table.c.ticket_id == ticket_id,
+            table.c[column].in_(ids)
+        )
+    ).scalars()
+
+    new_ids = sorted(ids - set(linked))
+    if new_ids:
+        db.session.execute(
+            insert(table),
+            [{"ticket_id": ticket_id, column: new_id} for new_id in new_ids]
+        )
+
+    return new_ids
+
+
+# Takes quantity units of each part out of stock with one conditional
+# UPDATE (quantity >= n is checked by the database, so concurrent requests
+# cannot oversell), recording a low-stock event for parts it takes below
+# their threshold. Returns the ids (sorted) that did not have enough
+# stock; the caller must roll back if any are returned.
+def _reserve_parts(ids, quantity=1):
+    if not ids:
+        return []
+
+    reserved = db.session.execute(
+        update(Inventory)
+        .where(Inventory.id.in_(ids), Inventory.quantity >= quantity)
+        .values(quantity=Inventory.quantity - quantity)
+        .returning(Inventory.id, Inventory.quantity, Inventory.reorder_threshold)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    record_transitions(
+        (part_id, is_low(left + quantity, threshold), left, threshold)
+        for part_id, left, threshold in reserved
+    )
+
+    return sorted(set(ids) - {part_id for part_id, _, _ in reserved})
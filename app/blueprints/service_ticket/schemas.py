@@ -1,15 +1,25 @@
 from app.extensions import ma
 from app.models import ServiceTicket
-from marshmallow import fields
+from sqlalchemy.orm import joinedload, selectinload
+from app.utils.serializers import FastSerializer
+from app.utils.query_params import ListQuery
+from marshmallow import fields, validate
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
 
+# One row of service_ticket_inventory: units of a part reserved for the
+# ticket. Nested parts[].quantity is the part's stock on hand, not this.
+class TicketLineSchema(ma.Schema):
+    inventory_id = fields.Integer()
+    quantity = fields.Integer()
+
+
 class ServiceTicketSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = ServiceTicket
         include_fk = True
         load_instance = False
-        dump_only = ("customer", "mechanics", "parts")
+        dump_only = ("customer", "mechanics", "parts", "lines")
         unknown = "exclude"
 
     customer = fields.Nested("CustomerSchema", exclude=("service_tickets",), dump_only=True)
@@ -18,8 +28,47 @@ class ServiceTicketSchema(ma.SQLAlchemyAutoSchema):
 
     parts = fields.List(fields.Nested("InventorySchema", exclude=("tickets",)), dump_only=True)
 
+    lines = fields.List(fields.Nested(TicketLineSchema), dump_only=True)
+
     VIN = fields.String(required=True)
 
 
 service_ticket_schema = ServiceTicketSchema()
 service_tickets_schema = ServiceTicketSchema(many=True)
+service_tickets_serializer = FastSerializer(service_tickets_schema)
+
+class MechanicIdsSchema(ma.Schema):
+    mechanic_ids = fields.List(fields.Integer(), required=True, validate=validate.Length(min=1))
+
+mechanic_ids_schema = MechanicIdsSchema()
+
+
+class PartIdsSchema(ma.Schema):
+    part_ids = fields.List(fields.Integer(), required=True, validate=validate.Length(min=1))
+
+part_ids_schema = PartIdsSchema()
+
+
+class PartQuantitySchema(ma.Schema):
+    quantity = fields.Integer(load_default=1, validate=validate.Range(min=1))
+
+part_quantity_schema = PartQuantitySchema()
+
+
+class AutoAssignSchema(ma.Schema):
+    count = fields.Integer(load_default=1, validate=validate.Range(min=1, max=10))
+
+auto_assign_schema = AutoAssignSchema()
+
+
+# Eager loads for each nested field above, so dumping a page of tickets
+# costs a fixed number of queries instead of one per row.
+service_ticket_loaders = {
+    "customer": (joinedload(ServiceTicket.customer),),
+    "mechanics": (selectinload(ServiceTicket.mechanics),),
+    "parts": (selectinload(ServiceTicket.parts),),
+    "lines": (selectinload(ServiceTicket.lines),),
+}
+service_ticket_load_options = tuple(option for options in service_ticket_loaders.values() for option in options)
+
+service_ticket_query = ListQuery(ServiceTicket, service_tickets_serializer, service_ticket_loaders)
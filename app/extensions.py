@@ -4,6 +4,11 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
 from sqlalchemy.orm import DeclarativeBase
+from app.utils import ratelimit_storage  # registers sqlite:// for RATELIMIT_STORAGE_URI
+from app.utils.async_db import AsyncDatabase
+from app.utils.metrics import Metrics
+from app.utils.diagnostics import Diagnostics
+from app.utils.compression import Compression
 
 # Base class for ALL MODELS — stored here to avoid circular imports
 class Base(DeclarativeBase):
@@ -15,3 +20,9 @@ db = SQLAlchemy(model_class=Base)
 ma = Marshmallow()
 limiter = Limiter(key_func=get_remote_address, default_limits=[])
 cache = Cache()
+metrics = Metrics()
+diagnostics = Diagnostics()
+compression = Compression()
+
+# Async engine for the /async read views
+async_db = AsyncDatabase()
@@ -0,0 +1,67 @@
+"""Versioned schema migrations.
+
+create_all() builds new databases straight from the models, which already
+declare every index and column. Migrations bring existing databases up to
+the same shape. Each one is a module named vNNNN_<description>.py with an
+upgrade(conn) function, and must be safe to run against a database that
+already has the change (CREATE INDEX IF NOT EXISTS, column checks, ...).
+
+Applied versions are recorded in schema_migrations, which lives outside
+Base.metadata so drop_all() leaves it alone.
+"""
+import importlib
+import pkgutil
+import re
+from datetime import datetime, timezone
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, select, insert
+from sqlalchemy.exc import IntegrityError
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+_MODULE_NAME = re.compile(r"^v(\d{4})_(\w+)$")
+
+
+def migrations():
+    """Return [(version, name, module)] for every migration, in order."""
+    found = []
+    for module_info in pkgutil.iter_modules(__path__):
+        match = _MODULE_NAME.match(module_info.name)
+        if match:
+            module = importlib.import_module(f"{__name__}.{module_info.name}")
+            found.append((int(match.group(1)), match.group(2), module))
+    return sorted(found, key=lambda migration: migration[0])
+
+
+def applied_versions(engine):
+    schema_migrations.create(engine, checkfirst=True)
+    with engine.connect() as conn:
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def upgrade(engine):
+    """Apply every pending migration, each in its own transaction."""
+    applied = applied_versions(engine)
+
+    for version, name, module in migrations():
+        if version in applied:
+            continue
+
+        try:
+            with engine.begin() as conn:
+                module.upgrade(conn)
+                conn.execute(insert(schema_migrations).values(
+                    version=version,
+                    name=name,
+                    applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                ))
+        except IntegrityError:
+            # Another worker recorded this version first
+            continue
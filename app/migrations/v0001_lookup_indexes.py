@@ -0,0 +1,16 @@
+"""Index the columns used for lookups and reverse association joins."""
+from sqlalchemy import text
+
+INDEXES = (
+    ("ix_service_tickets_customer_id", "service_tickets", "customer_id"),
+    ("ix_service_tickets_VIN", "service_tickets", '"VIN"'),
+    ("ix_service_tickets_service_date", "service_tickets", "service_date"),
+    ("ix_inventory_name", "inventory", "name"),
+    ("ix_service_mechanics_mechanic_id", "service_mechanics", "mechanic_id"),
+    ("ix_service_ticket_inventory_inventory_id", "service_ticket_inventory", "inventory_id"),
+)
+
+
+def upgrade(conn):
+    for name, table, column in INDEXES:
+        conn.execute(text(f'CREATE INDEX IF NOT EXISTS "{name}" ON {table} ({column})'))
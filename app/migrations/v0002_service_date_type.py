@@ -0,0 +1,53 @@
+"""Convert service_tickets.service_date from free text to a DATE column.
+
+Values are normalized to ISO dates first; common US and ISO variants are
+parsed, anything unreadable becomes NULL. SQLite stores dates as ISO text,
+so that is all it needs; Postgres also gets its column type changed.
+"""
+from datetime import datetime
+from sqlalchemy import text, inspect, Date
+
+FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%Y/%m/%d", "%d %b %Y", "%b %d, %Y")
+
+
+def normalize(value):
+    if value is None:
+        return None
+
+    value = str(value).strip()
+
+    # Drop any time part of ISO datetimes: 2025-01-01T10:00 / 2025-01-01 10:00
+    candidates = [value, value[:10]]
+
+    for candidate in candidates:
+        for fmt in FORMATS:
+            try:
+                return datetime.strptime(candidate, fmt).date().isoformat()
+            except ValueError:
+                continue
+
+    return None
+
+
+def upgrade(conn):
+    columns = {column["name"]: column for column in inspect(conn).get_columns("service_tickets")}
+    if isinstance(columns["service_date"]["type"], Date):
+        return
+
+    rows = conn.execute(
+        text("SELECT id, service_date FROM service_tickets WHERE service_date IS NOT NULL")
+    ).all()
+
+    for ticket_id, value in rows:
+        normalized = normalize(value)
+        if normalized != value:
+            conn.execute(
+                text("UPDATE service_tickets SET service_date = :value WHERE id = :id"),
+                {"value": normalized, "id": ticket_id},
+            )
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "ALTER TABLE service_tickets ALTER COLUMN service_date TYPE DATE "
+            "USING service_date::date"
+        ))
@@ -0,0 +1,12 @@
+"""Record how many units of each part a ticket reserved."""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {column["name"] for column in inspect(conn).get_columns("service_ticket_inventory")}
+    if "quantity" in columns:
+        return
+
+    conn.execute(text(
+        "ALTER TABLE service_ticket_inventory ADD COLUMN quantity INTEGER NOT NULL DEFAULT 1"
+    ))
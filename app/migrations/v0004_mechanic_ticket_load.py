@@ -0,0 +1,16 @@
+"""Track each mechanic's assigned ticket count for auto-assignment."""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {column["name"] for column in inspect(conn).get_columns("mechanics")}
+    if "ticket_load" not in columns:
+        conn.execute(text("ALTER TABLE mechanics ADD COLUMN ticket_load INTEGER NOT NULL DEFAULT 0"))
+
+    conn.execute(text('CREATE INDEX IF NOT EXISTS "ix_mechanics_ticket_load" ON mechanics (ticket_load, id)'))
+
+    # Backfill from the existing assignments
+    conn.execute(text(
+        "UPDATE mechanics SET ticket_load = "
+        "(SELECT COUNT(*) FROM service_mechanics WHERE service_mechanics.mechanic_id = mechanics.id)"
+    ))
@@ -0,0 +1,9 @@
+"""Backfill the reporting aggregates from existing tickets.
+
+create_all() has already created the (empty) tables by the time this runs.
+"""
+from app.utils.reporting import rebuild_reports
+
+
+def upgrade(conn):
+    rebuild_reports(conn)
@@ -0,0 +1,8 @@
+"""Create the search indexes (FTS5 on SQLite, pg_trgm on Postgres) for
+tables that already existed, and index their current rows."""
+from app.utils.search import SEARCH_INDEXES
+
+
+def upgrade(conn):
+    for index in SEARCH_INDEXES.values():
+        index.create(conn, rebuild=True)
@@ -0,0 +1,13 @@
+"""Add per-part reorder thresholds and the partial low-stock index."""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {column["name"] for column in inspect(conn).get_columns("inventory")}
+    if "reorder_threshold" not in columns:
+        conn.execute(text("ALTER TABLE inventory ADD COLUMN reorder_threshold INTEGER NOT NULL DEFAULT 0"))
+
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS "ix_inventory_low_stock" ON inventory (id) '
+        "WHERE quantity <= reorder_threshold"
+    ))
@@ -0,0 +1,13 @@
+"""Recreate the SQLite FTS update triggers so they fire only when an
+indexed column changes, not on every update to the source row."""
+from sqlalchemy import text
+from app.utils.search import SEARCH_INDEXES
+
+
+def upgrade(conn):
+    if conn.dialect.name != "sqlite":
+        return
+
+    for index in SEARCH_INDEXES.values():
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {index.fts}_au"))
+        index.create(conn)
@@ -1,20 +1,23 @@
 from app.extensions import db, Base
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import List
+from datetime import date, datetime
 
 # Many-to-many tables
 service_mechanics = db.Table(
     "service_mechanics",
     Base.metadata,
     db.Column("ticket_id", db.ForeignKey("service_tickets.id"), primary_key=True),
-    db.Column("mechanic_id", db.ForeignKey("mechanics.id"), primary_key=True),
+    db.Column("mechanic_id", db.ForeignKey("mechanics.id"), primary_key=True, index=True),
 )
 
 service_ticket_inventory = db.Table(
     "service_ticket_inventory",
     Base.metadata,
     db.Column("ticket_id", db.ForeignKey("service_tickets.id"), primary_key=True),
-    db.Column("inventory_id", db.ForeignKey("inventory.id"), primary_key=True),
+    db.Column("inventory_id", db.ForeignKey("inventory.id"), primary_key=True, index=True),
+    # Units of the part reserved from stock for this ticket
+    db.Column("quantity", db.Integer, nullable=False, default=1, server_default="1"),
 )
 
 class Customer(Base):
@@ -39,6 +42,12 @@ class Mechanic(Base):
     email: Mapped[str] = mapped_column(db.String(360), nullable=False, unique=True)
     phone: Mapped[str] = mapped_column(db.String(50))
     salary: Mapped[float] = mapped_column(db.Float)
+    # Assigned tickets, maintained by app.utils.scheduling
+    ticket_load: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        db.Index("ix_mechanics_ticket_load", "ticket_load", "id"),
+    )
 
     tickets: Mapped[List["ServiceTicket"]] = db.relationship(
         secondary=service_mechanics,
@@ -49,9 +58,21 @@ class Inventory(Base):
     __tablename__ = "inventory"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(db.String(255), nullable=False)
+    name: Mapped[str] = mapped_column(db.String(255), nullable=False, index=True)
     price: Mapped[float] = mapped_column(db.Float, nullable=False)
     quantity: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Low stock at or below this quantity; 0 alerts only when out of stock
+    reorder_threshold: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+
+    # Partial index holding only the low-stock parts (see app.utils.stock)
+    __table_args__ = (
+        db.Index(
+            "ix_inventory_low_stock",
+            "id",
+            sqlite_where=db.text("quantity <= reorder_threshold"),
+            postgresql_where=db.text("quantity <= reorder_threshold"),
+        ),
+    )
 
     tickets: Mapped[List["ServiceTicket"]] = db.relationship(
         secondary=service_ticket_inventory,
@@ -63,11 +84,11 @@ class ServiceTicket(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    VIN: Mapped[str] = mapped_column(db.String(255), nullable=True)
-    service_date: Mapped[str] = mapped_column(db.String(255), nullable=True)
+    VIN: Mapped[str] = mapped_column(db.String(255), nullable=True, index=True)
+    service_date: Mapped[date] = mapped_column(db.Date, nullable=True, index=True)
     service_desc: Mapped[str] = mapped_column(db.String(255), nullable=True)
 
-    customer_id: Mapped[int] = mapped_column(db.ForeignKey("customers.id"))
+    customer_id: Mapped[int] = mapped_column(db.ForeignKey("customers.id"), index=True)
 
     customer: Mapped["Customer"] = db.relationship(
         back_populates="service_tickets"
@@ -82,3 +103,42 @@ class ServiceTicket(Base):
         secondary=service_ticket_inventory,
         back_populates="tickets"
     )
+
+    # Read side of service_ticket_inventory, for the per-line quantity;
+    # rows are written through parts or the reservation routes
+    lines: Mapped[List["ServiceTicketLine"]] = db.relationship(
+        viewonly=True,
+        order_by="ServiceTicketLine.inventory_id"
+    )
+
+class ServiceTicketLine(Base):
+    __table__ = service_ticket_inventory
+
+# Reporting aggregates, maintained by app.utils.reporting
+class ReportDailyRevenue(Base):
+    __tablename__ = "report_daily_revenue"
+
+    day: Mapped[date] = mapped_column(db.Date, primary_key=True)
+    tickets: Mapped[int] = mapped_column(nullable=False, default=0)
+    units: Mapped[int] = mapped_column(nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+
+class ReportPartUsage(Base):
+    __tablename__ = "report_part_usage"
+
+    # No foreign key: usage outlives deleted parts
+    inventory_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    units: Mapped[int] = mapped_column(nullable=False, default=0)
+    tickets: Mapped[int] = mapped_column(nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+
+# Low-stock change feed, appended by app.utils.stock
+class InventoryEvent(Base):
+    __tablename__ = "inventory_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    inventory_id: Mapped[int] = mapped_column(nullable=False)
+    kind: Mapped[str] = mapped_column(db.String(20), nullable=False)
+    quantity: Mapped[int] = mapped_column(nullable=False)
+    reorder_threshold: Mapped[int] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=False)
@@ -0,0 +1,135 @@
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from concurrent.futures import Future
+from contextvars import copy_context
+from functools import wraps
+from flask import current_app
+
+
+# Async drivers for the sync URL's backend when no explicit
+# SQLALCHEMY_ASYNC_DATABASE_URI is configured
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+class AsyncDatabase:
+    """Async SQLAlchemy engine for the async views, plus the event loop
+    they run on.
+
+    By default Flask runs each async view in a new event loop, and async
+    connections cannot outlive the loop that opened them. init_app instead
+    routes async views to one long-lived loop per process, so the engine
+    can keep a normal connection pool and concurrent requests share it.
+    Request threads block on their view's result while the loop
+    interleaves the database waits.
+
+    The engine is created on first use from SQLALCHEMY_ASYNC_DATABASE_URI,
+    or from the sync engine's URL with the driver swapped, so relative
+    SQLite paths resolve the same way for both. Its pooled connections
+    belong to the loop, so they are closed there: by dispose(app), and for
+    any engine still open, at interpreter exit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop = None
+        self._pid = None
+        self._engines = weakref.WeakSet()
+        atexit.register(self._dispose_all)
+
+    def init_app(self, app):
+        app.extensions["async_db_engine"] = None
+        app.async_to_sync = self.async_to_sync
+
+    def _event_loop(self):
+        # Started lazily, and again after a fork, since threads do not survive one
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="async-db-loop", daemon=True).start()
+                self._loop = loop
+                self._pid = os.getpid()
+            return self._loop
+
+    def async_to_sync(self, func):
+        @wraps(func)
+        def run(*args, **kwargs):
+            loop = self._event_loop()
+            # Run in a copy of the caller's context so the request context is visible
+            context = copy_context()
+            result = Future()
+
+            def start():
+                task = loop.create_task(func(*args, **kwargs), context=context)
+                task.add_done_callback(lambda done: _copy_result(done, result))
+
+            loop.call_soon_threadsafe(start)
+            return result.result()
+
+        return run
+
+    def _url(self):
+        from app.extensions import db
+
+        configured = current_app.config.get("SQLALCHEMY_ASYNC_DATABASE_URI")
+        if configured:
+            return configured
+
+        url = db.engine.url
+        backend = url.get_backend_name()
+        if backend not in ASYNC_DRIVERS:
+            raise RuntimeError(f"No async driver known for '{backend}', set SQLALCHEMY_ASYNC_DATABASE_URI.")
+        return url.set(drivername=ASYNC_DRIVERS[backend])
+
+    @property
+    def engine(self):
+        # Imported lazily so the sync app does not need the async extras
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        with self._lock:
+            engine = current_app.extensions.get("async_db_engine")
+            if engine is None:
+                options = current_app.config.get("SQLALCHEMY_ASYNC_ENGINE_OPTIONS", {})
+                engine = create_async_engine(self._url(), **options)
+                current_app.extensions["async_db_engine"] = engine
+                self._engines.add(engine)
+            return engine
+
+    def _dispose_on_loop(self, engine):
+        # Only the loop that opened the connections can close them
+        if self._loop is None or self._pid != os.getpid() or not self._loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(engine.dispose(), self._loop).result()
+
+    def dispose(self, app):
+        """Close app's async engine and its pooled connections."""
+        with self._lock:
+            engine = app.extensions.get("async_db_engine")
+            app.extensions["async_db_engine"] = None
+        if engine is not None:
+            self._engines.discard(engine)
+            self._dispose_on_loop(engine)
+
+    def _dispose_all(self):
+        for engine in list(self._engines):
+            self._dispose_on_loop(engine)
+        self._engines = weakref.WeakSet()
+
+    def session(self):
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        return AsyncSession(self.engine, expire_on_commit=False)
+
+
+def _copy_result(task, future):
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
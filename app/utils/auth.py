@@ -1,47 +1,186 @@
 from datetime import datetime, timedelta
+from collections import OrderedDict
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
 from flask import current_app, request, jsonify
 from functools import wraps
+import hashlib
+import inspect
+import threading
+import time
 import os
+import jwt as pyjwt
 
 SECRET_KEY = os.environ.get('SECRET_KEY') or "super secret secrets"
 
+JWT_CACHE_SIZE = 1024
+
+
+class TokenError(Exception):
+    pass
+
+
+class TokenExpired(TokenError):
+    pass
+
+
+def _jose_decode(token, secret):
+    try:
+        return jwt.decode(token, secret, algorithms=["HS256"])
+    except ExpiredSignatureError:
+        raise TokenExpired()
+    except JWTError:
+        raise TokenError()
+
+
+def _pyjwt_decode(token, secret):
+    try:
+        return pyjwt.decode(token, secret, algorithms=["HS256"])
+    except pyjwt.ExpiredSignatureError:
+        raise TokenExpired()
+    except pyjwt.InvalidTokenError:
+        raise TokenError()
+
+
+# Selected with JWT_BACKEND; both produce and accept the same HS256 tokens
+BACKENDS = {
+    "jose": (jwt.encode, _jose_decode),
+    "pyjwt": (pyjwt.encode, _pyjwt_decode),
+}
+
+
+def _backend():
+    name = current_app.config.get("JWT_BACKEND", "jose")
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise RuntimeError(f"Unknown JWT_BACKEND '{name}'.")
+
+
+class TokenCache:
+    """Bounded LRU of already verified tokens.
+
+    Keys are a SHA-256 digest of the signing secret and the token, so raw
+    tokens are never held and a rotated secret misses the cache. Entries
+    are dropped once the token's exp has passed.
+    """
+
+    def __init__(self, maxsize=JWT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token, secret):
+        return hashlib.sha256(f"{secret}\0{token}".encode()).digest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            payload, expires = entry
+            if expires is not None and expires <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key, payload):
+        expires = payload.get("exp")
+
+        with self._lock:
+            self._entries[key] = (payload, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+token_cache = TokenCache()
+
+
 def encode_token(customer_id):
     payload = {
         "customer_id": customer_id,
         "exp": datetime.utcnow() + timedelta(hours=1)
     }
 
-    return jwt.encode(
+    encode, _ = _backend()
+    return encode(
         payload,
         current_app.config["SECRET_KEY"],
         algorithm="HS256"
     )
 
+
+def decode_token(token):
+    secret = current_app.config["SECRET_KEY"]
+    cache_size = current_app.config.get("JWT_CACHE_SIZE", JWT_CACHE_SIZE)
+
+    if not cache_size:
+        _, decode = _backend()
+        return decode(token, secret)
+
+    key = TokenCache.key(token, secret)
+    payload = token_cache.get(key)
+    if payload is None:
+        _, decode = _backend()
+        payload = decode(token, secret)
+        token_cache.maxsize = cache_size
+        token_cache.set(key, payload)
+
+    return payload
+
+
+# Returns (customer_id, None) or (None, error response)
+def _authenticate():
+    auth_header = request.headers.get("Authorization", None)
+
+    if not auth_header:
+        return None, (jsonify({"error": "Authorization header missing"}), 401)
+
+    try:
+        token = auth_header.split(" ")[1]
+    except IndexError:
+        return None, (jsonify({"error": "Invalid token format"}), 401)
+
+    try:
+        data = decode_token(token)
+    except TokenExpired:
+        return None, (jsonify({"error": "Token expired"}), 401)
+    except TokenError:
+        return None, (jsonify({"error": "Invalid token"}), 401)
+
+    return data["customer_id"], None
+
+
 def token_required(f):
+    # Async views need an async wrapper so Flask still awaits them
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def decorated_async(*args, **kwargs):
+            customer_id, error = _authenticate()
+            if error:
+                return error
+            return await f(customer_id, *args, **kwargs)
+
+        return decorated_async
+
     @wraps(f)
     def decorated(*args, **kwargs):
-        auth_header = request.headers.get("Authorization", None)
-
-        if not auth_header:
-            return jsonify({"error": "Authorization header missing"}), 401
-
-        try:
-            token = auth_header.split(" ")[1]
-        except IndexError:
-            return jsonify({"error": "Invalid token format"}), 401
-
-        try:
-            data = jwt.decode(
-                token,
-                current_app.config["SECRET_KEY"],
-                algorithms=["HS256"]
-            )
-        except jwt.ExpiredSignatureError:
-            return jsonify({"error": "Token expired"}), 401
-        except jwt.JWTError:
-            return jsonify({"error": "Invalid token"}), 401
-
-        return f(data["customer_id"], *args, **kwargs)
-
-    return decorated
\ No newline at end of file
+        customer_id, error = _authenticate()
+        if error:
+            return error
+        return f(customer_id, *args, **kwargs)
+
+    return decorated
+
@@ -0,0 +1,110 @@
+import csv
+import io
+from flask import request, current_app
+from marshmallow import ValidationError
+from sqlalchemy import select, insert
+from app.extensions import db
+
+BULK_MAX_ROWS = 10000
+UNIQUE_CHUNK_SIZE = 500
+
+
+class BulkPayloadError(ValueError):
+    pass
+
+
+def _csv_rows(text):
+    # Empty cells are treated as missing so optional columns can be blank
+    reader = csv.DictReader(io.StringIO(text))
+    return [
+        {key: value for key, value in row.items() if key and value not in ("", None)}
+        for row in reader
+    ]
+
+
+def parse_rows():
+    """Read the rows to import from the request.
+
+    Accepts a JSON array body, a text/csv body, or a multipart upload with
+    the CSV in a "file" field.
+    """
+    upload = request.files.get("file")
+
+    if upload is not None:
+        rows = _csv_rows(upload.read().decode("utf-8-sig"))
+    elif request.mimetype == "text/csv":
+        rows = _csv_rows(request.get_data(as_text=True))
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            raise BulkPayloadError("Expected a JSON array or CSV upload.")
+
+    if not rows:
+        raise BulkPayloadError("No rows to import.")
+
+    max_rows = current_app.config.get("BULK_MAX_ROWS", BULK_MAX_ROWS)
+    if len(rows) > max_rows:
+        raise BulkPayloadError(f"Too many rows, the limit is {max_rows}.")
+
+    return rows
+
+
+def _existing_values(column, values):
+    existing = set()
+    values = list(values)
+
+    for start in range(0, len(values), UNIQUE_CHUNK_SIZE):
+        chunk = values[start:start + UNIQUE_CHUNK_SIZE]
+        existing.update(db.session.execute(select(column).where(column.in_(chunk))).scalars())
+
+    return existing
+
+
+def bulk_import(model, schema, rows, unique_field=None, prepare=None):
+    """Validate rows with schema and insert the valid ones in one statement.
+
+    unique_field is checked against the table with set-based IN queries
+    and against earlier rows in the same batch. prepare, if given, is
+    called with the list of valid rows before they are inserted.
+
+    Returns (created_count, errors) where errors maps row index to messages.
+    """
+    errors = {}
+
+    try:
+        loaded = schema.load(rows, many=True)
+    except ValidationError as e:
+        errors.update(e.messages)
+        loaded = e.valid_data
+
+    valid = {i: row for i, row in enumerate(loaded) if i not in errors}
+
+    if unique_field:
+        column = getattr(model, unique_field)
+        existing = _existing_values(column, {row[unique_field] for row in valid.values() if row.get(unique_field)})
+        seen = set()
+
+        for i, row in list(valid.items()):
+            value = row.get(unique_field)
+
+            if not value:
+                errors[i] = {unique_field: ["Missing data for required field."]}
+            elif value in existing:
+                errors[i] = {unique_field: ["Already associated with an account."]}
+            elif value in seen:
+                errors[i] = {unique_field: ["Duplicate value in this import."]}
+            else:
+                seen.add(value)
+                continue
+
+            del valid[i]
+
+    new_rows = list(valid.values())
+
+    if new_rows:
+        if prepare:
+            prepare(new_rows)
+        db.session.execute(insert(model), new_rows)
+        db.session.commit()
+
+    return len(new_rows), {str(i): messages for i, messages in sorted(errors.items())}
@@ -0,0 +1,185 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from uuid import uuid4
+from flask import request, current_app, make_response, Response
+from app.extensions import cache
+from app.utils.metrics import record_cache
+
+# Every list payload nests tickets, and tickets nest customers, mechanics
+# and parts, so most reads depend on all four resources.
+ALL_RESOURCES = ("customers", "mechanics", "inventory", "service_tickets")
+
+
+def _version_key(tag):
+    return f"cache-version:{tag}"
+
+
+def _now():
+    return time.time()
+
+
+# Tokens are "<unix time>-<random>", so they double as Last-Modified
+def _new_version():
+    return f"{_now():.6f}-{uuid4().hex}"
+
+
+def _version_time(version):
+    try:
+        return float(version.split("-", 1)[0])
+    except (AttributeError, ValueError):
+        return 0.0
+
+
+def _versions(tags):
+    """Return the current token of every tag, or None when the backend
+    cannot hold them (NullCache, or a token evicted as soon as written)."""
+    keys = [_version_key(tag) for tag in tags]
+    versions = cache.get_many(*keys)
+
+    for i, version in enumerate(versions):
+        if version is None:
+            # Unknown or evicted version: start a new one. add() keeps
+            # whichever token another worker may have just written.
+            cache.add(keys[i], _new_version(), timeout=0)
+            versions[i] = cache.get(keys[i])
+            if versions[i] is None:
+                return None
+
+    return versions
+
+
+def invalidate(*tags):
+    """Drop every cached view that depends on any of the given resources.
+
+    Bumps each tag's version token, so keys built from the old version are
+    never looked up again and simply age out of the backend.
+    """
+    cache.set_many({_version_key(tag): _new_version() for tag in tags}, timeout=0)
+
+
+def _validators(tags, extra=()):
+    """Return (etag, last_modified) for the current request.
+
+    The ETag digests the endpoint, path, query string, extra and the
+    version of every tag, so it changes whenever any resource the payload
+    is built from is written. Both are None when the versions cannot be
+    read back, since a validator that never changes would turn every
+    conditional request into a 304.
+
+    Last-Modified is the second of the newest write, but only once that
+    second is over: HTTP dates have no fractions, so a value sent earlier
+    would still match after a second write in the same second.
+    """
+    versions = _versions(tags)
+    if versions is None:
+        return None, None
+
+    args = sorted(request.args.items(multi=True))
+    raw = f"{request.endpoint}|{request.path}|{args}|{extra}|{versions}"
+
+    newest = int(max((_version_time(version) for version in versions), default=0))
+    last_modified = None
+    if newest and newest < int(_now()):
+        last_modified = datetime.fromtimestamp(newest, timezone.utc)
+
+    return hashlib.sha1(raw.encode()).hexdigest(), last_modified
+
+
+def _not_modified(etag, last_modified):
+    # If-None-Match wins over If-Modified-Since when both are sent. Weak
+    # comparison, since compressed responses carry a W/ prefixed ETag
+    if etag is None:
+        return False
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified and request.if_modified_since:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _set_validators(response, etag, last_modified):
+    if etag is None:
+        return
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+
+
+def _not_modified_response(etag, last_modified):
+    response = Response(status=304)
+    _set_validators(response, etag, last_modified)
+    return response
+
+
+def conditional(*tags):
+    """Answer If-None-Match / If-Modified-Since with 304 before the view
+    runs, for GET views that are not cached (e.g. per-customer lists).
+
+    Validators come from the same version tokens as cached_view, plus the
+    view's arguments, so no query or serialization happens on a 304.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            etag, last_modified = _validators(tags, extra=(args, sorted(kwargs.items())))
+            if _not_modified(etag, last_modified):
+                return _not_modified_response(etag, last_modified)
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                _set_validators(response, etag, last_modified)
+            return response
+
+        return decorated
+
+    return decorator
+
+
+def cached_view(*tags, timeout=None):
+    """Cache a GET view's 200 responses, keyed on path and query string.
+
+    tags name the resources the payload is built from; mutating routes call
+    invalidate() with the resource they change. timeout defaults to the
+    CACHE_VIEW_TIMEOUT config value, then the cache's default timeout.
+    Responses carry ETag / Last-Modified, and matching conditional requests
+    get a 304 without touching the cached body.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            etag, last_modified = _validators(tags)
+            if etag is None:
+                return f(*args, **kwargs)
+            if _not_modified(etag, last_modified):
+                return _not_modified_response(etag, last_modified)
+
+            key = "view:" + etag
+
+            hit = cache.get(key)
+            record_cache(hit is not None)
+            if hit is not None:
+                body, status, headers = hit
+                response = Response(body, status=status, headers=headers)
+                # Stored within the write's second, before it had one
+                if last_modified and response.last_modified is None:
+                    response.last_modified = last_modified
+                return response
+
+            response = make_response(f(*args, **kwargs))
+
+            if response.status_code == 200 and not response.is_streamed:
+                _set_validators(response, etag, last_modified)
+                ttl = timeout or current_app.config.get("CACHE_VIEW_TIMEOUT")
+                cache.set(
+                    key,
+                    (response.get_data(), response.status_code, list(response.headers.items())),
+                    timeout=ttl,
+                )
+
+            return response
+
+        return decorated
+
+    return decorator
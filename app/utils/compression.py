@@ -0,0 +1,119 @@
+import gzip
+import zlib
+from flask import request, current_app
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only without the Brotli package
+    brotli = None
+
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 4
+COMPRESS_MIMETYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/plain",
+    "text/html",
+    "text/css",
+    "text/yaml",
+    "application/javascript",
+)
+
+
+def _gzip_stream(chunks, level):
+    # wbits=31 writes a gzip header; sync flushes keep rows flowing to the client
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _brotli_stream(chunks, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class Compression:
+    """Negotiated br / gzip compression of responses.
+
+    Bodies of a compressible mimetype and at least COMPRESS_MIN_SIZE bytes
+    are compressed with the best encoding the client accepts (br needs the
+    Brotli package). Streamed responses such as the NDJSON export are
+    compressed chunk by chunk. Compressed responses get a weak ETag, since
+    the bytes differ from the identity representation.
+    """
+
+    def init_app(self, app):
+        if not app.config.get("COMPRESS_ENABLED", True):
+            return
+
+        app.after_request(self._compress)
+
+    @staticmethod
+    def _encoding():
+        accepted = request.accept_encodings
+        candidates = (["br"] if brotli is not None else []) + ["gzip"]
+        # Highest q wins; ties go to the order above
+        best = max(candidates, key=lambda encoding: (accepted[encoding], -candidates.index(encoding)))
+        return best if accepted[best] > 0 else None
+
+    def _compress(self, response):
+        config = current_app.config
+
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough and not response.is_streamed
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in config.get("COMPRESS_MIMETYPES", COMPRESS_MIMETYPES)
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+
+        min_size = config.get("COMPRESS_MIN_SIZE", COMPRESS_MIN_SIZE)
+        if response.content_length is not None and response.content_length < min_size:
+            return response
+
+        encoding = self._encoding()
+        if encoding is None:
+            return response
+
+        level = config.get("COMPRESS_LEVEL", COMPRESS_LEVEL)
+        quality = config.get("COMPRESS_BROTLI_QUALITY", COMPRESS_BROTLI_QUALITY)
+
+        if response.is_streamed:
+            chunks = response.response
+            if encoding == "br":
+                response.response = _brotli_stream(chunks, quality)
+            else:
+                response.response = _gzip_stream(chunks, level)
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+
+            if encoding == "br":
+                response.set_data(brotli.compress(body, quality=quality))
+            else:
+                response.set_data(gzip.compress(body, compresslevel=level, mtime=0))
+
+        response.headers["Content-Encoding"] = encoding
+
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
@@ -0,0 +1,82 @@
+from collections import Counter
+from flask import g, request, current_app, has_app_context
+from app.utils.query_hooks import on_query
+
+
+class NPlusOneDetected(AssertionError):
+    """Raised at the end of a request that repeated a statement too often,
+    when N_PLUS_ONE_RAISE is set (as in the test config)."""
+
+
+class QueryLog:
+    __slots__ = ("statements",)
+
+    def __init__(self):
+        self.statements = Counter()
+
+
+def _current_log():
+    if has_app_context():
+        return g.get("_query_log")
+    return None
+
+
+def _record_query(statement, parameters, seconds):
+    log = _current_log()
+    if log is None:
+        return
+
+    # Parameterized text is identical for every lazy load of one relationship
+    log.statements[statement] += 1
+
+    threshold = current_app.config.get("SLOW_QUERY_MS")
+    elapsed = seconds * 1000
+    if threshold is not None and elapsed >= threshold:
+        current_app.logger.warning(
+            "Slow query (%.1f ms) in %s: %s params=%r",
+            elapsed, request.endpoint, statement, parameters,
+        )
+
+
+class Diagnostics:
+    """Opt-in SQL diagnostics.
+
+    SLOW_QUERY_MS logs every statement at or above that duration with its
+    endpoint and bind params. N_PLUS_ONE_THRESHOLD flags requests that run
+    the same parameterized statement more than that many times, the
+    signature of a lazy relationship loaded once per row; the request is
+    logged, or fails with NPlusOneDetected when N_PLUS_ONE_RAISE is set.
+    Nothing is installed unless one of the two thresholds is configured.
+    """
+
+    def init_app(self, app):
+        if app.config.get("SLOW_QUERY_MS") is None and app.config.get("N_PLUS_ONE_THRESHOLD") is None:
+            return
+
+        on_query(_record_query)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    @staticmethod
+    def _start():
+        g._query_log = QueryLog()
+
+    @staticmethod
+    def _finish(response):
+        log = g.pop("_query_log", None)
+        threshold = current_app.config.get("N_PLUS_ONE_THRESHOLD")
+        if log is None or threshold is None:
+            return response
+
+        repeated = [(count, statement) for statement, count in log.statements.items() if count > threshold]
+        if not repeated:
+            return response
+
+        report = "; ".join(f"{count}x {statement}" for count, statement in sorted(repeated, reverse=True))
+        message = f"Possible N+1 in {request.endpoint}: {report}"
+
+        if current_app.config.get("N_PLUS_ONE_RAISE"):
+            raise NPlusOneDetected(message)
+
+        current_app.logger.warning(message)
+        return response
@@ -0,0 +1,47 @@
+import json
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+class CompactJSONProvider(DefaultJSONProvider):
+    """Always-compact JSON, encoded with orjson when it is installed.
+
+    Keys stay sorted as with Flask's default provider, so payloads only
+    lose whitespace. Responses are built from bytes directly instead of
+    going through an intermediate str. Set JSON_COMPACT = False to keep
+    the indented output in debug mode.
+    """
+
+    def _options(self):
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            kwargs.setdefault("separators", (",", ":"))
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if not self._app.config.get("JSON_COMPACT", True):
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+
+        if orjson is None:
+            body = self.dumps(obj)
+        else:
+            body = orjson.dumps(obj, default=self.default, option=self._options())
+
+        return self._app.response_class(body, mimetype=self.mimetype)
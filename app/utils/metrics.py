@@ -0,0 +1,183 @@
+import bisect
+import threading
+import time
+from flask import g, request, current_app, has_app_context, Response
+from app.utils.query_hooks import on_query
+
+# Seconds; le="+Inf" is implied by _count
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """Per-process counters behind /metrics. Each worker keeps its own, so
+    scrape every worker or aggregate by instance."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.latency = {}
+        self.db_queries = {}
+        self.db_seconds = {}
+        self.cache = {"hit": 0, "miss": 0}
+
+    def observe_request(self, endpoint, method, status, seconds, queries, db_seconds):
+        labels = (endpoint, method, str(status))
+
+        with self.lock:
+            histogram = self.latency.get(labels)
+            if histogram is None:
+                histogram = self.latency[labels] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+            key = (endpoint, method)
+            self.db_queries[key] = self.db_queries.get(key, 0) + queries
+            self.db_seconds[key] = self.db_seconds.get(key, 0.0) + db_seconds
+
+    def observe_cache(self, hit):
+        with self.lock:
+            self.cache["hit" if hit else "miss"] += 1
+
+    def render(self):
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by endpoint.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+
+        with self.lock:
+            for (endpoint, method, status), histogram in sorted(self.latency.items()):
+                labels = f'endpoint="{endpoint}",method="{method}",status="{status}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines += [
+                "# HELP http_request_db_queries_total SQL statements executed while serving requests.",
+                "# TYPE http_request_db_queries_total counter",
+            ]
+            for (endpoint, method), count in sorted(self.db_queries.items()):
+                lines.append(f'http_request_db_queries_total{{endpoint="{endpoint}",method="{method}"}} {count}')
+
+            lines += [
+                "# HELP http_request_db_seconds_total Time spent in SQL statements while serving requests.",
+                "# TYPE http_request_db_seconds_total counter",
+            ]
+            for (endpoint, method), seconds in sorted(self.db_seconds.items()):
+                lines.append(f'http_request_db_seconds_total{{endpoint="{endpoint}",method="{method}"}} {seconds:.6f}')
+
+            lines += [
+                "# HELP cache_requests_total Cached view lookups by result.",
+                "# TYPE cache_requests_total counter",
+            ]
+            for result, count in sorted(self.cache.items()):
+                lines.append(f'cache_requests_total{{result="{result}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+class RequestStats:
+    __slots__ = ("start", "queries", "db_seconds", "cache")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache = None
+
+
+def _current_stats():
+    if has_app_context():
+        return g.get("_request_stats")
+    return None
+
+
+def _record_query(statement, parameters, seconds):
+    stats = _current_stats()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += seconds
+
+
+def record_cache(hit):
+    """Count a cached view lookup; a no-op when metrics are disabled."""
+    stats = _current_stats()
+    if stats is None:
+        return
+
+    stats.cache = "hit" if hit else "miss"
+    current_app.extensions["metrics"].observe_cache(hit)
+
+
+class Metrics:
+    """Request latency, SQL and cache instrumentation.
+
+    With METRICS_ENABLED (the default) every request is timed, its SQL
+    statements counted via engine events, and the totals exposed as
+    Prometheus text on /metrics and per response in a Server-Timing
+    header. When disabled no hooks or listeners are installed.
+    """
+
+    def init_app(self, app):
+        if not app.config.get("METRICS_ENABLED", True):
+            return
+
+        registry = Registry(app.config.get("METRICS_LATENCY_BUCKETS", LATENCY_BUCKETS))
+        app.extensions["metrics"] = registry
+        on_query(_record_query)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.add_url_rule("/metrics", "metrics", self._expose, methods=["GET"])
+
+    @staticmethod
+    def _start():
+        g._request_stats = RequestStats()
+
+    @staticmethod
+    def _finish(response):
+        stats = g.pop("_request_stats", None)
+        if stats is None:
+            return response
+
+        elapsed = time.perf_counter() - stats.start
+        current_app.extensions["metrics"].observe_request(
+            request.endpoint or "unmatched",
+            request.method,
+            response.status_code,
+            elapsed,
+            stats.queries,
+            stats.db_seconds,
+        )
+
+        timings = [
+            f"app;dur={elapsed * 1000:.1f}",
+            f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"',
+        ]
+        if stats.cache:
+            timings.append(f'cache;desc="{stats.cache}"')
+        response.headers["Server-Timing"] = ", ".join(timings)
+
+        return response
+
+    @staticmethod
+    def _expose():
+        body = current_app.extensions["metrics"].render()
+        return Response(body, mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,296 @@
+import asyncio
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from urllib.parse import urlencode
+from flask import request, current_app
+from sqlalchemy import select, func, and_, or_, false
+from app.extensions import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def _column(attribute):
+    return attribute.property.columns[0]
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(attribute, value):
+    if value is None:
+        if not _column(attribute).nullable:
+            raise PaginationError("Invalid cursor.")
+        return None
+
+    python_type = _column(attribute).type.python_type
+
+    if python_type in (date, datetime):
+        if not isinstance(value, str):
+            raise PaginationError("Invalid cursor.")
+        return python_type.fromisoformat(value)
+
+    if python_type is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+
+    if type(value) is not python_type:
+        raise PaginationError("Invalid cursor.")
+
+    return value
+
+
+def encode_cursor(values):
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_values(cursor, length):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise PaginationError("Invalid cursor.")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise PaginationError("Invalid cursor.")
+
+    return values
+
+
+def decode_cursor(cursor, keys):
+    values = _cursor_values(cursor, len(keys))
+
+    try:
+        return [_decode_value(attribute, value) for (attribute, _), value in zip(keys, values)]
+    except ValueError:
+        raise PaginationError("Invalid cursor.")
+
+
+def _decode_ranked(cursor):
+    rank, last_id = _cursor_values(cursor, 2)
+
+    if type(last_id) is not int or type(rank) not in (int, float):
+        raise PaginationError("Invalid cursor.")
+
+    return rank, last_id
+
+
+def _order_by(keys):
+    clauses = []
+    for attribute, descending in keys:
+        clause = attribute.desc() if descending else attribute.asc()
+        # Pin NULL placement so the keyset comparison below agrees with it
+        if _column(attribute).nullable:
+            clause = clause.nulls_last() if descending else clause.nulls_first()
+        clauses.append(clause)
+    return clauses
+
+
+def _beyond(attribute, descending, value):
+    if descending:
+        if value is None:
+            return false()
+        if _column(attribute).nullable:
+            return or_(attribute < value, attribute.is_(None))
+        return attribute < value
+
+    if value is None:
+        return attribute.is_not(None)
+    return attribute > value
+
+
+def _after(keys, values):
+    # Row comparison (k1, k2, ...) > (v1, v2, ...) spelled out so it works
+    # with mixed sort directions and NULLs
+    clauses = []
+    for i, (attribute, descending) in enumerate(keys):
+        equal = [
+            previous.is_(None) if value is None else previous == value
+            for (previous, _), value in zip(keys[:i], values[:i])
+        ]
+        clauses.append(and_(*equal, _beyond(attribute, descending, values[i])))
+    return or_(*clauses)
+
+
+def _page_size(name):
+    default = current_app.config.get("DEFAULT_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+    maximum = current_app.config.get("MAX_PAGE_SIZE", MAX_PAGE_SIZE)
+
+    value = request.args.get(name)
+    if value is None:
+        return default
+
+    try:
+        size = int(value)
+    except ValueError:
+        raise PaginationError(f"{name} must be an integer.")
+
+    if size < 1:
+        raise PaginationError(f"{name} must be a positive integer.")
+
+    return min(size, maximum)
+
+
+def _wants_count():
+    return request.args.get("count", "").lower() in ("1", "true", "yes")
+
+
+def _count_query(query):
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def _count(query):
+    return db.session.execute(_count_query(query)).scalar_one()
+
+
+def _next_link(cursor, limit):
+    args = request.args.to_dict()
+    args.pop("page", None)
+    args.pop("per_page", None)
+    args["after"] = cursor
+    args["limit"] = limit
+
+    return f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+
+
+def _keys(model, sort):
+    keys = list(sort or [])
+    if not keys or keys[-1][0] is not model.id:
+        keys.append((model.id, False))
+    return keys
+
+
+def _keyset_query(query, keys, limit):
+    after = request.args.get("after")
+    if after:
+        query = query.where(_after(keys, decode_cursor(after, keys)))
+
+    return query.order_by(*_order_by(keys)).limit(limit + 1)
+
+
+def _keyset_page(rows, keys, limit, headers):
+    items = rows[:limit]
+    if len(rows) > limit:
+        last = items[-1]
+        cursor = encode_cursor([getattr(last, attribute.key) for attribute, _ in keys])
+        headers["X-Next-Cursor"] = cursor
+        headers["Link"] = _next_link(cursor, limit)
+
+    return items, headers
+
+
+def paginate(query, model, sort=None):
+    """Paginate a select() over model using the request's query string.
+
+    Keyset pagination is the default: ?after=<cursor>&limit=<n> returns the
+    rows following the cursor, so deep pages cost the same as the first.
+    sort is a list of (attribute, descending) pairs; rows are ordered by it
+    with id as the final tiebreaker, and the cursor carries the last row's
+    value for each key. The legacy ?page=&per_page= offset form is still
+    accepted. The total row count is only computed when ?count=true is passed.
+
+    Returns (items, headers). Raises PaginationError on malformed params.
+    """
+    keys = _keys(model, sort)
+    headers = {}
+
+    if "page" in request.args:
+        try:
+            page = int(request.args["page"])
+        except ValueError:
+            raise PaginationError("page must be an integer.")
+        if page < 1:
+            raise PaginationError("page must be a positive integer.")
+
+        per_page = _page_size("per_page")
+        pagination = db.paginate(
+            query.order_by(*_order_by(keys)),
+            page=page,
+            per_page=per_page,
+            error_out=False,
+            count=_wants_count(),
+        )
+
+        if pagination.total is not None:
+            headers["X-Total-Count"] = str(pagination.total)
+
+        return pagination.items, headers
+
+    limit = _page_size("limit")
+
+    if _wants_count():
+        headers["X-Total-Count"] = str(_count(query))
+
+    rows = db.session.execute(_keyset_query(query, keys, limit)).scalars().all()
+
+    return _keyset_page(rows, keys, limit, headers)
+
+
+def paginate_ranked(query, model, rank):
+    """Keyset-paginate search results, best match first.
+
+    Rows are ordered by rank (lower is better) with id as the tiebreaker;
+    the ?after= cursor carries the last row's (rank, id), as in paginate().
+    Returns (items, headers). Raises PaginationError on malformed params.
+    """
+    limit = _page_size("limit")
+    headers = {}
+
+    if _wants_count():
+        headers["X-Total-Count"] = str(_count(query))
+
+    after = request.args.get("after")
+    if after:
+        last_rank, last_id = _decode_ranked(after)
+        query = query.where(or_(rank > last_rank, and_(rank == last_rank, model.id > last_id)))
+
+    rows = db.session.execute(query.add_columns(rank).order_by(rank, model.id).limit(limit + 1)).all()
+
+    items = [row[0] for row in rows[:limit]]
+    if len(rows) > limit:
+        last_item, last_rank = rows[limit - 1]
+        cursor = encode_cursor([last_rank, last_item.id])
+        headers["X-Next-Cursor"] = cursor
+        headers["Link"] = _next_link(cursor, limit)
+
+    return items, headers
+
+
+async def paginate_async(session_factory, query, model, sort=None):
+    """Keyset-only counterpart of paginate() for the async views.
+
+    session_factory opens an AsyncSession. When ?count=true is passed the
+    count runs on a second session concurrently with the page query.
+    """
+    if "page" in request.args:
+        raise PaginationError("page/per_page is not supported here, use after/limit.")
+
+    keys = _keys(model, sort)
+    limit = _page_size("limit")
+    statement = _keyset_query(query, keys, limit)
+    headers = {}
+
+    async def fetch_page():
+        async with session_factory() as session:
+            return (await session.execute(statement)).scalars().all()
+
+    async def fetch_count():
+        async with session_factory() as session:
+            return (await session.execute(_count_query(query))).scalar_one()
+
+    if _wants_count():
+        rows, total = await asyncio.gather(fetch_page(), fetch_count())
+        headers["X-Total-Count"] = str(total)
+    else:
+        rows = await fetch_page()
+
+    return _keyset_page(rows, keys, limit, headers)
@@ -0,0 +1,144 @@
+import hmac
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Full werkzeug method strings, since needs_rehash compares them to the
+# prefix stored in each hash
+PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+PASSWORD_HASH_WORKERS = 4
+PASSWORD_HASH_QUEUE = 32
+PASSWORD_HASH_WAIT = 1.0
+PASSWORD_HASH_BULK_WORKERS = 1
+
+_HASH_PREFIXES = ("scrypt:", "pbkdf2:")
+
+
+class HashingBusy(RuntimeError):
+    pass
+
+
+class PasswordHasher:
+    """Runs the KDF on a small thread pool with a bounded queue.
+
+    hashlib's scrypt and pbkdf2 release the GIL, so hashes run in parallel
+    with each other and with other request threads. At most
+    PASSWORD_HASH_QUEUE hashes may be queued or running; callers that
+    cannot get a slot within PASSWORD_HASH_WAIT seconds get HashingBusy
+    instead of piling up behind a login burst.
+
+    Bulk imports hash on a separate executor of PASSWORD_HASH_BULK_WORKERS
+    threads, so a large import waits behind itself and never queues ahead
+    of login hashes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._bulk_executor = None
+        self._slots = None
+        self._settings = None
+
+    def _pool(self):
+        settings = (
+            current_app.config.get("PASSWORD_HASH_WORKERS", PASSWORD_HASH_WORKERS),
+            current_app.config.get("PASSWORD_HASH_QUEUE", PASSWORD_HASH_QUEUE),
+            current_app.config.get("PASSWORD_HASH_BULK_WORKERS", PASSWORD_HASH_BULK_WORKERS),
+        )
+
+        with self._lock:
+            if settings != self._settings:
+                for executor in (self._executor, self._bulk_executor):
+                    if executor is not None:
+                        executor.shutdown(wait=False)
+                workers, queue, bulk_workers = settings
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+                self._bulk_executor = ThreadPoolExecutor(
+                    max_workers=bulk_workers, thread_name_prefix="password-hash-bulk"
+                )
+                self._slots = threading.BoundedSemaphore(queue)
+                self._settings = settings
+            return self._executor, self._slots, self._bulk_executor
+
+    def run(self, fn, *args):
+        executor, slots, _ = self._pool()
+        wait = current_app.config.get("PASSWORD_HASH_WAIT", PASSWORD_HASH_WAIT)
+
+        if not slots.acquire(timeout=wait):
+            raise HashingBusy("Too many password checks in progress, try again shortly.")
+        try:
+            return executor.submit(fn, *args).result()
+        finally:
+            slots.release()
+
+    def map(self, fn, items):
+        _, _, bulk_executor = self._pool()
+        return list(bulk_executor.map(fn, items))
+
+
+hasher = PasswordHasher()
+
+
+def _method():
+    return current_app.config.get("PASSWORD_HASH_METHOD", PASSWORD_HASH_METHOD)
+
+
+def is_hashed(stored):
+    return stored.startswith(_HASH_PREFIXES) and stored.count("$") == 2
+
+
+def needs_rehash(stored):
+    return not is_hashed(stored) or stored.split("$", 1)[0] != _method()
+
+
+def _check(stored, password):
+    if is_hashed(stored):
+        return check_password_hash(stored, password)
+    # Rows written before hashing was introduced still hold plaintext
+    return hmac.compare_digest(stored.encode(), password.encode())
+
+
+def hash_password(password):
+    method = _method()
+    return hasher.run(generate_password_hash, password, method)
+
+
+def hash_passwords(rows, field="password"):
+    """Hash field in place for every row; used by the bulk imports."""
+    method = _method()
+    hashes = hasher.map(lambda row: generate_password_hash(row[field], method), rows)
+    for row, hashed in zip(rows, hashes):
+        row[field] = hashed
+
+
+def verify_password(stored, password):
+    """Check password against stored in constant time.
+
+    stored may be None (unknown account); a dummy hash is still checked so
+    the response time does not reveal whether the email exists. Returns
+    (matches, new_hash) where new_hash is set when the stored value should
+    be replaced because it is plaintext or uses an older method.
+    """
+    if stored is None:
+        hasher.run(check_password_hash, _dummy_hash(), password)
+        return False, None
+
+    if not hasher.run(_check, stored, password):
+        return False, None
+
+    if needs_rehash(stored):
+        return True, hash_password(password)
+
+    return True, None
+
+
+def _dummy_hash():
+    method = _method()
+    cached = _dummy_hashes.get(method)
+    if cached is None:
+        cached = _dummy_hashes[method] = generate_password_hash("", method)
+    return cached
+
+
+_dummy_hashes = {}
@@ -0,0 +1,43 @@
+import threading
+import time
+from flask import has_app_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_callbacks = []
+_listening = False
+_listen_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _callbacks and has_app_context():
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    if start is None:
+        return
+
+    elapsed = time.perf_counter() - start
+    for callback in _callbacks:
+        callback(statement, parameters, elapsed)
+
+
+def on_query(callback):
+    """Call callback(statement, parameters, seconds) after every statement
+    run inside an app context.
+
+    One pair of Engine-class listeners is shared by every callback, so each
+    statement is timed once however many subscribers there are. They see
+    the sync engine and the async engine's sync_engine alike. Registering
+    the same callback again is a no-op.
+    """
+    global _listening
+    with _listen_lock:
+        if callback not in _callbacks:
+            _callbacks.append(callback)
+        if not _listening:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _listening = True
@@ -0,0 +1,137 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from flask import request
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from app.utils.serializers import FastSerializer
+
+_FILTER_PARAM = re.compile(r"^filter\[(\w+)\]$")
+
+
+class QueryParamError(ValueError):
+    pass
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class ListQuery:
+    """Shared ?filter[...]=, ?sort=, ?fields= and ?include= handling.
+
+    Built once per collection from its model, the FastSerializer for its
+    full schema and a mapping of nested field name to the loader options it
+    needs. parse() turns the request's query string into a ParsedQuery that
+    routes feed into their select() and paginate() calls. Nested fields are
+    only loaded when they will be dumped.
+    """
+
+    def __init__(self, model, serializer, loaders):
+        self.model = model
+        self.schema_class = type(serializer.schema)
+        self.loaders = loaders
+        self.default_serializer = serializer
+
+        # Only columns the schema dumps can be filtered, sorted or selected
+        mapper = inspect(model)
+        dumped = serializer.schema.dump_fields
+        self.columns = {
+            attr.key: getattr(model, attr.key)
+            for attr in mapper.column_attrs if attr.key in dumped
+        }
+        # Always loaded: keyset pagination needs the PK, relationships the FKs
+        self.required = [
+            attr for attr in mapper.column_attrs
+            if any(column.primary_key or column.foreign_keys for column in attr.columns)
+        ]
+
+    def _convert(self, name, raw):
+        python_type = self.columns[name].property.columns[0].type.python_type
+
+        try:
+            if python_type in (date, datetime):
+                return python_type.fromisoformat(raw)
+            if python_type is bool:
+                return raw.lower() in ("1", "true", "yes")
+            return python_type(raw)
+        except ValueError:
+            raise QueryParamError(f"Invalid value for filter[{name}].")
+
+    def _filters(self):
+        filters = []
+        for key in request.args:
+            match = _FILTER_PARAM.match(key)
+            if not match:
+                continue
+
+            name = match.group(1)
+            if name not in self.columns:
+                raise QueryParamError(f"Cannot filter on '{name}'.")
+
+            values = [self._convert(name, raw) for raw in _split(request.args[key])]
+            if not values:
+                raise QueryParamError(f"filter[{name}] needs a value.")
+
+            column = self.columns[name]
+            filters.append(column == values[0] if len(values) == 1 else column.in_(values))
+
+        return filters
+
+    def _sort(self):
+        sort = []
+        for item in _split(request.args.get("sort", "")):
+            descending = item.startswith("-")
+            name = item.lstrip("-")
+            if name not in self.columns:
+                raise QueryParamError(f"Cannot sort on '{name}'.")
+            sort.append((self.columns[name], descending))
+        return sort
+
+    def parse(self):
+        filters = self._filters()
+        sort = self._sort()
+
+        fields = _split(request.args["fields"]) if "fields" in request.args else None
+        include = _split(request.args["include"]) if "include" in request.args else None
+
+        for name in include or []:
+            if name not in self.loaders:
+                raise QueryParamError(f"Cannot include '{name}'.")
+
+        if fields is None and include is None:
+            return ParsedQuery(filters, sort, [
+                option for options in self.loaders.values() for option in options
+            ], self.default_serializer)
+
+        if fields is None:
+            fields = list(self.columns)
+        elif not fields:
+            raise QueryParamError("fields needs at least one name.")
+
+        for name in fields:
+            if name not in self.columns and name not in self.loaders:
+                raise QueryParamError(f"Unknown field '{name}'.")
+
+        only = set(fields) | set(include or [])
+        columns = [self.columns[name] for name in only if name in self.columns]
+        columns += [getattr(self.model, attr.key) for attr in self.required]
+        columns += [attribute for attribute, _ in sort]
+
+        options = [load_only(*columns)]
+        for name in only & set(self.loaders):
+            options.extend(self.loaders[name])
+
+        return ParsedQuery(filters, sort, options, self.serializer(frozenset(only)))
+
+    @lru_cache(maxsize=64)
+    def serializer(self, only):
+        return FastSerializer(self.schema_class(many=True, only=tuple(sorted(only))))
+
+
+class ParsedQuery:
+    def __init__(self, filters, sort, load_options, serializer):
+        self.filters = filters
+        self.sort = sort
+        self.load_options = load_options
+        self.serializer = serializer
@@ -0,0 +1,160 @@
+"""Pre-aggregated reporting tables.
+
+report_daily_revenue and report_part_usage are updated in the same
+transaction as the ticket writes they summarize, with one upsert per
+table, so the /reports endpoints read a handful of rows instead of
+scanning service_ticket_inventory. Tickets per mechanic needs no table of
+its own: mechanics.ticket_load already holds it (see app.utils.scheduling).
+
+The tables are a ledger of what was booked. Revenue is counted at the
+part's price when it was added, and deleting a customer or part later
+does not rewrite past days. rebuild_reports recomputes everything from
+the current rows, at current prices.
+
+Days are the ticket's service_date; tickets without one are counted in
+part usage but not in the daily figures.
+
+SQLite and Postgres use a native ON CONFLICT upsert. Other databases fall
+back to an UPDATE, then an INSERT inside a savepoint for keys not yet
+present.
+"""
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models import (
+    Inventory,
+    ServiceTicket,
+    ReportDailyRevenue,
+    ReportPartUsage,
+    service_ticket_inventory,
+)
+
+_UPSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _upsert(model, key, rows):
+    """Insert rows, adding their counters to any row already at key."""
+    if not rows:
+        return
+
+    table = model.__table__
+    counters = [column for column in rows[0] if column != key]
+
+    dialect_insert = _UPSERTS.get(db.session.get_bind().dialect.name)
+    if dialect_insert is None:
+        for row in rows:
+            _add_row(table, key, counters, row)
+        return
+
+    statement = dialect_insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c[key]],
+        set_={column: table.c[column] + statement.excluded[column] for column in counters},
+    )
+    db.session.execute(statement, rows)
+
+
+def _add_row(table, key, counters, row):
+    def add():
+        return db.session.execute(
+            update(table)
+            .where(table.c[key] == row[key])
+            .values({column: table.c[column] + row[column] for column in counters})
+        ).rowcount
+
+    if add():
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.execute(insert(table).values(row))
+    except IntegrityError:
+        # Another transaction inserted the key first
+        add()
+
+
+def record_ticket(service_date):
+    """Count a new ticket on its service date."""
+    if service_date is None:
+        return
+
+    _upsert(ReportDailyRevenue, "day", [
+        {"day": service_date, "tickets": 1, "units": 0, "revenue": 0.0},
+    ])
+
+
+def record_parts(ticket, quantities):
+    """Count parts added to ticket; quantities maps part id to units."""
+    if not quantities:
+        return
+
+    prices = dict(db.session.execute(
+        select(Inventory.id, Inventory.price).where(Inventory.id.in_(quantities))
+    ).all())
+
+    usage = [
+        {
+            "inventory_id": part_id,
+            "units": units,
+            "tickets": 1,
+            "revenue": prices[part_id] * units,
+        }
+        for part_id, units in sorted(quantities.items())
+    ]
+    _upsert(ReportPartUsage, "inventory_id", usage)
+
+    if ticket.service_date is not None:
+        _upsert(ReportDailyRevenue, "day", [{
+            "day": ticket.service_date,
+            "tickets": 0,
+            "units": sum(row["units"] for row in usage),
+            "revenue": sum(row["revenue"] for row in usage),
+        }])
+
+
+def rebuild_reports(conn):
+    """Recompute both tables from the current tickets and parts."""
+    conn.execute(delete(ReportDailyRevenue))
+    conn.execute(delete(ReportPartUsage))
+
+    line_revenue = service_ticket_inventory.c.quantity * Inventory.price
+
+    conn.execute(insert(ReportPartUsage).from_select(
+        ["inventory_id", "units", "tickets", "revenue"],
+        select(
+            service_ticket_inventory.c.inventory_id,
+            func.sum(service_ticket_inventory.c.quantity),
+            func.count(),
+            func.sum(line_revenue),
+        )
+        .join(Inventory, Inventory.id == service_ticket_inventory.c.inventory_id)
+        .group_by(service_ticket_inventory.c.inventory_id),
+    ))
+
+    parts_per_ticket = (
+        select(
+            service_ticket_inventory.c.ticket_id,
+            func.sum(service_ticket_inventory.c.quantity).label("units"),
+            func.sum(line_revenue).label("revenue"),
+        )
+        .join(Inventory, Inventory.id == service_ticket_inventory.c.inventory_id)
+        .group_by(service_ticket_inventory.c.ticket_id)
+        .subquery()
+    )
+
+    conn.execute(insert(ReportDailyRevenue).from_select(
+        ["day", "tickets", "units", "revenue"],
+        select(
+            ServiceTicket.service_date,
+            func.count(),
+            func.coalesce(func.sum(parts_per_ticket.c.units), 0),
+            func.coalesce(func.sum(parts_per_ticket.c.revenue), 0.0),
+        )
+        .outerjoin(parts_per_ticket, parts_per_ticket.c.ticket_id == ServiceTicket.id)
+        .where(ServiceTicket.service_date.is_not(None))
+        .group_by(ServiceTicket.service_date),
+    ))
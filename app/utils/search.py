@@ -0,0 +1,139 @@
+"""Substring search over customers, tickets and parts.
+
+On SQLite each searchable table gets an external-content FTS5 table using
+the trigram tokenizer, so any 3+ character fragment of a name, email,
+phone, VIN or description matches, ranked by bm25. Triggers on the source
+table keep it in sync with every write, ORM or bulk. On Postgres the same
+columns get pg_trgm GIN indexes, which serve ILIKE '%term%' directly, and
+results are ranked by trigram similarity. Other databases fall back to an
+unindexed ILIKE scan.
+
+The indexes are created with their tables through DDL events, and for
+existing databases by migration v0006 (v0008 narrows the update trigger).
+"""
+from sqlalchemy import DDL, event, select, and_, or_, func, literal, literal_column, text, table, column
+from app.models import Customer, ServiceTicket, Inventory
+
+MIN_TERM_LENGTH = 3
+MAX_CANDIDATES = 10000
+
+
+class SearchError(ValueError):
+    pass
+
+
+def parse_terms(q):
+    """Split q on whitespace; every term must be MIN_TERM_LENGTH long."""
+    terms = (q or "").split()
+    if not terms:
+        raise SearchError("q is required.")
+    if any(len(term) < MIN_TERM_LENGTH for term in terms):
+        raise SearchError(f"Each search term needs at least {MIN_TERM_LENGTH} characters.")
+    return terms
+
+
+class SearchIndex:
+
+    def __init__(self, model, columns):
+        self.model = model
+        self.columns = columns
+        self.table = model.__tablename__
+        self.fts = f"{self.table}_fts"
+
+    def _sqlite_statements(self):
+        names = ", ".join(f'"{name}"' for name in self.columns)
+        new = ", ".join(f'new."{name}"' for name in self.columns)
+        old = ", ".join(f'old."{name}"' for name in self.columns)
+
+        insert_new = f"INSERT INTO {self.fts}(rowid, {names}) VALUES (new.id, {new});"
+        delete_old = f"INSERT INTO {self.fts}({self.fts}, rowid, {names}) VALUES ('delete', old.id, {old});"
+
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts} USING fts5("
+            f"{names}, content='{self.table}', content_rowid='id', tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts}_ai AFTER INSERT ON {self.table} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts}_ad AFTER DELETE ON {self.table} BEGIN {delete_old} END",
+            # Only writes to an indexed column touch the FTS table, so stock
+            # decrements and password rehashes leave it alone
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts}_au AFTER UPDATE OF {names} ON {self.table} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ]
+
+    def _postgresql_statements(self):
+        statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        for name in self.columns:
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS "ix_{self.table}_{name}_trgm" '
+                f'ON {self.table} USING gin ("{name}" gin_trgm_ops)'
+            )
+        return statements
+
+    def create(self, conn, rebuild=False):
+        """Create the index if missing; rebuild re-reads every source row."""
+        dialect = conn.dialect.name
+
+        if dialect == "sqlite":
+            for statement in self._sqlite_statements():
+                conn.execute(text(statement))
+            if rebuild:
+                conn.execute(text(f"INSERT INTO {self.fts}({self.fts}) VALUES ('rebuild')"))
+        elif dialect == "postgresql":
+            for statement in self._postgresql_statements():
+                conn.execute(text(statement))
+
+    def listen(self):
+        # A recreated source table starts empty, so any FTS table left over
+        # from a previous drop is discarded rather than reused
+        source = self.model.__table__
+        drop = DDL(f"DROP TABLE IF EXISTS {self.fts}").execute_if(dialect="sqlite")
+
+        event.listen(source, "before_drop", drop)
+        event.listen(source, "after_create", drop)
+        event.listen(source, "after_create", lambda target, conn, **kw: self.create(conn))
+
+    def search(self, query, terms, dialect, max_candidates=MAX_CANDIDATES):
+        """Restrict query (a select over the model) to rows matching every
+        term. Returns (query, rank); lower rank is a better match.
+
+        Only the first max_candidates matches (in id order) are ranked, so a
+        term that matches most of the table costs a bounded amount of work.
+        """
+        if dialect == "sqlite":
+            fts = table(self.fts, column("rowid"), column("rank"))
+            # Quoted so punctuation in VINs and emails is matched literally
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+            candidates = (
+                select(fts.c.rowid, fts.c.rank)
+                .where(literal_column(self.fts).op("MATCH")(match))
+                .limit(max_candidates)
+                .subquery()
+            )
+            query = query.join(candidates, candidates.c.rowid == self.model.id)
+            return query, candidates.c.rank
+
+        attributes = [getattr(self.model, name) for name in self.columns]
+        matches = and_(*(
+            or_(*(attribute.icontains(term, autoescape=True) for attribute in attributes))
+            for term in terms
+        ))
+        query = query.where(self.model.id.in_(
+            select(self.model.id).where(matches).order_by(self.model.id).limit(max_candidates)
+        ))
+
+        if dialect == "postgresql":
+            phrase = " ".join(terms)
+            similarity = [func.similarity(func.coalesce(attribute, ""), phrase) for attribute in attributes]
+            rank = -(func.greatest(*similarity) if len(similarity) > 1 else similarity[0])
+            return query, rank
+
+        return query, literal(0.0)
+
+
+SEARCH_INDEXES = {
+    "customers": SearchIndex(Customer, ("name", "email", "phone")),
+    "tickets": SearchIndex(ServiceTicket, ("VIN", "service_desc")),
+    "parts": SearchIndex(Inventory, ("name",)),
+}
+
+for _index in SEARCH_INDEXES.values():
+    _index.listen()
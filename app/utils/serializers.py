@@ -0,0 +1,79 @@
+from flask import current_app, request, jsonify
+from marshmallow import fields
+
+
+def _scalar(field):
+    # Plain numbers and strings are converted directly; anything else goes
+    # through the field's own _serialize so formats (dates etc.) still match.
+    if isinstance(field, fields.Number) and not field.as_string:
+        num_type = field.num_type
+        return lambda value: None if value is None else num_type(value)
+
+    if isinstance(field, fields.String):
+        return lambda value: None if value is None else str(value)
+
+    return lambda value: field._serialize(value, None, None)
+
+
+def _compile_field(field):
+    if isinstance(field, fields.Nested):
+        nested = _compile(field.schema)
+        if field.many:
+            return lambda value: None if value is None else [nested(item) for item in value]
+        return lambda value: None if value is None else nested(value)
+
+    if isinstance(field, fields.List):
+        inner = _compile_field(field.inner)
+        return lambda value: None if value is None else [inner(item) for item in value]
+
+    return _scalar(field)
+
+
+def _compile(schema):
+    plan = []
+    for name, field in schema.dump_fields.items():
+        key = field.data_key or name
+        attribute = field.attribute or name
+        plan.append((key, attribute, _compile_field(field)))
+
+    def serialize(obj):
+        return {key: convert(getattr(obj, attribute)) for key, attribute, convert in plan}
+
+    return serialize
+
+
+class FastSerializer:
+    """Precompiled dump path for a marshmallow schema.
+
+    Walks the schema's dump fields once and builds a flat list of
+    (key, attribute, converter) steps, so dumping a row is a dict
+    comprehension instead of marshmallow's per-field dispatch. Output is
+    identical to schema.dump().
+
+    jsonify() only takes the fast path for endpoints listed in the
+    FAST_SERIALIZER_ENDPOINTS config value (all endpoints when unset) and
+    falls back to the schema otherwise.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.many = schema.many
+        self._serialize = None
+
+    def dump(self, obj):
+        # Compiled on first use, once every schema is registered for Nested
+        if self._serialize is None:
+            self._serialize = _compile(self.schema)
+
+        if self.many:
+            return [self._serialize(item) for item in obj]
+        return self._serialize(obj)
+
+    def enabled(self):
+        endpoints = current_app.config.get("FAST_SERIALIZER_ENDPOINTS")
+        return endpoints is None or request.endpoint in endpoints
+
+    def jsonify(self, obj):
+        if not self.enabled():
+            return self.schema.jsonify(obj)
+        return jsonify(self.dump(obj))
@@ -0,0 +1,105 @@
+"""Low-stock tracking.
+
+A part is low when its quantity is at or below its reorder_threshold. The
+low parts are kept in the partial index ix_inventory_low_stock, so listing
+them reads only that index however large the catalogue is.
+
+Whenever a write moves a part across its threshold, an event is appended
+to inventory_events in the same transaction: "low_stock" on the way down,
+"restocked" on the way back up. A consumer keeps the last id it has seen
+as its watermark and asks for the events after it, instead of polling the
+whole table.
+
+That only works if events become visible in id order. Postgres hands out
+ids when rows are inserted, not when they commit, so without help a later
+id could commit first and a consumer would move its watermark past an
+earlier event that is still in flight. record_transitions therefore takes
+a transaction-level advisory lock before inserting, which holds each
+event-writing transaction's ids back until the previous one has committed.
+SQLite allows one writer at a time, so it needs no lock.
+
+Units reserved for a ticket go back into stock when the ticket is deleted
+(release_parts), which records "restocked" events the same way.
+"""
+from datetime import datetime, timezone
+from sqlalchemy import insert, select, update, func
+from app.extensions import db
+from app.models import Inventory, InventoryEvent, service_ticket_inventory
+
+LOW_STOCK = "low_stock"
+RESTOCKED = "restocked"
+
+# pg_advisory_xact_lock key serializing inventory_events inserts
+EVENT_LOCK_KEY = 4201001
+
+
+def is_low(quantity, threshold):
+    return quantity <= threshold
+
+
+def low_stock():
+    """Filter for parts at or below their threshold; matches the partial
+    index predicate so the planner can use it."""
+    return Inventory.quantity <= Inventory.reorder_threshold
+
+
+def record_transitions(changes):
+    """Append an event for each part that crossed its threshold.
+
+    changes is an iterable of (part_id, was_low, quantity, threshold),
+    with quantity and threshold as they are after the write.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    events = [
+        {
+            "inventory_id": part_id,
+            "kind": LOW_STOCK if is_low(quantity, threshold) else RESTOCKED,
+            "quantity": quantity,
+            "reorder_threshold": threshold,
+            "created_at": now,
+        }
+        for part_id, was_low, quantity, threshold in changes
+        if was_low != is_low(quantity, threshold)
+    ]
+
+    if events:
+        if db.session.get_bind().dialect.name == "postgresql":
+            # Released at commit or rollback
+            db.session.execute(select(func.pg_advisory_xact_lock(EVENT_LOCK_KEY)))
+        db.session.execute(insert(InventoryEvent), events)
+
+    return events
+
+
+def release_parts(ticket_ids):
+    """Return the units reserved by ticket_ids to stock, before those
+    tickets' service_ticket_inventory rows are deleted."""
+    if not ticket_ids:
+        return
+
+    lines = service_ticket_inventory.c
+    released = dict(db.session.execute(
+        select(lines.inventory_id, func.sum(lines.quantity))
+        .where(lines.ticket_id.in_(ticket_ids))
+        .group_by(lines.inventory_id)
+    ).all())
+    if not released:
+        return
+
+    units = (
+        select(func.sum(lines.quantity))
+        .where(lines.ticket_id.in_(ticket_ids), lines.inventory_id == Inventory.id)
+        .scalar_subquery()
+    )
+    restocked = db.session.execute(
+        update(Inventory)
+        .where(Inventory.id.in_(released))
+        .values(quantity=Inventory.quantity + units)
+        .returning(Inventory.id, Inventory.quantity, Inventory.reorder_threshold)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    record_transitions(
+        (part_id, is_low(quantity - released[part_id], threshold), quantity, threshold)
+        for part_id, quantity, threshold in restocked
+    )
@@ -0,0 +1,14 @@
+"""ASGI entry point, for serving under uvicorn or another ASGI server:
+
+    uvicorn asgi:app --workers 4
+
+Flask is a WSGI framework, so a2wsgi runs it on a thread pool
+(ASGI_THREADS per worker) inside the server's event loop. The async views
+under /async use the async engine; everything else behaves as under
+gunicorn.
+"""
+import os
+from a2wsgi import WSGIMiddleware
+from flask_app import app as flask_app
+
+app = WSGIMiddleware(flask_app, workers=int(os.environ.get("ASGI_THREADS", 10)))
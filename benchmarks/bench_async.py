@@ -0,0 +1,122 @@
+"""Load-test the sync ticket list under gunicorn against the async one
+under uvicorn, at the same worker count, and report throughput and
+p50/p99 latency.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_async [workers] [concurrency] [requests]
+"""
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import TestingConfig
+
+DB_PATH = os.environ.get("BENCH_DB", os.path.join(tempfile.gettempdir(), "bench_async.db"))
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = f"sqlite:///{DB_PATH}"
+    # Every request should reach the database
+    CACHE_TYPE = "NullCache"
+    DEBUG = False
+
+
+def wsgi_app():
+    from app import create_app
+    return create_app(BenchConfig)
+
+
+def asgi_app():
+    from a2wsgi import WSGIMiddleware
+    return WSGIMiddleware(wsgi_app(), workers=int(os.environ.get("ASGI_THREADS", 10)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(process, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health/db")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start.")
+
+
+def load(port, path, concurrency, total):
+    def one(_):
+        start = time.perf_counter()
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        assert response.status == 200, response.status
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - start
+
+    return total / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    workers = sys.argv[1] if len(sys.argv) > 1 else "2"
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    total = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    from benchmarks.bench_serializers import seed
+
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    app = wsgi_app()
+    with app.app_context():
+        seed(2000)
+
+    env = dict(os.environ, BENCH_DB=DB_PATH)
+    servers = {
+        "gunicorn sync": (
+            ["-m", "gunicorn", "-w", workers, "--log-level", "warning", "benchmarks.bench_async:wsgi_app()"],
+            "-b", "/service-tickets?limit=50",
+        ),
+        "uvicorn async": (
+            ["-m", "uvicorn", "--factory", "benchmarks.bench_async:asgi_app",
+             "--workers", workers, "--log-level", "warning"],
+            "--port", "/async/service-tickets?limit=50",
+        ),
+    }
+
+    for label, (args, port_flag, path) in servers.items():
+        port = free_port()
+        bind = f"127.0.0.1:{port}" if port_flag == "-b" else str(port)
+        process = subprocess.Popen([sys.executable, *args, port_flag, bind], env=env)
+        try:
+            wait_until_up(process, port)
+            load(port, path, concurrency, min(total, 200))  # warm up
+            throughput, p50, p99 = load(port, path, concurrency, total)
+        finally:
+            process.terminate()
+            process.wait()
+
+        print(f"{label:14} workers={workers} concurrency={concurrency}: "
+              f"{throughput:7.1f} req/s  p50 {p50 * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure token_required overhead per request for each JWT backend,
+with and without the verified-token cache.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_auth [iterations]
+"""
+import sys
+import timeit
+from app import create_app
+from app.utils.auth import encode_token, token_required, token_cache
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+@token_required
+def view(customer_id):
+    return customer_id
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        token = encode_token(1)
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        for backend in ("jose", "pyjwt"):
+            for cache_size in (0, 1024):
+                app.config["JWT_BACKEND"] = backend
+                app.config["JWT_CACHE_SIZE"] = cache_size
+                token_cache.clear()
+
+                assert view() == 1
+                best = min(timeit.repeat(view, number=iterations, repeat=5))
+                label = f"{backend} {'cached' if cache_size else 'uncached'}"
+                print(f"{label:16} {best / iterations * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare one-row-per-request inserts against the bulk import endpoints.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bulk_import [rows]
+"""
+import sys
+import time
+from app import create_app
+from app.extensions import db
+from app.models import Customer
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+def rows(prefix, count):
+    return [
+        {
+            "name": f"Customer {i}",
+            "email": f"{prefix}{i}@example.com",
+            "phone": "555-555-5555",
+            "password": "password",
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = create_app(BenchConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        token = encode_token(1)
+
+    start = time.perf_counter()
+    for row in rows("single", count):
+        client.post("/customers", json=row)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = client.post("/customers/bulk", json=rows("bulk", count))
+    bulk = time.perf_counter() - start
+    assert response.json["created"] == count, response.json
+
+    parts = "name,price,quantity\n" + "".join(f"Part {i},{i % 90 + 9.99},10\n" for i in range(count))
+    start = time.perf_counter()
+    response = client.post(
+        "/inventory/bulk",
+        data=parts,
+        content_type="text/csv",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    csv_bulk = time.perf_counter() - start
+    assert response.json["created"] == count, response.json
+
+    with app.app_context():
+        assert db.session.query(Customer).count() == count * 2
+
+    for label, elapsed in (
+        ("POST /customers x N", single),
+        ("POST /customers/bulk", bulk),
+        ("POST /inventory/bulk (CSV)", csv_bulk),
+    ):
+        print(f"{label:28} {count} rows: {elapsed:7.3f} s ({count / elapsed:9.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare JSON encode time and bytes on the wire: the stdlib encoder vs
+CompactJSONProvider, and identity vs gzip vs br for a ticket list.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compression [tickets]
+"""
+import sys
+import timeit
+from flask.json.provider import DefaultJSONProvider
+from app import create_app
+from app.extensions import db
+from app.models import Customer, ServiceTicket
+from app.utils.json_provider import CompactJSONProvider
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    N_PLUS_ONE_THRESHOLD = None
+
+
+def seed(app, count):
+    with app.app_context():
+        customer = Customer(name="Bench", email="bench@example.com", password="x", phone="111")
+        db.session.add(customer)
+        db.session.flush()
+        db.session.add_all(
+            ServiceTicket(VIN=f"VIN{i:08d}", service_desc=f"Service #{i}: oil, filters, brakes", customer_id=customer.id)
+            for i in range(count)
+        )
+        db.session.commit()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    app = create_app(BenchConfig)
+    seed(app, count)
+    client = app.test_client()
+
+    payload = client.get("/service-tickets").json
+    providers = (("stdlib", DefaultJSONProvider(app)), ("compact", CompactJSONProvider(app)))
+    for label, provider in providers:
+        best = min(timeit.repeat(lambda: provider.dumps(payload), number=20, repeat=5))
+        size = len(provider.dumps(payload).encode())
+        print(f"{label:8} encode {len(payload)} tickets: {best / 20 * 1000:7.2f} ms  {size:9,} bytes")
+
+    for encoding in ("identity", "gzip", "br"):
+        headers = {"Accept-Encoding": encoding}
+        # Cached after the first call, so this times compression plus the cache hit
+        best = min(timeit.repeat(lambda: client.get("/service-tickets", headers=headers), number=20, repeat=5))
+        size = len(client.get("/service-tickets", headers=headers).get_data())
+        print(f"{encoding:8} GET /service-tickets:  {best / 20 * 1000:7.2f} ms  {size:9,} bytes on the wire")
+
+
+if __name__ == "__main__":
+    main()
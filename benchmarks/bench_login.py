@@ -0,0 +1,64 @@
+"""Measure login throughput under a burst of concurrent requests for a few
+hash pool sizes, and how many requests the bounded queue turns away.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_login [clients] [logins_per_client]
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app import create_app
+from app.extensions import db
+from app.utils.passwords import PASSWORD_HASH_METHOD
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    PASSWORD_HASH_METHOD = PASSWORD_HASH_METHOD
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    logins = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    client = app.test_client()
+    response = client.post("/customers", json={
+        "name": "Bench", "email": "bench@example.com", "phone": "555", "password": "password"
+    })
+    assert response.status_code == 201, response.json
+
+    def burst():
+        statuses = []
+        local = app.test_client()
+        for _ in range(logins):
+            response = local.post("/customers/login", json={
+                "email": "bench@example.com", "password": "password"
+            })
+            statuses.append(response.status_code)
+        return statuses
+
+    # The last run shows load shedding: a short queue and wait turn excess logins away
+    for workers, queue, wait in ((1, 32, 5.0), (4, 32, 5.0), (4, 4, 0.1)):
+        app.config["PASSWORD_HASH_WORKERS"] = workers
+        app.config["PASSWORD_HASH_QUEUE"] = queue
+        app.config["PASSWORD_HASH_WAIT"] = wait
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            statuses = [status for result in pool.map(lambda _: burst(), range(clients)) for status in result]
+        elapsed = time.perf_counter() - start
+
+        ok = statuses.count(200)
+        print(f"workers={workers} queue={queue:<3} wait={wait:<4} {ok:4} ok {statuses.count(503):4} busy "
+              f"in {elapsed:6.2f} s ({ok / elapsed:7.1f} logins/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare finding low-stock parts with a full table scan against the
+partial ix_inventory_low_stock index.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_low_stock [parts] [low parts]
+"""
+import random
+import sys
+import timeit
+from sqlalchemy import select, insert, text
+from app import create_app
+from app.extensions import db
+from app.models import Inventory
+from app.utils.stock import low_stock
+from config import TestingConfig
+
+CHUNK = 50000
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+def seed(parts, low):
+    rng = random.Random(0)
+    low_ids = set(rng.sample(range(1, parts + 1), low))
+
+    for start in range(1, parts + 1, CHUNK):
+        db.session.execute(insert(Inventory), [
+            {
+                "id": i,
+                "name": f"Part {i}",
+                "price": 10.0,
+                "quantity": 2 if i in low_ids else 100,
+                "reorder_threshold": 5,
+            }
+            for i in range(start, min(start + CHUNK, parts + 1))
+        ])
+    db.session.commit()
+
+
+def main():
+    parts = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    low = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        seed(parts, low)
+
+        indexed = select(Inventory.id).where(low_stock()).order_by(Inventory.id)
+        compiled = indexed.compile(db.engine)
+        scan = text(str(compiled).replace("FROM inventory", "FROM inventory NOT INDEXED"))
+
+        assert len(db.session.execute(indexed).all()) == low
+
+        for label, statement in (("full scan", scan), ("partial index", indexed)):
+            best = min(timeit.repeat(lambda: db.session.execute(statement).all(), number=5, repeat=3)) / 5
+            print(f"{low} low of {parts:,} parts, {label:13}: {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Measure per-request overhead of the metrics layer, enabled vs disabled.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_metrics [requests]
+"""
+import sys
+import timeit
+from app import create_app
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+class DisabledConfig(BenchConfig):
+    METRICS_ENABLED = False
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    for label, config in (("disabled", DisabledConfig), ("enabled", BenchConfig)):
+        client = create_app(config).test_client()
+        assert client.get("/health/db").status_code == 200
+
+        best = min(timeit.repeat(lambda: client.get("/health/db"), number=requests, repeat=5))
+        print(f"{label:9} GET /health/db: {best / requests * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare revenue per day and usage per part computed by scanning
+service_ticket_inventory against reading the reporting tables.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_reports [tickets]
+"""
+import random
+import sys
+import time
+import timeit
+from datetime import date, timedelta
+from sqlalchemy import select, insert, func
+from app import create_app
+from app.extensions import db
+from app.models import (
+    Customer,
+    Inventory,
+    ServiceTicket,
+    ReportDailyRevenue,
+    ReportPartUsage,
+    service_ticket_inventory,
+)
+from app.utils.reporting import rebuild_reports
+from config import TestingConfig
+
+PARTS = 500
+CHUNK = 50000
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+def seed(tickets):
+    rng = random.Random(0)
+    first_day = date(2024, 1, 1)
+
+    db.session.add(Customer(id=1, name="Bench", email="bench@example.com", password="x", phone="111"))
+    db.session.execute(insert(Inventory), [
+        {"id": i, "name": f"Part {i}", "price": rng.uniform(5, 500), "quantity": 1000}
+        for i in range(1, PARTS + 1)
+    ])
+
+    # Three parts per ticket over two years of service dates
+    for start in range(1, tickets + 1, CHUNK):
+        ids = range(start, min(start + CHUNK, tickets + 1))
+        db.session.execute(insert(ServiceTicket), [
+            {"id": i, "VIN": f"VIN{i}", "customer_id": 1, "service_date": first_day + timedelta(days=i % 730)}
+            for i in ids
+        ])
+        db.session.execute(insert(service_ticket_inventory), [
+            {"ticket_id": i, "inventory_id": part_id, "quantity": rng.randint(1, 4)}
+            for i in ids
+            for part_id in rng.sample(range(1, PARTS + 1), 3)
+        ])
+
+    db.session.commit()
+
+
+def scan_revenue():
+    query = (
+        select(ServiceTicket.service_date, func.sum(service_ticket_inventory.c.quantity * Inventory.price))
+        .join(service_ticket_inventory, service_ticket_inventory.c.ticket_id == ServiceTicket.id)
+        .join(Inventory, Inventory.id == service_ticket_inventory.c.inventory_id)
+        .group_by(ServiceTicket.service_date)
+    )
+    return db.session.execute(query).all()
+
+
+def scan_parts():
+    query = (
+        select(service_ticket_inventory.c.inventory_id, func.sum(service_ticket_inventory.c.quantity))
+        .group_by(service_ticket_inventory.c.inventory_id)
+    )
+    return db.session.execute(query).all()
+
+
+def read_revenue():
+    return db.session.execute(select(ReportDailyRevenue)).scalars().all()
+
+
+def read_parts():
+    return db.session.execute(select(ReportPartUsage)).scalars().all()
+
+
+def main():
+    tickets = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        seed(tickets)
+
+        start = time.perf_counter()
+        rebuild_reports(db.session)
+        db.session.commit()
+        print(f"rebuild from {tickets:,} tickets: {time.perf_counter() - start:.2f} s")
+
+        for label, function in (
+            ("revenue/day scan", scan_revenue),
+            ("revenue/day table", read_revenue),
+            ("parts scan", scan_parts),
+            ("parts table", read_parts),
+        ):
+            best = min(timeit.repeat(function, number=3, repeat=3)) / 3
+            print(f"{label:18}: {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
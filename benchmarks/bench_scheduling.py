@@ -0,0 +1,91 @@
+"""Compare picking the least loaded mechanic with a GROUP BY over
+service_mechanics against the ticket_load index, and time auto-assign.
+
+Run from the repository root (defaults: 10k mechanics, 1M tickets):
+
+    python -m benchmarks.bench_scheduling [mechanics] [tickets]
+"""
+import random
+import sys
+import time
+import timeit
+from sqlalchemy import select, insert, func
+from app import create_app
+from app.extensions import db
+from app.models import Customer, Mechanic, ServiceTicket, service_mechanics
+from app.utils.scheduling import least_loaded, recount_load
+from config import TestingConfig
+
+CHUNK = 50000
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    RATELIMIT_ENABLED = False
+
+
+def seed(mechanics, tickets):
+    db.session.add(Customer(id=1, name="Bench", email="bench@example.com", password="x", phone="111"))
+    db.session.execute(insert(Mechanic), [
+        {"id": i, "name": f"Mechanic {i}", "email": f"m{i}@example.com", "phone": "111", "salary": 50000}
+        for i in range(1, mechanics + 1)
+    ])
+
+    # One mechanic per ticket, skewed so loads are uneven
+    rng = random.Random(0)
+    for start in range(1, tickets + 1, CHUNK):
+        ids = range(start, min(start + CHUNK, tickets + 1))
+        db.session.execute(insert(ServiceTicket), [{"id": i, "VIN": f"VIN{i}", "customer_id": 1} for i in ids])
+        db.session.execute(insert(service_mechanics), [
+            {"ticket_id": i, "mechanic_id": int(rng.paretovariate(1.2)) % mechanics + 1} for i in ids
+        ])
+
+    recount_load()
+    db.session.commit()
+
+
+def group_by_least_loaded():
+    load = func.count(service_mechanics.c.ticket_id)
+    query = (
+        select(Mechanic.id)
+        .outerjoin(service_mechanics, service_mechanics.c.mechanic_id == Mechanic.id)
+        .group_by(Mechanic.id)
+        .order_by(load, Mechanic.id)
+        .limit(1)
+    )
+    return db.session.execute(query).scalar_one()
+
+
+def main():
+    mechanics = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    tickets = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+
+    app = create_app(BenchConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        start = time.perf_counter()
+        seed(mechanics, tickets)
+        print(f"seeded {mechanics:,} mechanics / {tickets:,} tickets in {time.perf_counter() - start:.1f} s")
+
+        assert group_by_least_loaded() == least_loaded(0)[0].id
+
+        for label, pick in (("GROUP BY", group_by_least_loaded), ("index", lambda: least_loaded(0))):
+            number = 3 if label == "GROUP BY" else 1000
+            best = min(timeit.repeat(pick, number=number, repeat=3)) / number
+            print(f"least loaded via {label:8}: {best * 1000:9.3f} ms")
+
+        new_ticket = ServiceTicket(VIN="NEW", customer_id=1)
+        db.session.add(new_ticket)
+        db.session.commit()
+        ticket_id = new_ticket.id
+
+    start = time.perf_counter()
+    response = client.post(f"/service-tickets/{ticket_id}/auto-assign", json={"count": 3})
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.json
+    print(f"POST /auto-assign (3 mechanics): {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare customer search through the FTS5 trigram index against a
+LIKE '%term%' scan, and time GET /search/customers end to end.
+
+Run from the repository root (default: 1M customers):
+
+    python -m benchmarks.bench_search [customers]
+"""
+import random
+import sys
+import time
+import timeit
+from sqlalchemy import select, insert, or_
+from app import create_app
+from app.extensions import db
+from app.models import Customer
+from app.utils.search import SEARCH_INDEXES
+from config import TestingConfig
+
+CHUNK = 50000
+FIRST = ["John", "Jane", "Maria", "Ahmed", "Wei", "Olga", "Carlos", "Priya", "Tom", "Aiko"]
+LAST = ["Smith", "Garcia", "Nguyen", "Kowalski", "Okafor", "Brown", "Silva", "Khan", "Muller", "Rossi"]
+QUERIES = ("kowal", "smith 12345", "555-0199", "@example")
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    CACHE_TYPE = "NullCache"
+
+
+def seed(count):
+    rng = random.Random(0)
+    for start in range(0, count, CHUNK):
+        db.session.execute(insert(Customer), [
+            {
+                "name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+                "email": f"customer{i}@example.com",
+                "phone": f"555-{i % 10000:04d}",
+                "password": "x",
+            }
+            for i in range(start, min(start + CHUNK, count))
+        ])
+    db.session.commit()
+
+
+def like_scan(terms):
+    columns = (Customer.name, Customer.email, Customer.phone)
+    query = select(Customer.id).where(*(
+        or_(*(column.icontains(term, autoescape=True) for column in columns)) for term in terms
+    )).order_by(Customer.id).limit(50)
+    return db.session.execute(query).all()
+
+
+def fts(terms):
+    index = SEARCH_INDEXES["customers"]
+    query, rank = index.search(select(Customer.id), terms, "sqlite")
+    return db.session.execute(query.order_by(rank, Customer.id).limit(50)).all()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    app = create_app(BenchConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        start = time.perf_counter()
+        seed(count)
+        print(f"seeded and indexed {count:,} customers in {time.perf_counter() - start:.1f} s")
+
+        for q in QUERIES:
+            terms = q.split()
+            for label, function in (("LIKE scan", like_scan), ("FTS5", fts)):
+                best = min(timeit.repeat(lambda: function(terms), number=1, repeat=3))
+                print(f"{q!r:15} {label:9}: {best * 1000:9.2f} ms")
+
+    for q in QUERIES:
+        best = min(timeit.repeat(lambda: client.get("/search/customers", query_string={"q": q}), number=1, repeat=3))
+        print(f"GET /search/customers?q={q!r:15}: {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare marshmallow dumps against the precompiled FastSerializer path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serializers [tickets]
+"""
+import sys
+import timeit
+from datetime import date
+from sqlalchemy import select
+from app import create_app
+from app.extensions import db
+from app.models import Customer, Mechanic, Inventory, ServiceTicket
+from app.blueprints.service_ticket.schemas import (
+    service_tickets_schema,
+    service_tickets_serializer,
+    service_ticket_load_options,
+)
+from config import TestingConfig
+
+
+class BenchConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+def seed(tickets):
+    customers = [
+        Customer(name=f"Customer {i}", email=f"c{i}@example.com", phone="555", password="x")
+        for i in range(50)
+    ]
+    mechanics = [
+        Mechanic(name=f"Mechanic {i}", email=f"m{i}@example.com", phone="555", salary=50000)
+        for i in range(20)
+    ]
+    parts = [Inventory(name=f"Part {i}", price=9.99 + i, quantity=100) for i in range(40)]
+    db.session.add_all(customers + mechanics + parts)
+    db.session.flush()
+
+    for i in range(tickets):
+        ticket = ServiceTicket(
+            VIN=f"VIN{i:08d}",
+            service_date=date(2025, 1, 1),
+            service_desc="Routine service",
+            customer_id=customers[i % 50].id,
+        )
+        ticket.mechanics.extend([mechanics[i % 20], mechanics[(i + 7) % 20]])
+        ticket.parts.extend([parts[i % 40], parts[(i + 11) % 40], parts[(i + 23) % 40]])
+        db.session.add(ticket)
+
+    db.session.commit()
+
+
+def main():
+    tickets = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        seed(tickets)
+        rows = db.session.execute(
+            select(ServiceTicket).options(*service_ticket_load_options)
+        ).scalars().all()
+
+        assert service_tickets_schema.dump(rows) == service_tickets_serializer.dump(rows)
+
+        for label, dump in (
+            ("marshmallow", service_tickets_schema.dump),
+            ("fast", service_tickets_serializer.dump),
+        ):
+            runs = 5
+            best = min(timeit.repeat(lambda: dump(rows), number=1, repeat=runs))
+            print(f"{label:12} {tickets} tickets: {best * 1000:8.2f} ms "
+                  f"({best / tickets * 1e6:.1f} us/ticket)")
+
+
+if __name__ == "__main__":
+    main()
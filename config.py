@@ -1,19 +1,88 @@
 import os
+from app.utils.pool_monitor import MonitoredQueuePool
 
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+INSTANCE_DIR = os.path.join(BASE_DIR, "instance")
+REDIS_URL = os.environ.get("REDIS_URL")
+
+
+# Cache and rate-limit storage are shared by every worker: a file-system
+# cache and SQLite counters on a single node, Redis when REDIS_URL is set.
 class DevelopmentConfig:
     SQLALCHEMY_DATABASE_URI = "sqlite:///app.db"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": MonitoredQueuePool,
+        "pool_pre_ping": True,
+    }
     DEBUG = True
-    CACHE_TYPE = "SimpleCache"
+    CACHE_TYPE = "FileSystemCache"
+    CACHE_DIR = os.path.join(INSTANCE_DIR, "cache")
+    CACHE_THRESHOLD = 5000
     CACHE_DEFAULT_TIMEOUT = 300
+    CACHE_VIEW_TIMEOUT = 3600
+    RATELIMIT_STORAGE_URI = f"sqlite:///{INSTANCE_DIR}/ratelimit.db"
+    SLOW_QUERY_MS = 100
+    N_PLUS_ONE_THRESHOLD = 10
+    HEALTH_ENDPOINTS_ENABLED = True
 
 
 class TestingConfig:
     SQLALCHEMY_DATABASE_URI = "sqlite:///testing.db"
     DEBUG = True
     CACHE_TYPE = "SimpleCache"
+    RATELIMIT_STORAGE_URI = "memory://"
     SECRET_KEY = "TEST_SECRET_KEY"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    # Fail any test whose request repeats one statement more than 5 times
+    N_PLUS_ONE_THRESHOLD = 5
+    N_PLUS_ONE_RAISE = True
+    HEALTH_ENDPOINTS_ENABLED = True
 
 
 class ProductionConfig:
     SQLALCHEMY_DATABASE_URI = os.environ.get("SQLALCHEMY_DATABASE_URI")
-    CACHE_TYPE = "SimpleCache"
+    # Size pool_size + max_overflow per worker against Postgres max_connections
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": MonitoredQueuePool,
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": True,
+    }
+    CACHE_TYPE = os.environ.get("CACHE_TYPE", "RedisCache" if REDIS_URL else "FileSystemCache")
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(INSTANCE_DIR, "cache"))
+    CACHE_THRESHOLD = 5000
+    CACHE_VIEW_TIMEOUT = 3600
+    RATELIMIT_STORAGE_URI = os.environ.get(
+        "RATELIMIT_STORAGE_URI",
+        REDIS_URL or f"sqlite:///{INSTANCE_DIR}/ratelimit.db"
+    )
+    # Async views use this URL, or the sync one with the driver swapped
+    SQLALCHEMY_ASYNC_DATABASE_URI = os.environ.get("SQLALCHEMY_ASYNC_DATABASE_URI")
+    SQLALCHEMY_ASYNC_ENGINE_OPTIONS = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        "pool_pre_ping": True,
+    }
+    # /health/db reports pool internals; only enable behind an internal network
+    HEALTH_ENDPOINTS_ENABLED = os.environ.get("HEALTH_ENDPOINTS_ENABLED", "false").lower() in ("1", "true", "yes")
+    # Request latency / SQL / cache metrics on /metrics and Server-Timing
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Opt-in SQL diagnostics, off unless set
+    SLOW_QUERY_MS = float(os.environ["SLOW_QUERY_MS"]) if "SLOW_QUERY_MS" in os.environ else None
+    N_PLUS_ONE_THRESHOLD = int(os.environ["N_PLUS_ONE_THRESHOLD"]) if "N_PLUS_ONE_THRESHOLD" in os.environ else None
+    # gzip / br responses of at least this many bytes; off if a proxy compresses
+    COMPRESS_ENABLED = os.environ.get("COMPRESS_ENABLED", "true").lower() in ("1", "true", "yes")
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", 500))
+    # "jose" (default) or "pyjwt"; JWT_CACHE_SIZE=0 turns the verified-token cache off
+    JWT_BACKEND = os.environ.get("JWT_BACKEND", "jose")
+    JWT_CACHE_SIZE = int(os.environ.get("JWT_CACHE_SIZE", 1024))
+    # Changing the method rehashes each password on its owner's next login
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 4))
+    PASSWORD_HASH_QUEUE = int(os.environ.get("PASSWORD_HASH_QUEUE", 32))
+    # Threads for bulk-import hashing, kept apart from the login pool
+    PASSWORD_HASH_BULK_WORKERS = int(os.environ.get("PASSWORD_HASH_BULK_WORKERS", 1))
+    AUTO_ASSIGN_RATE_LIMIT = os.environ.get("AUTO_ASSIGN_RATE_LIMIT", "120 per minute")
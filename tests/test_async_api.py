@@ -0,0 +1,91 @@
+import unittest
+from datetime import date
+from app import create_app
+from app.extensions import db, async_db
+from app.models import Customer, Mechanic, Inventory, ServiceTicket
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class TestAsyncApi(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customer = Customer(name="Test User", email="test@example.com", password="x", phone="111")
+            mechanic = Mechanic(name="Mechanic", email="m@example.com", phone="222", salary=50000)
+            part = Inventory(name="Brake Pads", price=120.00, quantity=5)
+            db.session.add_all([customer, mechanic, part])
+            db.session.flush()
+
+            for i in range(5):
+                ticket = ServiceTicket(
+                    VIN=f"VIN{i}",
+                    service_date=date(2025, 1, i + 1),
+                    service_desc="Service",
+                    customer_id=customer.id
+                )
+                ticket.mechanics.append(mechanic)
+                ticket.parts.append(part)
+                db.session.add(ticket)
+
+            db.session.commit()
+
+            self.part_id = part.id
+            self.token = encode_token(customer.id)
+
+    def tearDown(self):
+        async_db.dispose(self.app)
+
+    def auth_header(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def assert_same(self, path, headers=None):
+        sync = self.client.get(path, headers=headers)
+        async_ = self.client.get(f"/async{path}", headers=headers)
+
+        self.assertEqual(async_.status_code, sync.status_code)
+        self.assertEqual(async_.json, sync.json)
+        return async_
+
+# Async views return the same payloads as the sync ones
+    def test_service_tickets(self):
+        self.assert_same("/service-tickets")
+        self.assert_same("/service-tickets?order=-service_date&fields=id,VIN&include=mechanics")
+        self.assert_same("/service-tickets?from=2025-01-02&to=2025-01-03")
+        self.assert_same("/service-tickets/my-tickets", self.auth_header())
+
+    def test_inventory(self):
+        self.assert_same("/inventory", self.auth_header())
+        self.assert_same(f"/inventory/{self.part_id}", self.auth_header())
+
+# Keyset pagination and counts
+    def test_service_tickets_paginated(self):
+        response = self.client.get("/async/service-tickets?limit=2&count=true")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Total-Count"], "5")
+        self.assertEqual([t["VIN"] for t in response.json], ["VIN0", "VIN1"])
+
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(f"/async/service-tickets?limit=2&after={cursor}")
+        self.assertEqual([t["VIN"] for t in response.json], ["VIN2", "VIN3"])
+
+    # Invalid requests
+    def test_invalid(self):
+        self.assertEqual(self.client.get("/async/service-tickets?page=1").status_code, 400)
+        self.assertEqual(self.client.get("/async/service-tickets?order=VIN").status_code, 400)
+        self.assertEqual(self.client.get("/async/service-tickets?sort=nope").status_code, 400)
+        self.assertEqual(self.client.get("/async/inventory").status_code, 401)
+
+        response = self.client.get("/async/inventory/9999", headers=self.auth_header())
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
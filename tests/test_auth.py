@@ -0,0 +1,144 @@
+import time
+import unittest
+from unittest import mock
+from app import create_app
+from app.extensions import db
+from app.models import Customer
+from app.utils import auth
+from app.utils.auth import encode_token, decode_token, token_cache, TokenCache, TokenExpired, TokenError
+from config import TestingConfig
+
+
+class TestAuth(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        token_cache.clear()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customer = Customer(
+                name="Test User",
+                email="test@example.com",
+                password="test1234",
+                phone="111-111-1111"
+            )
+            db.session.add(customer)
+            db.session.commit()
+
+            self.customer_id = customer.id
+            self.token = encode_token(self.customer_id)
+
+    def count_decodes(self, backend="jose"):
+        encode, decode = auth.BACKENDS[backend]
+        counter = mock.Mock(side_effect=decode)
+        return counter, mock.patch.dict(auth.BACKENDS, {backend: (encode, counter)})
+
+# Verified tokens are cached
+    def test_token_cache_hit(self):
+        counter, patch = self.count_decodes()
+
+        with patch:
+            for _ in range(3):
+                response = self.client.get(
+                    "/service-tickets/my-tickets",
+                    headers={"Authorization": f"Bearer {self.token}"}
+                )
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(counter.call_count, 1)
+        self.assertEqual(len(token_cache), 1)
+
+    def test_token_cache_disabled(self):
+        self.app.config["JWT_CACHE_SIZE"] = 0
+        counter, patch = self.count_decodes()
+
+        with patch, self.app.app_context():
+            decode_token(self.token)
+            decode_token(self.token)
+
+        self.assertEqual(counter.call_count, 2)
+        self.assertEqual(len(token_cache), 0)
+
+# Cached tokens still expire
+    def test_token_cache_honors_exp(self):
+        with self.app.app_context():
+            payload = decode_token(self.token)
+            key = TokenCache.key(self.token, self.app.config["SECRET_KEY"])
+
+            with mock.patch("app.utils.auth.time.time", return_value=payload["exp"] + 1):
+                self.assertIsNone(token_cache.get(key))
+
+        self.assertEqual(len(token_cache), 0)
+
+    def test_expired_token(self):
+        with self.app.app_context():
+            expired = auth.jwt.encode(
+                {"customer_id": self.customer_id, "exp": int(time.time()) - 10},
+                self.app.config["SECRET_KEY"],
+                algorithm="HS256"
+            )
+
+        response = self.client.get(
+            "/service-tickets/my-tickets",
+            headers={"Authorization": f"Bearer {expired}"}
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json["error"], "Token expired")
+
+    def test_token_cache_evicts_oldest(self):
+        cache = TokenCache(maxsize=2)
+        for i in range(3):
+            cache.set(i, {"customer_id": i})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.get(2), {"customer_id": 2})
+
+# A different secret never hits another secret's entry
+    def test_token_cache_keyed_by_secret(self):
+        with self.app.app_context():
+            decode_token(self.token)
+            self.app.config["SECRET_KEY"] = "ROTATED"
+
+            with self.assertRaises(TokenError):
+                decode_token(self.token)
+
+# PyJWT backend
+    def test_pyjwt_backend(self):
+        self.app.config["JWT_BACKEND"] = "pyjwt"
+
+        with self.app.app_context():
+            token = encode_token(self.customer_id)
+            token_cache.clear()
+            self.assertEqual(decode_token(token)["customer_id"], self.customer_id)
+
+            # Tokens from either backend verify with the other
+            token_cache.clear()
+            self.assertEqual(decode_token(self.token)["customer_id"], self.customer_id)
+
+            with self.assertRaises(TokenError):
+                decode_token(token[:-2] + "xx")
+
+            expired = auth.pyjwt.encode(
+                {"customer_id": 1, "exp": int(time.time()) - 10},
+                self.app.config["SECRET_KEY"],
+                algorithm="HS256"
+            )
+            with self.assertRaises(TokenExpired):
+                decode_token(expired)
+
+    def test_invalid_token(self):
+        response = self.client.get(
+            "/service-tickets/my-tickets",
+            headers={"Authorization": f"Bearer {self.token[:-2]}xx"}
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json["error"], "Invalid token")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import gzip
+import json
+import unittest
+import brotli
+from app import create_app
+from app.extensions import db
+from app.models import Customer, ServiceTicket
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class CompressionDisabledConfig(TestingConfig):
+    COMPRESS_ENABLED = False
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customer = Customer(name="Test User", email="test@example.com", password="x", phone="111")
+            db.session.add(customer)
+            db.session.commit()
+            self.customer_id = customer.id
+
+            for i in range(20):
+                db.session.add(ServiceTicket(
+                    VIN=f"VIN{i:05d}",
+                    service_desc="Oil change and tire rotation",
+                    customer_id=self.customer_id
+                ))
+            db.session.commit()
+
+            self.token = encode_token(self.customer_id)
+
+    def auth_header(self, **headers):
+        return {"Authorization": f"Bearer {self.token}", **headers}
+
+# gzip
+    def test_gzip(self):
+        plain = self.client.get("/service-tickets")
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(int(response.headers["Content-Length"]), len(response.get_data()))
+        self.assertLess(len(response.get_data()), len(plain.get_data()))
+        self.assertEqual(json.loads(gzip.decompress(response.get_data())), plain.json)
+
+# br is preferred, q-values are honored
+    def test_brotli(self):
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "gzip, br"})
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+        self.assertEqual(len(json.loads(brotli.decompress(response.get_data()))), 20)
+
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "gzip;q=1.0, br;q=0.5"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+    # Small bodies and unsupported encodings stay plain
+    def test_not_compressed(self):
+        response = self.client.get("/service-tickets/9999", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response.headers)
+
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "deflate"})
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("Content-Encoding", response.headers)
+
+# Streamed export is compressed chunk by chunk
+    def test_streamed_export(self):
+        self.app.config["EXPORT_BATCH_SIZE"] = 5
+
+        response = self.client.get(
+            "/service-tickets/export",
+            headers=self.auth_header(**{"Accept-Encoding": "gzip"})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", response.headers)
+
+        lines = gzip.decompress(response.get_data()).decode().splitlines()
+        self.assertEqual(len(lines), 20)
+        self.assertEqual(json.loads(lines[0])["VIN"], "VIN00000")
+
+# Compressed responses get a weak ETag that still revalidates
+    def test_weak_etag(self):
+        response = self.client.get("/service-tickets", headers={"Accept-Encoding": "gzip"})
+        etag = response.headers["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        response = self.client.get(
+            "/service-tickets",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+# Compact JSON
+    def test_compact_json(self):
+        self.app.debug = True
+        body = self.client.get("/service-tickets").get_data(as_text=True)
+        self.assertNotIn("\n", body)
+        self.assertNotIn(": ", body)
+
+    # Disabled compression installs nothing
+    def test_compression_disabled(self):
+        client = create_app(CompressionDisabledConfig).test_client()
+        response = client.get("/service-tickets", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
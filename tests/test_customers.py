@@ -1,8 +1,11 @@
+import threading
+import time
 import unittest
 from app import create_app
 from app.extensions import db
 from app.models import Customer
 from app.utils.auth import encode_token
+from app.utils.passwords import hasher, is_hashed
 from config import TestingConfig
 
 
@@ -45,6 +48,14 @@ class TestCustomer(unittest.TestCase):
 
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json["name"], "New User")
+        self.assertNotIn("password", response.json)
+
+        with self.app.app_context():
+            stored = db.session.get(Customer, response.json["id"]).password
+            self.assertTrue(stored.startswith("pbkdf2:sha256:1000$"))
+
+        response = self.client.post("/customers/login", json={"email": "new@example.com", "password": "password"})
+        self.assertEqual(response.status_code, 200)
 
     # Create customer (invalid)
     def test_create_invalid(self):
@@ -77,6 +88,88 @@ class TestCustomer(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertEqual(response.json["error"], "Invalid email or password")
 
+        payload = {"email": "tuser@example.com", "password": "wrong"}
+        response = self.client.post("/customers/login", json=payload)
+        self.assertEqual(response.status_code, 401)
+
+    # Plaintext and old-method passwords are rehashed on login
+    def test_login_rehash(self):
+        payload = {"email": "tuser@example.com", "password": "password123"}
+
+        self.assertEqual(self.client.post("/customers/login", json=payload).status_code, 200)
+        with self.app.app_context():
+            first = db.session.get(Customer, self.customer_id).password
+        self.assertTrue(first.startswith("pbkdf2:sha256:1000$"))
+
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+        self.assertEqual(self.client.post("/customers/login", json=payload).status_code, 200)
+        with self.app.app_context():
+            second = db.session.get(Customer, self.customer_id).password
+        self.assertTrue(second.startswith("pbkdf2:sha256:2000$"))
+
+        self.assertEqual(self.client.post("/customers/login", json=payload).status_code, 200)
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Customer, self.customer_id).password, second)
+
+    # Login is rejected with 503 when the hashing queue is full
+    def test_login_busy(self):
+        self.app.config["PASSWORD_HASH_QUEUE"] = 1
+        self.app.config["PASSWORD_HASH_WAIT"] = 0.01
+
+        with self.app.app_context():
+            _, slots, _ = hasher._pool()
+
+        slots.acquire()
+        try:
+            payload = {"email": "tuser@example.com", "password": "password123"}
+            response = self.client.post("/customers/login", json=payload)
+        finally:
+            slots.release()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+    # A bulk import hashing in the background does not hold up logins
+    def test_login_during_bulk_import(self):
+        self.app.config["PASSWORD_HASH_WORKERS"] = 1
+        self.app.config["PASSWORD_HASH_QUEUE"] = 1
+        self.app.config["PASSWORD_HASH_WAIT"] = 0.5
+
+        with self.app.app_context():
+            _, _, bulk_executor = hasher._pool()
+
+        # Keep the bulk executor busy so the import stays mid-hash
+        release = threading.Event()
+        bulk_executor.submit(release.wait)
+
+        rows = [
+            {"name": f"Bulk {i}", "email": f"bulk{i}@example.com", "phone": str(i), "password": "pw"}
+            for i in range(50)
+        ]
+        results = []
+        bulk = threading.Thread(
+            target=lambda: results.append(self.app.test_client().post("/customers/bulk", json=rows))
+        )
+        bulk.start()
+
+        try:
+            # Wait until the import's hashes are queued behind the blocker
+            deadline = time.monotonic() + 5
+            while bulk_executor._work_queue.qsize() < len(rows) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(bulk_executor._work_queue.qsize(), len(rows))
+
+            payload = {"email": "tuser@example.com", "password": "password123"}
+            response = self.client.post("/customers/login", json=payload)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(bulk.is_alive())
+        finally:
+            release.set()
+            bulk.join()
+
+        self.assertEqual(results[0].status_code, 201)
+        self.assertEqual(results[0].json["created"], 50)
+
 # Get all customers
     def test_get_all_customers(self):
         response = self.client.get("/customers")
@@ -138,3 +231,41 @@ class TestCustomer(unittest.TestCase):
 
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json["error"], "Customer not found.")
+
+# Bulk import customers
+    def test_bulk_create_customers(self):
+        payload = [
+            {"name": "Bulk One", "email": "bulk1@example.com", "phone": "1", "password": "pw"},
+            {"name": "Bulk Two", "email": "bulk2@example.com", "phone": "2", "password": "pw"},
+        ]
+
+        response = self.client.post("/customers/bulk", json=payload)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json, {"created": 2, "errors": {}})
+
+        response = self.client.get("/customers")
+        self.assertEqual(len(response.json), 3)
+
+        with self.app.app_context():
+            stored = db.session.execute(db.select(Customer.password).where(Customer.email.like("bulk%"))).scalars()
+            self.assertTrue(all(is_hashed(password) for password in stored))
+
+    # Bulk import customers (invalid rows reported per row)
+    def test_bulk_create_customers_invalid(self):
+        payload = [
+            {"name": "Valid", "email": "valid@example.com", "phone": "1", "password": "pw"},
+            {"name": "Taken", "email": "tuser@example.com", "phone": "1", "password": "pw"},
+            {"name": "Repeat", "email": "valid@example.com", "phone": "1", "password": "pw"},
+            {"name": "No Password", "email": "nopw@example.com", "phone": "1"},
+        ]
+
+        response = self.client.post("/customers/bulk", json=payload)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json["created"], 1)
+        self.assertEqual(sorted(response.json["errors"]), ["1", "2", "3"])
+        self.assertIn("password", response.json["errors"]["3"])
+
+        response = self.client.post("/customers/bulk", json={"name": "Not a list"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,84 @@
+import unittest
+from flask import jsonify
+from sqlalchemy import select, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import selectinload
+from app import create_app
+from app.extensions import db
+from app.models import Customer, ServiceTicket
+from app.utils import query_hooks
+from app.utils.diagnostics import NPlusOneDetected
+from config import TestingConfig
+
+
+class TestDiagnostics(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        # Test-only views: one loads tickets lazily per customer, one eagerly
+        def ticket_counts(options):
+            customers = db.session.execute(select(Customer).options(*options)).scalars().all()
+            return jsonify({customer.id: len(customer.service_tickets) for customer in customers})
+
+        self.app.add_url_rule("/lazy-tickets", "lazy_tickets", lambda: ticket_counts(()))
+        self.app.add_url_rule(
+            "/eager-tickets", "eager_tickets",
+            lambda: ticket_counts((selectinload(Customer.service_tickets),))
+        )
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            for i in range(10):
+                customer = Customer(name=f"C{i}", email=f"c{i}@example.com", password="x", phone="1")
+                customer.service_tickets.append(ServiceTicket(VIN=f"VIN{i}"))
+                db.session.add(customer)
+            db.session.commit()
+
+# N+1 detection
+    def test_n_plus_one_raises(self):
+        with self.assertRaises(NPlusOneDetected) as caught:
+            self.client.get("/lazy-tickets")
+
+        self.assertIn("lazy_tickets", str(caught.exception))
+        self.assertIn("10x", str(caught.exception))
+
+    def test_eager_load_passes(self):
+        response = self.client.get("/eager-tickets")
+        self.assertEqual(response.status_code, 200)
+
+    def test_n_plus_one_logged(self):
+        self.app.config["N_PLUS_ONE_RAISE"] = False
+
+        with self.assertLogs(self.app.logger, "WARNING") as logs:
+            response = self.client.get("/lazy-tickets")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Possible N+1 in lazy_tickets", logs.output[0])
+
+# Slow query log
+    def test_slow_query_logged(self):
+        self.app.config["SLOW_QUERY_MS"] = 0
+
+        with self.assertLogs(self.app.logger, "WARNING") as logs:
+            self.client.get("/customers?filter[name]=C1")
+
+        slow = [line for line in logs.output if "Slow query" in line]
+        self.assertTrue(slow)
+        self.assertIn("customer_bp.get_customers", slow[0])
+        self.assertIn("'C1'", slow[0])
+
+# Metrics and diagnostics share one timing listener
+    def test_single_query_listener(self):
+        self.assertTrue(event.contains(Engine, "before_cursor_execute", query_hooks._before_cursor_execute))
+        self.assertEqual(
+            {callback.__module__ for callback in query_hooks._callbacks},
+            {"app.utils.metrics", "app.utils.diagnostics"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
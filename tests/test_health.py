@@ -0,0 +1,68 @@
+import unittest
+from app import create_app
+from app.extensions import db
+from app.utils.pool_monitor import MonitoredQueuePool
+from config import TestingConfig
+
+
+class TestHealth(unittest.TestCase):
+
+    def setUp(self):
+        class PooledConfig(TestingConfig):
+            SQLALCHEMY_ENGINE_OPTIONS = {
+                "poolclass": MonitoredQueuePool,
+                "pool_size": 2,
+                "max_overflow": 1,
+                "pool_timeout": 1,
+            }
+
+        self.app = create_app(PooledConfig)
+        self.client = self.app.test_client()
+
+# Database health
+    def test_db_health(self):
+        response = self.client.get("/health/db")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["status"], "ok")
+
+        pool = response.json["pool"]
+        self.assertEqual(pool["class"], "MonitoredQueuePool")
+        self.assertEqual(pool["size"], 2)
+        self.assertEqual(pool["max_overflow"], 1)
+        self.assertGreaterEqual(pool["checkouts"], 1)
+        self.assertIn("avg_wait_ms", pool)
+
+    # The pool logs under sqlalchemy, not Flask's debug-level "app" logger
+    def test_pool_logger_name(self):
+        with self.app.app_context():
+            self.assertEqual(db.engine.pool.logger.name, "sqlalchemy.pool.impl.QueuePool")
+
+    # Pool exhaustion is counted as a timeout
+    def test_db_health_pool_timeout(self):
+        with self.app.app_context():
+            engine = db.engine
+            held = [engine.connect() for _ in range(3)]
+
+            try:
+                response = self.client.get("/health/db")
+            finally:
+                for conn in held:
+                    conn.close()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json["pool"]["timeouts"], 1)
+        self.assertEqual(response.json["pool"]["checked_out"], 3)
+
+    # Refused unless health endpoints are enabled
+    def test_db_health_disabled(self):
+        self.app.config["HEALTH_ENDPOINTS_ENABLED"] = False
+
+        response = self.client.get("/health/db")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("pool", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import time
 import unittest
+from unittest import mock
 from app import create_app
 from app.extensions import db
 from app.models import Customer, Inventory
+from app.utils import caching
 from app.utils.auth import encode_token
 from config import TestingConfig
 
@@ -81,6 +84,60 @@ class TestInventory(unittest.TestCase):
         self.assertIsInstance(response.json, list)
         self.assertGreaterEqual(len(response.json), 1)
 
+    # Conditional GET returns 304 until inventory changes
+    def test_get_inventory_not_modified(self):
+        response = self.client.get("/inventory", headers=self.auth_header())
+        etag = response.headers["ETag"]
+
+        response = self.client.get("/inventory", headers={**self.auth_header(), "If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+        # Last-Modified is sent once the second of the last write is over
+        with mock.patch.object(caching, "_now", return_value=time.time() + 2):
+            last_modified = self.client.get("/inventory", headers=self.auth_header()).headers["Last-Modified"]
+
+            response = self.client.get(
+                "/inventory", headers={**self.auth_header(), "If-Modified-Since": last_modified}
+            )
+            self.assertEqual(response.status_code, 304)
+
+        self.client.put(
+            f"/inventory/{self.part_id}",
+            json={"price": 19.99},
+            headers=self.auth_header()
+        )
+
+        response = self.client.get("/inventory", headers={**self.auth_header(), "If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.json[0]["price"], 19.99)
+
+    # A second write within the same second is not hidden by If-Modified-Since
+    def test_last_modified_same_second(self):
+        second = float(int(time.time()))
+
+        def update(price):
+            response = self.client.put(
+                f"/inventory/{self.part_id}", json={"price": price}, headers=self.auth_header()
+            )
+            self.assertEqual(response.status_code, 200)
+
+        with mock.patch.object(caching, "_now", return_value=second + 0.1):
+            update(10.0)
+            response = self.client.get("/inventory", headers=self.auth_header())
+            self.assertNotIn("Last-Modified", response.headers)
+
+        with mock.patch.object(caching, "_now", return_value=second + 1.5):
+            last_modified = self.client.get("/inventory", headers=self.auth_header()).headers["Last-Modified"]
+
+            update(20.0)
+            response = self.client.get(
+                "/inventory", headers={**self.auth_header(), "If-Modified-Since": last_modified}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json[0]["price"], 20.0)
+
 # Get inventory item by ID
     def test_get_inventory_item_by_id(self):
         response = self.client.get(
@@ -153,5 +210,94 @@ class TestInventory(unittest.TestCase):
         self.assertEqual(response.json["error"], "Part not found")
 
 
+# Bulk import inventory items (CSV body)
+    def test_bulk_create_inventory_csv(self):
+        csv_data = "name,price,quantity\nRotor,80.00,4\nWiper,12.50,\n"
+
+        response = self.client.post(
+            "/inventory/bulk",
+            data=csv_data,
+            content_type="text/csv",
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json["created"], 2)
+
+    # Bulk import inventory items (invalid)
+    def test_bulk_create_inventory_invalid(self):
+        response = self.client.post(
+            "/inventory/bulk",
+            json=[{"name": "No Price"}],
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json["created"], 0)
+        self.assertIn("price", response.json["errors"]["0"])
+
+# Low-stock parts
+    def test_low_stock(self):
+        with self.app.app_context():
+            db.session.add_all([
+                Inventory(name="Spark Plug", price=5.0, quantity=3, reorder_threshold=5),
+                Inventory(name="Wiper", price=15.0, quantity=20, reorder_threshold=5),
+            ])
+            db.session.commit()
+
+        response = self.client.get("/inventory/low-stock", headers=self.auth_header())
+
+        self.assertEqual(response.status_code, 200)
+        # The setUp part has no stock and the default threshold of 0
+        self.assertEqual([p["name"] for p in response.json], ["Oil Filter", "Spark Plug"])
+
+    # Low-stock parts (invalid)
+    def test_low_stock_invalid(self):
+        response = self.client.get("/inventory/low-stock")
+        self.assertEqual(response.status_code, 401)
+
+        response = self.client.put(
+            f"/inventory/{self.part_id}",
+            json={"reorder_threshold": -1},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 400)
+
+# Threshold crossings feed the event log
+    def test_inventory_events(self):
+        def update(**data):
+            response = self.client.put(f"/inventory/{self.part_id}", json=data, headers=self.auth_header())
+            self.assertEqual(response.status_code, 200)
+
+        update(quantity=10, reorder_threshold=4)
+        update(quantity=8)
+        update(quantity=4)
+
+        response = self.client.get("/inventory/events", headers=self.auth_header())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(e["kind"], e["quantity"], e["reorder_threshold"]) for e in response.json],
+            [("restocked", 10, 4), ("low_stock", 4, 4)]
+        )
+
+        # Nothing new after the watermark until the next crossing
+        watermark = response.headers["X-Last-Event-Id"]
+        response = self.client.get(f"/inventory/events?since={watermark}", headers=self.auth_header())
+        self.assertEqual(response.json, [])
+        self.assertEqual(response.headers["X-Last-Event-Id"], watermark)
+
+        # Lowering the threshold alone can cross it too
+        update(reorder_threshold=1)
+        response = self.client.get(f"/inventory/events?since={watermark}", headers=self.auth_header())
+        self.assertEqual([e["kind"] for e in response.json], ["restocked"])
+        self.assertEqual(response.json[0]["inventory_id"], self.part_id)
+
+    # Inventory events (invalid)
+    def test_inventory_events_invalid(self):
+        for url in ("/inventory/events?since=abc", "/inventory/events?limit=x", "/inventory/events?limit=0"):
+            with self.subTest(url=url):
+                response = self.client.get(url, headers=self.auth_header())
+                self.assertEqual(response.status_code, 400)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
+import io
 import unittest
+from datetime import date
 from app import create_app
 from app.extensions import db
-from app.models import Mechanic
+from app.models import Customer, Mechanic, ServiceTicket
 from config import TestingConfig
 
 
@@ -60,6 +62,41 @@ class TestMechanic(unittest.TestCase):
         self.assertIsInstance(response.json, list)
         self.assertGreaterEqual(len(response.json), 1)
 
+    # Conditional GET returns 304 until mechanics change
+    def test_get_mechanics_not_modified(self):
+        etag = self.client.get("/mechanics").headers["ETag"]
+
+        response = self.client.get("/mechanics", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        response = self.client.get("/mechanics?fields=id", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+
+        self.client.delete(f"/mechanics/{self.mechanic_id}")
+        response = self.client.get("/mechanics", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [])
+
+    # A cache that keeps no version tokens gets no validators and no 304s
+    def test_conditional_without_cache_backend(self):
+        class NullCacheConfig(TestingConfig):
+            CACHE_TYPE = "NullCache"
+
+        with self.assertWarns(UserWarning):
+            client = create_app(NullCacheConfig).test_client()
+
+        response = client.get("/mechanics")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+        self.assertNotIn("Last-Modified", response.headers)
+
+        client.put(f"/mechanics/{self.mechanic_id}", json={"name": "Renamed"})
+
+        response = client.get("/mechanics", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json[0]["name"], "Renamed")
+
 # Get mechanic by ID
     def test_get_mechanic_by_id(self):
         response = self.client.get(f"/mechanics/{self.mechanic_id}")
@@ -121,3 +158,77 @@ class TestMechanic(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertIsInstance(response.json, list)
+
+    # Most active mechanic (ranked with ticket counts)
+    def test_most_active_mechanic_ranking(self):
+        with self.app.app_context():
+            customer = Customer(
+                name="Ranked Customer",
+                email="ranked@example.com",
+                phone="000-000-0000",
+                password="password"
+            )
+            busy = Mechanic(
+                name="Busy Mechanic",
+                email="busy@example.com",
+                phone="222-333-4444",
+                salary=60000
+            )
+            db.session.add_all([customer, busy])
+            db.session.flush()
+
+            for day in (date(2025, 1, 5), date(2025, 2, 5)):
+                ticket = ServiceTicket(
+                    VIN="RANK123",
+                    service_date=day,
+                    service_desc="Oil change",
+                    customer_id=customer.id
+                )
+                ticket.mechanics.append(busy)
+                db.session.add(ticket)
+
+            db.session.commit()
+            busy_id = busy.id
+
+        response = self.client.get("/mechanics/most-active?limit=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [
+            {"id": busy_id, "name": "Busy Mechanic", "ticket_count": 2}
+        ])
+
+        response = self.client.get("/mechanics/most-active?from=2025-02-01")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json[0]["ticket_count"], 1)
+        self.assertEqual(response.json[1]["ticket_count"], 0)
+
+    # Most active mechanic (invalid)
+    def test_most_active_mechanic_invalid(self):
+        response = self.client.get("/mechanics/most-active?from=yesterday")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/mechanics/most-active?limit=0")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/mechanics/most-active?limit=abc")
+        self.assertEqual(response.status_code, 400)
+
+# Bulk import mechanics (CSV upload)
+    def test_bulk_create_mechanics_csv(self):
+        csv_data = (
+            "name,email,phone,salary\n"
+            "CSV One,csv1@example.com,111,50000\n"
+            "CSV Two,csv2@example.com,222,52000\n"
+            "CSV Three,john@example.com,333,51000\n"
+        )
+
+        response = self.client.post(
+            "/mechanics/bulk",
+            data={"file": (io.BytesIO(csv_data.encode()), "mechanics.csv")},
+            content_type="multipart/form-data"
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json["created"], 2)
+        self.assertEqual(list(response.json["errors"]), ["2"])
@@ -0,0 +1,71 @@
+import unittest
+from app import create_app
+from app.extensions import db
+from app.models import Customer
+from config import TestingConfig
+
+
+class MetricsDisabledConfig(TestingConfig):
+    METRICS_ENABLED = False
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            db.session.add(Customer(name="Test User", email="test@example.com", password="x", phone="111"))
+            db.session.commit()
+
+# Server-Timing header
+    def test_server_timing(self):
+        response = self.client.get("/customers")
+
+        timing = response.headers["Server-Timing"]
+        self.assertIn("app;dur=", timing)
+        self.assertIn('db;dur=', timing)
+        self.assertIn('desc="2 queries"', timing)
+        self.assertIn('cache;desc="miss"', timing)
+
+        response = self.client.get("/customers")
+        self.assertIn('desc="0 queries"', response.headers["Server-Timing"])
+        self.assertIn('cache;desc="hit"', response.headers["Server-Timing"])
+
+# Prometheus text on /metrics
+    def test_metrics_endpoint(self):
+        self.client.get("/customers")
+        self.client.get("/customers")
+        self.client.get("/customers/9999")
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+
+        body = response.get_data(as_text=True)
+        labels = 'endpoint="customer_bp.get_customers",method="GET",status="200"'
+        self.assertIn(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', body)
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 2", body)
+        self.assertIn('status="404"', body)
+        self.assertIn('http_request_db_queries_total{endpoint="customer_bp.get_customers",method="GET"} 2', body)
+        self.assertIn('cache_requests_total{result="hit"} 1', body)
+        self.assertIn('cache_requests_total{result="miss"} 2', body)
+
+    # Disabled metrics install nothing
+    def test_metrics_disabled(self):
+        app = create_app(MetricsDisabledConfig)
+        client = app.test_client()
+
+        response = client.get("/customers")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response.headers)
+        self.assertNotIn("metrics", app.extensions)
+        self.assertEqual(client.get("/metrics").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
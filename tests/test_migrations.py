@@ -0,0 +1,154 @@
+import unittest
+from datetime import date
+from sqlalchemy import select, text, inspect, delete
+from app import create_app, migrations
+from app.extensions import db
+from app.models import ServiceTicket, Inventory, Mechanic, service_mechanics, service_ticket_inventory
+from app.migrations.v0001_lookup_indexes import INDEXES
+from app.migrations.v0002_service_date_type import normalize
+from config import TestingConfig
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+    def query_plan(self, statement):
+        with self.app.app_context():
+            compiled = statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+            rows = db.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+            return " | ".join(row[-1] for row in rows)
+
+# Hot queries use the lookup indexes
+    def test_hot_queries_use_indexes(self):
+        cases = {
+            "ix_service_tickets_customer_id":
+                select(ServiceTicket).where(ServiceTicket.customer_id == 1),
+            "ix_service_tickets_VIN":
+                select(ServiceTicket).where(ServiceTicket.VIN == "1HGCM82633A004352"),
+            "ix_service_tickets_service_date":
+                select(ServiceTicket).where(ServiceTicket.service_date >= date(2025, 1, 1)),
+            "ix_inventory_name":
+                select(Inventory).where(Inventory.name == "Brake Pads"),
+            "ix_service_mechanics_mechanic_id":
+                select(service_mechanics.c.ticket_id).where(service_mechanics.c.mechanic_id == 1),
+            "ix_service_ticket_inventory_inventory_id":
+                select(service_ticket_inventory.c.ticket_id).where(service_ticket_inventory.c.inventory_id == 1),
+        }
+
+        for index, statement in cases.items():
+            with self.subTest(index=index):
+                self.assertIn(index, self.query_plan(statement))
+
+# Upgrading an old database adds the indexes
+    def test_upgrade_adds_missing_indexes(self):
+        with self.app.app_context():
+            engine = db.engine
+
+            with engine.begin() as conn:
+                for name, _, _ in INDEXES:
+                    conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+                conn.execute(delete(migrations.schema_migrations))
+
+            self.assertNotIn(
+                "ix_service_tickets_customer_id",
+                [index["name"] for index in inspect(engine).get_indexes("service_tickets")]
+            )
+
+            migrations.upgrade(engine)
+
+            for name, table, _ in INDEXES:
+                self.assertIn(name, [index["name"] for index in inspect(engine).get_indexes(table)])
+
+            self.assertEqual(
+                migrations.applied_versions(engine),
+                {version for version, _, _ in migrations.migrations()}
+            )
+
+    # Running upgrade again is a no-op
+    def test_upgrade_idempotent(self):
+        with self.app.app_context():
+            migrations.upgrade(db.engine)
+            migrations.upgrade(db.engine)
+
+            self.assertIn(1, migrations.applied_versions(db.engine))
+
+
+# Upgrading adds quantity to existing ticket parts
+    def test_upgrade_adds_part_quantity(self):
+        with self.app.app_context():
+            engine = db.engine
+
+            with engine.begin() as conn:
+                conn.execute(text("DROP TABLE service_ticket_inventory"))
+                conn.execute(text(
+                    "CREATE TABLE service_ticket_inventory ("
+                    "ticket_id INTEGER NOT NULL, inventory_id INTEGER NOT NULL, "
+                    "PRIMARY KEY (ticket_id, inventory_id))"
+                ))
+                conn.execute(text("INSERT INTO service_ticket_inventory VALUES (1, 1)"))
+                conn.execute(delete(migrations.schema_migrations))
+
+            migrations.upgrade(engine)
+
+            with engine.connect() as conn:
+                self.assertEqual(
+                    conn.execute(select(service_ticket_inventory.c.quantity)).scalar_one(), 1
+                )
+
+# Upgrading adds and backfills mechanic ticket loads
+    def test_upgrade_adds_ticket_load(self):
+        with self.app.app_context():
+            engine = db.engine
+
+            with engine.begin() as conn:
+                conn.execute(text("INSERT INTO mechanics (id, name, email, phone, salary) VALUES (1, 'A', 'a@x.com', '1', 1), (2, 'B', 'b@x.com', '2', 1)"))
+                conn.execute(text("INSERT INTO service_mechanics VALUES (1, 1), (2, 1)"))
+                conn.execute(text('DROP INDEX "ix_mechanics_ticket_load"'))
+                conn.execute(text("ALTER TABLE mechanics DROP COLUMN ticket_load"))
+                conn.execute(delete(migrations.schema_migrations))
+
+            migrations.upgrade(engine)
+
+            with engine.connect() as conn:
+                loads = conn.execute(select(Mechanic.id, Mechanic.ticket_load).order_by(Mechanic.id)).all()
+                self.assertEqual([tuple(row) for row in loads], [(1, 2), (2, 0)])
+
+        plan = self.query_plan(select(Mechanic.id).order_by(Mechanic.ticket_load, Mechanic.id).limit(1))
+        self.assertIn("ix_mechanics_ticket_load", plan)
+
+# Upgrading adds reorder thresholds and the low-stock index
+    def test_upgrade_adds_reorder_threshold(self):
+        with self.app.app_context():
+            engine = db.engine
+
+            with engine.begin() as conn:
+                conn.execute(text("INSERT INTO inventory (id, name, price, quantity) VALUES (1, 'Pads', 10, 0)"))
+                conn.execute(text('DROP INDEX "ix_inventory_low_stock"'))
+                conn.execute(text("ALTER TABLE inventory DROP COLUMN reorder_threshold"))
+                conn.execute(delete(migrations.schema_migrations))
+
+            migrations.upgrade(engine)
+
+            with engine.connect() as conn:
+                self.assertEqual(conn.execute(select(Inventory.reorder_threshold)).scalar_one(), 0)
+
+        plan = self.query_plan(select(Inventory.id).where(Inventory.quantity <= Inventory.reorder_threshold))
+        self.assertIn("ix_inventory_low_stock", plan)
+
+# Free-text service dates are normalized to ISO dates
+    def test_normalize_service_date(self):
+        self.assertEqual(normalize("2025-01-05"), "2025-01-05")
+        self.assertEqual(normalize("2025-01-05 09:30:00"), "2025-01-05")
+        self.assertEqual(normalize("01/05/2025"), "2025-01-05")
+        self.assertEqual(normalize("Jan 05, 2025"), "2025-01-05")
+        self.assertIsNone(normalize("next tuesday"))
+        self.assertIsNone(normalize(None))
+
+if __name__ == "__main__":
+    unittest.main()
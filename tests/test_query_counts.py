@@ -0,0 +1,125 @@
+import unittest
+from datetime import date
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import create_app
+from app.extensions import db
+from app.models import Customer, Mechanic, Inventory, ServiceTicket
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class TestQueryCounts(unittest.TestCase):
+
+    TICKETS = 100
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customers = [
+                Customer(
+                    name=f"Customer {i}",
+                    email=f"customer{i}@example.com",
+                    phone="111-111-1111",
+                    password="password"
+                )
+                for i in range(10)
+            ]
+            mechanics = [
+                Mechanic(
+                    name=f"Mechanic {i}",
+                    email=f"mechanic{i}@example.com",
+                    phone="222-222-2222",
+                    salary=50000
+                )
+                for i in range(10)
+            ]
+            parts = [
+                Inventory(name=f"Part {i}", price=10.0 + i, quantity=100)
+                for i in range(10)
+            ]
+            db.session.add_all(customers + mechanics + parts)
+            db.session.flush()
+
+            for i in range(self.TICKETS):
+                ticket = ServiceTicket(
+                    VIN=f"VIN{i}",
+                    service_date=date(2025, 1, 1),
+                    service_desc="Routine service",
+                    customer_id=customers[i % 10].id
+                )
+                ticket.mechanics.extend([mechanics[i % 10], mechanics[(i + 1) % 10]])
+                ticket.parts.extend([parts[i % 10], parts[(i + 3) % 10]])
+                db.session.add(ticket)
+
+            db.session.commit()
+
+            self.token = encode_token(customers[0].id)
+
+    def auth_header(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    @contextmanager
+    def count_queries(self):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    def assert_query_count(self, url, expected, headers=None):
+        with self.count_queries() as statements:
+            response = self.client.get(url, headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            len(statements), expected,
+            f"{url} issued {len(statements)} queries:\n" + "\n".join(statements)
+        )
+        return response
+
+# Service tickets: base + customer join, mechanics, parts, lines
+    def test_service_tickets_query_count(self):
+        response = self.assert_query_count("/service-tickets?limit=100", 4)
+        self.assertEqual(len(response.json), self.TICKETS)
+
+    def test_my_tickets_query_count(self):
+        self.assert_query_count("/service-tickets/my-tickets", 4, self.auth_header())
+
+# Customers: base, tickets, mechanics, parts, lines
+    def test_customers_query_count(self):
+        self.assert_query_count("/customers", 5)
+
+# Mechanics: base, tickets + customer join, parts, lines
+    def test_mechanics_query_count(self):
+        self.assert_query_count("/mechanics", 4)
+
+# Inventory: base, tickets + customer join, mechanics
+    def test_inventory_query_count(self):
+        self.assert_query_count("/inventory", 3, self.auth_header())
+
+# Sparse fieldsets skip the nested loads that were not asked for
+    def test_sparse_fields_query_count(self):
+        response = self.assert_query_count("/service-tickets?limit=100&fields=id,VIN,service_date", 1)
+        self.assertEqual(set(response.json[0]), {"id", "VIN", "service_date"})
+
+        response = self.assert_query_count("/service-tickets?limit=100&fields=id&include=mechanics", 2)
+        self.assertEqual(set(response.json[0]), {"id", "mechanics"})
+
+        self.assert_query_count("/customers?fields=id,name", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+from unittest import mock
+from app import create_app
+from app.extensions import db
+from app.models import Customer, Mechanic, Inventory
+from app.utils.auth import encode_token
+from app.utils import reporting
+from app.utils.reporting import rebuild_reports
+from app.utils.caching import invalidate
+from config import TestingConfig
+
+
+class TestReports(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customer = Customer(
+                name="Test User",
+                email="test@example.com",
+                phone="456-456-4567",
+                password="password"
+            )
+            mechanic = Mechanic(name="John Mechanic", email="john@example.com", phone="111", salary=55000)
+            filter_part = Inventory(name="Oil Filter", price=25.0, quantity=10)
+            pads = Inventory(name="Brake Pads", price=100.0, quantity=10)
+            db.session.add_all([customer, mechanic, filter_part, pads])
+            db.session.commit()
+
+            self.customer_id = customer.id
+            self.mech_id = mechanic.id
+            self.filter_id = filter_part.id
+            self.pads_id = pads.id
+
+            self.token = encode_token(self.customer_id)
+
+        self.client = self.app.test_client()
+
+        # Two tickets on Jan 1, one on Jan 2
+        self.ticket_ids = [
+            self.create_ticket("2025-01-01"),
+            self.create_ticket("2025-01-01"),
+            self.create_ticket("2025-01-02"),
+        ]
+        self.add_part(self.ticket_ids[0], self.filter_id, 2)
+        self.add_part(self.ticket_ids[0], self.pads_id, 1)
+        self.add_part(self.ticket_ids[2], self.filter_id, 1)
+
+# Authorization
+    def auth_header(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def create_ticket(self, service_date):
+        response = self.client.post(
+            "/service-tickets",
+            json={"VIN": "VIN", "service_date": service_date, "customer_id": self.customer_id},
+            headers=self.auth_header()
+        )
+        return response.json["id"]
+
+    def add_part(self, ticket_id, part_id, quantity):
+        response = self.client.put(
+            f"/service-tickets/{ticket_id}/add-part/{part_id}",
+            json={"quantity": quantity},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 200)
+
+# Revenue per day
+    def test_revenue_report(self):
+        response = self.client.get("/reports/revenue", headers=self.auth_header())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["days"], [
+            {"day": "2025-01-01", "tickets": 2, "units": 3, "revenue": 150.0},
+            {"day": "2025-01-02", "tickets": 1, "units": 1, "revenue": 25.0},
+        ])
+        self.assertEqual(response.json["totals"], {"tickets": 3, "units": 4, "revenue": 175.0})
+
+    # Revenue for a date range
+    def test_revenue_report_range(self):
+        response = self.client.get("/reports/revenue?from=2025-01-02&to=2025-01-31", headers=self.auth_header())
+
+        self.assertEqual([day["day"] for day in response.json["days"]], ["2025-01-02"])
+        self.assertEqual(response.json["totals"]["revenue"], 25.0)
+
+    # Revenue (invalid)
+    def test_revenue_report_invalid(self):
+        response = self.client.get("/reports/revenue?from=yesterday", headers=self.auth_header())
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/reports/revenue")
+        self.assertEqual(response.status_code, 401)
+
+# Usage per part
+    def test_parts_report(self):
+        response = self.client.get("/reports/parts", headers=self.auth_header())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [
+            {"inventory_id": self.filter_id, "name": "Oil Filter", "units": 3, "tickets": 2, "revenue": 75.0},
+            {"inventory_id": self.pads_id, "name": "Brake Pads", "units": 1, "tickets": 1, "revenue": 100.0},
+        ])
+
+        response = self.client.get("/reports/parts?limit=1", headers=self.auth_header())
+        self.assertEqual(len(response.json), 1)
+
+        response = self.client.get("/reports/parts?limit=0", headers=self.auth_header())
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/reports/parts?limit=x", headers=self.auth_header())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json["error"], "limit must be an integer.")
+
+    # Batch-added parts count one unit each
+    def test_parts_report_batch(self):
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_ids[1]}/parts",
+            json={"part_ids": [self.filter_id, self.pads_id]},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/reports/parts", headers=self.auth_header())
+        units = {row["inventory_id"]: row["units"] for row in response.json}
+        self.assertEqual(units, {self.filter_id: 4, self.pads_id: 2})
+
+# Tickets per mechanic
+    def test_mechanics_report(self):
+        self.client.put(f"/service-tickets/{self.ticket_ids[0]}/assign-mechanic/{self.mech_id}")
+
+        response = self.client.get("/reports/mechanics", headers=self.auth_header())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [{"id": self.mech_id, "name": "John Mechanic", "ticket_count": 1}])
+
+        response = self.client.get("/reports/mechanics?limit=x", headers=self.auth_header())
+        self.assertEqual(response.status_code, 400)
+
+# A rebuild from the raw rows matches the incremental aggregates
+    def test_rebuild_matches(self):
+        before = self.client.get("/reports/revenue", headers=self.auth_header()).json
+        parts_before = self.client.get("/reports/parts", headers=self.auth_header()).json
+
+        with self.app.app_context():
+            rebuild_reports(db.session)
+            db.session.commit()
+            invalidate("service_tickets")
+
+        self.assertEqual(self.client.get("/reports/revenue", headers=self.auth_header()).json, before)
+        self.assertEqual(self.client.get("/reports/parts", headers=self.auth_header()).json, parts_before)
+
+# Databases without ON CONFLICT get the same figures from the portable path
+    def test_upsert_fallback(self):
+        before = self.client.get("/reports/revenue", headers=self.auth_header()).json
+
+        with mock.patch.dict(reporting._UPSERTS, clear=True):
+            ticket_id = self.create_ticket("2025-01-03")
+            self.add_part(ticket_id, self.filter_id, 2)
+            self.add_part(self.ticket_ids[2], self.pads_id, 1)
+
+        response = self.client.get("/reports/revenue", headers=self.auth_header())
+        self.assertEqual(response.json["days"], before["days"][:1] + [
+            {"day": "2025-01-02", "tickets": 1, "units": 2, "revenue": 125.0},
+            {"day": "2025-01-03", "tickets": 1, "units": 2, "revenue": 50.0},
+        ])
+        self.assertEqual(response.json["totals"], {"tickets": 4, "units": 7, "revenue": 325.0})
+
+        response = self.client.get("/reports/parts", headers=self.auth_header())
+        units = {row["inventory_id"]: row["units"] for row in response.json}
+        self.assertEqual(units, {self.filter_id: 5, self.pads_id: 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from sqlalchemy import select, text
+from app import create_app, migrations
+from app.extensions import db
+from app.models import Customer, Inventory, ServiceTicket
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class TestSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customers = [
+                Customer(name="John Smith", email="john@example.com", phone="555-1234", password="x"),
+                Customer(name="Jane Smithers", email="jane@example.com", phone="555-9876", password="x"),
+                Customer(name="Bob Jones", email="bob@garage.org", phone="777-0000", password="x"),
+            ]
+            db.session.add_all(customers)
+            db.session.flush()
+
+            db.session.add_all([
+                ServiceTicket(VIN="1HGCM82633A004352", service_desc="Brake job", customer_id=customers[0].id),
+                ServiceTicket(VIN="5YJSA1E26HF000337", service_desc="Battery check", customer_id=customers[1].id),
+                Inventory(name="Brake Pads", price=100.0, quantity=5),
+                Inventory(name="Oil Filter", price=25.0, quantity=5),
+            ])
+            db.session.commit()
+
+            self.customer_ids = [customer.id for customer in customers]
+            self.token = encode_token(self.customer_ids[0])
+
+        self.client = self.app.test_client()
+
+# Authorization
+    def auth_header(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+# Search customers by partial name, email or phone
+    def test_search_customers(self):
+        response = self.client.get("/search/customers?q=smith")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({c["name"] for c in response.json}, {"John Smith", "Jane Smithers"})
+
+        response = self.client.get("/search/customers?q=garage")
+        self.assertEqual([c["name"] for c in response.json], ["Bob Jones"])
+
+        response = self.client.get("/search/customers?q=9876")
+        self.assertEqual([c["name"] for c in response.json], ["Jane Smithers"])
+
+        # Every term must match
+        response = self.client.get("/search/customers?q=smith jane")
+        self.assertEqual([c["name"] for c in response.json], ["Jane Smithers"])
+
+    # Search (invalid)
+    def test_search_invalid(self):
+        self.assertEqual(self.client.get("/search/customers").status_code, 400)
+        self.assertEqual(self.client.get("/search/customers?q=jo").status_code, 400)
+        self.assertEqual(self.client.get("/search/customers?q=john&after=bogus").status_code, 400)
+        self.assertEqual(self.client.get("/search/parts?q=brake").status_code, 401)
+
+# Writes are searchable straight away
+    def test_index_follows_writes(self):
+        customer_id = self.customer_ids[2]
+
+        response = self.client.put(
+            f"/customers/{customer_id}",
+            json={"name": "Robert Green"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual([c["name"] for c in self.client.get("/search/customers?q=robert").json], ["Robert Green"])
+        self.assertEqual(self.client.get("/search/customers?q=jones").json, [])
+
+        response = self.client.delete(f"/customers/{customer_id}")
+        self.assertEqual(response.status_code, 200, response.json)
+        self.assertEqual(self.client.get("/search/customers?q=robert").json, [])
+
+# Only updates to indexed columns rewrite the index
+    def test_update_trigger_columns(self):
+        with self.app.app_context():
+            sql = db.session.execute(text(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'inventory_fts_au'"
+            )).scalar_one()
+        self.assertIn('AFTER UPDATE OF "name" ON inventory', sql)
+
+        # A stock change leaves the part searchable under its name
+        with self.app.app_context():
+            part = db.session.execute(select(Inventory).filter_by(name="Brake Pads")).scalar_one()
+            part.quantity = 1
+            db.session.commit()
+
+        response = self.client.get("/search/parts?q=brake", headers=self.auth_header())
+        self.assertEqual([p["name"] for p in response.json], ["Brake Pads"])
+
+# Search tickets by partial VIN and parts by name
+    def test_search_tickets_and_parts(self):
+        response = self.client.get("/search/tickets?q=004352")
+        self.assertEqual([t["VIN"] for t in response.json], ["1HGCM82633A004352"])
+
+        response = self.client.get("/search/tickets?q=battery")
+        self.assertEqual([t["VIN"] for t in response.json], ["5YJSA1E26HF000337"])
+
+        response = self.client.get("/search/parts?q=brake", headers=self.auth_header())
+        self.assertEqual([p["name"] for p in response.json], ["Brake Pads"])
+
+# Ranked results page with a cursor
+    def test_search_pagination(self):
+        first = self.client.get("/search/customers?q=555&limit=1&count=true")
+
+        self.assertEqual(len(first.json), 1)
+        self.assertEqual(first.headers["X-Total-Count"], "2")
+
+        second = self.client.get(f"/search/customers?q=555&limit=1&after={first.headers['X-Next-Cursor']}")
+        self.assertEqual(len(second.json), 1)
+        self.assertNotIn("X-Next-Cursor", second.headers)
+        self.assertNotEqual(first.json[0]["id"], second.json[0]["id"])
+
+# Migrating an existing database indexes its current rows
+    def test_migration_rebuilds_index(self):
+        with self.app.app_context():
+            with db.engine.begin() as conn:
+                conn.execute(text("DROP TABLE customers_fts"))
+                conn.execute(text("DELETE FROM schema_migrations WHERE version = 6"))
+
+            migrations.upgrade(db.engine)
+
+        response = self.client.get("/search/customers?q=john")
+        self.assertEqual([c["name"] for c in response.json], ["John Smith"])
+
+    # Migrating narrows update triggers created before v0008
+    def test_migration_narrows_update_trigger(self):
+        with self.app.app_context():
+            with db.engine.begin() as conn:
+                conn.execute(text("DROP TRIGGER customers_fts_au"))
+                conn.execute(text(
+                    "CREATE TRIGGER customers_fts_au AFTER UPDATE ON customers BEGIN SELECT 1; END"
+                ))
+                conn.execute(text("DELETE FROM schema_migrations WHERE version = 8"))
+
+            migrations.upgrade(db.engine)
+
+            sql = db.session.execute(text(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'customers_fts_au'"
+            )).scalar_one()
+        self.assertIn('AFTER UPDATE OF "name", "email", "phone" ON customers', sql)
+
+        response = self.client.put(f"/customers/{self.customer_ids[2]}", json={"name": "Robert Green"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c["name"] for c in self.client.get("/search/customers?q=robert").json], ["Robert Green"])
+
+
+if __name__ == "__main__":
+    unittest.main()
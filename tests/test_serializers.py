@@ -0,0 +1,91 @@
+import unittest
+from datetime import date
+from app import create_app
+from app.extensions import db, cache
+from app.models import Customer, Mechanic, Inventory, ServiceTicket
+from app.utils.auth import encode_token
+from config import TestingConfig
+
+
+class TestFastSerializers(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            customer = Customer(
+                name="Zoë Customer",
+                email="zoe@example.com",
+                phone="",
+                password="password"
+            )
+            mechanic = Mechanic(
+                name="Fast Mechanic",
+                email="fast@example.com",
+                phone="222-222-2222",
+                salary=52000
+            )
+            part = Inventory(name="Spark Plug", price=7, quantity=12)
+            db.session.add_all([customer, mechanic, part])
+            db.session.flush()
+
+            for i in range(3):
+                ticket = ServiceTicket(
+                    VIN=f"FAST{i}",
+                    service_date=date(2025, 3, i + 1),
+                    service_desc=None if i == 2 else "Tune-up",
+                    customer_id=customer.id
+                )
+                ticket.mechanics.append(mechanic)
+                ticket.parts.append(part)
+                db.session.add(ticket)
+
+            db.session.commit()
+
+            self.token = encode_token(customer.id)
+
+    def auth_header(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def get_both(self, url, headers=None):
+        self.app.config["FAST_SERIALIZER_ENDPOINTS"] = ()
+        slow = self.client.get(url, headers=headers)
+
+        with self.app.app_context():
+            cache.clear()
+
+        self.app.config["FAST_SERIALIZER_ENDPOINTS"] = None
+        fast = self.client.get(url, headers=headers)
+
+        self.assertEqual(slow.status_code, 200)
+        self.assertEqual(fast.status_code, 200)
+        return slow.data, fast.data
+
+# Byte-identical output for each list endpoint
+    def test_service_tickets_identical(self):
+        slow, fast = self.get_both("/service-tickets")
+        self.assertEqual(slow, fast)
+
+    def test_my_tickets_identical(self):
+        slow, fast = self.get_both("/service-tickets/my-tickets", self.auth_header())
+        self.assertEqual(slow, fast)
+
+    def test_customers_identical(self):
+        slow, fast = self.get_both("/customers")
+        self.assertEqual(slow, fast)
+
+    def test_mechanics_identical(self):
+        slow, fast = self.get_both("/mechanics")
+        self.assertEqual(slow, fast)
+
+    def test_inventory_identical(self):
+        slow, fast = self.get_both("/inventory", self.auth_header())
+        self.assertEqual(slow, fast)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
+import json
+import threading
 import unittest
+from datetime import date
+from sqlalchemy import event
 from app import create_app
 from app.extensions import db
-from app.models import Customer, Mechanic, Inventory, ServiceTicket
+from app.models import (
+    Customer, Mechanic, Inventory, InventoryEvent, ServiceTicket, service_mechanics, service_ticket_inventory,
+)
 from app.utils.auth import encode_token
 from config import TestingConfig
 
@@ -42,7 +48,7 @@ class TestServiceTickets(unittest.TestCase):
 
             ticket = ServiceTicket(
                 VIN="TEST123",
-                service_date="2025-01-01",
+                service_date=date(2025, 1, 1),
                 service_desc="Broken brakes",
                 customer_id=customer.id
             )
@@ -105,6 +111,44 @@ class TestServiceTickets(unittest.TestCase):
         self.assertIsInstance(response.json, list)
         self.assertGreaterEqual(len(response.json), 1)
 
+    # Get all tickets (keyset pagination)
+    def test_get_tickets_paginated(self):
+        with self.app.app_context():
+            for i in range(4):
+                db.session.add(ServiceTicket(
+                    VIN=f"PAGE{i}",
+                    service_desc="Paging",
+                    customer_id=self.customer_id
+                ))
+            db.session.commit()
+
+        response = self.client.get("/service-tickets?limit=2&count=true")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json), 2)
+        self.assertEqual(response.headers["X-Total-Count"], "5")
+        self.assertIn('rel="next"', response.headers["Link"])
+
+        seen = [ticket["id"] for ticket in response.json]
+        cursor = response.headers["X-Next-Cursor"]
+
+        while cursor:
+            response = self.client.get(f"/service-tickets?limit=2&after={cursor}")
+            self.assertEqual(response.status_code, 200)
+            seen.extend(ticket["id"] for ticket in response.json)
+            cursor = response.headers.get("X-Next-Cursor")
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(seen, sorted(seen))
+
+    # Get all tickets (invalid pagination)
+    def test_get_tickets_paginated_invalid(self):
+        response = self.client.get("/service-tickets?after=not-a-cursor")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/service-tickets?limit=abc")
+        self.assertEqual(response.status_code, 400)
+
 # My tickets
     def test_get_my_tickets(self):
         response = self.client.get(
@@ -115,11 +159,209 @@ class TestServiceTickets(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json[0]["customer_id"], self.customer_id)
 
+    # Conditional GET on my tickets, per customer
+    def test_get_my_tickets_not_modified(self):
+        response = self.client.get("/service-tickets/my-tickets", headers=self.auth_header())
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            "/service-tickets/my-tickets",
+            headers={**self.auth_header(), "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        with self.app.app_context():
+            other = Customer(name="Other", email="other@example.com", password="x", phone="")
+            db.session.add(other)
+            db.session.commit()
+            other_token = encode_token(other.id)
+
+        response = self.client.get(
+            "/service-tickets/my-tickets",
+            headers={"Authorization": f"Bearer {other_token}", "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, [])
+
+        self.client.put(
+            f"/service-tickets/{self.ticket_id}/assign-mechanic/{self.mech_id}",
+            headers=self.auth_header()
+        )
+        response = self.client.get(
+            "/service-tickets/my-tickets",
+            headers={**self.auth_header(), "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json[0]["mechanics"]), 1)
+
     # My tickets (invalid)
     def test_get_my_tickets_invalid(self):
         response = self.client.get("/service-tickets/my-tickets")
         self.assertEqual(response.status_code, 401)
 
+    # Get all tickets (cache is invalidated by writes)
+    def test_get_tickets_cache_invalidated(self):
+        response = self.client.get("/service-tickets")
+        self.assertEqual(response.json[0]["mechanics"], [])
+
+        self.client.put(
+            f"/service-tickets/{self.ticket_id}/assign-mechanic/{self.mech_id}"
+        )
+
+        response = self.client.get("/service-tickets")
+        self.assertEqual(len(response.json[0]["mechanics"]), 1)
+
+        self.client.put(
+            f"/mechanics/{self.mech_id}",
+            json={"name": "Renamed Mechanic"}
+        )
+
+        response = self.client.get("/service-tickets")
+        self.assertEqual(response.json[0]["mechanics"][0]["name"], "Renamed Mechanic")
+
+    # Get all tickets (cache keyed on query string)
+    def test_get_tickets_cache_query_string(self):
+        with self.app.app_context():
+            db.session.add(ServiceTicket(
+                VIN="SECOND",
+                service_desc="Second page",
+                customer_id=self.customer_id
+            ))
+            db.session.commit()
+
+        first = self.client.get("/service-tickets?limit=1")
+        second = self.client.get(
+            f"/service-tickets?limit=1&after={first.headers['X-Next-Cursor']}"
+        )
+
+        self.assertEqual(first.json[0]["VIN"], "TEST123")
+        self.assertEqual(second.json[0]["VIN"], "SECOND")
+
+    # Get all tickets (date range and service_date order)
+    def test_get_tickets_by_date(self):
+        with self.app.app_context():
+            for day in (date(2025, 3, 1), None, date(2024, 12, 1), date(2025, 2, 1)):
+                db.session.add(ServiceTicket(
+                    VIN="DATED",
+                    service_date=day,
+                    service_desc="Dated",
+                    customer_id=self.customer_id
+                ))
+            db.session.commit()
+
+        response = self.client.get("/service-tickets?from=2025-01-01&to=2025-02-28")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [ticket["service_date"] for ticket in response.json],
+            ["2025-01-01", "2025-02-01"]
+        )
+
+        dates = []
+        cursor = ""
+        while cursor is not None:
+            response = self.client.get(f"/service-tickets?order=-service_date&limit=2&after={cursor}")
+            self.assertEqual(response.status_code, 200)
+            dates.extend(ticket["service_date"] for ticket in response.json)
+            cursor = response.headers.get("X-Next-Cursor")
+
+        self.assertEqual(dates, ["2025-03-01", "2025-02-01", "2025-01-01", "2024-12-01", None])
+
+    # Get all tickets by date (invalid)
+    def test_get_tickets_by_date_invalid(self):
+        response = self.client.get("/service-tickets?from=01/01/2025")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/service-tickets?order=VIN")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(
+            "/service-tickets",
+            json={"VIN": "BADDATE", "service_date": "someday", "customer_id": self.customer_id},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("service_date", response.json)
+
+# Filter, sort and select fields
+    def test_get_tickets_query_params(self):
+        with self.app.app_context():
+            other = Customer(name="Other", email="other@example.com", password="x", phone="")
+            db.session.add(other)
+            db.session.flush()
+            db.session.add_all([
+                ServiceTicket(VIN="OTHER1", service_date=date(2025, 2, 1), customer_id=other.id),
+                ServiceTicket(VIN="OTHER2", service_date=date(2025, 3, 1), customer_id=other.id),
+            ])
+            db.session.commit()
+            other_id = other.id
+
+        response = self.client.get(f"/service-tickets?filter[customer_id]={other_id}&sort=-id")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t["VIN"] for t in response.json], ["OTHER2", "OTHER1"])
+
+        response = self.client.get("/service-tickets?filter[VIN]=TEST123,OTHER2&sort=VIN")
+        self.assertEqual([t["VIN"] for t in response.json], ["OTHER2", "TEST123"])
+
+        response = self.client.get("/service-tickets?fields=id,VIN&include=customer&sort=-service_date")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json[0]["VIN"], "OTHER2")
+        self.assertEqual(set(response.json[0]), {"id", "VIN", "customer"})
+        self.assertEqual(response.json[0]["customer"]["id"], other_id)
+
+    def test_get_tickets_query_params_invalid(self):
+        for url in (
+            "/service-tickets?filter[password]=x",
+            "/service-tickets?filter[customer_id]=abc",
+            "/service-tickets?sort=-nope",
+            "/service-tickets?fields=",
+            "/service-tickets?fields=id,nope",
+            "/service-tickets?include=nope",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json)
+
+# Export tickets as NDJSON
+    def test_export_tickets(self):
+        with self.app.app_context():
+            other = Customer(name="Other", email="other@example.com", password="x", phone="222")
+            db.session.add(other)
+            db.session.flush()
+
+            # The export covers every customer's tickets, not just the caller's
+            for i in range(3):
+                db.session.add(ServiceTicket(
+                    VIN=f"EXPORT{i}",
+                    service_desc="Export",
+                    customer_id=other.id
+                ))
+            db.session.commit()
+
+        self.app.config["EXPORT_BATCH_SIZE"] = 2
+
+        response = self.client.get(
+            "/service-tickets/export",
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertTrue(response.is_streamed)
+
+        lines = response.get_data(as_text=True).splitlines()
+        tickets = [json.loads(line) for line in lines]
+
+        self.assertEqual(len(tickets), 4)
+        self.assertEqual(tickets[0]["VIN"], "TEST123")
+        self.assertEqual(tickets[0]["customer"]["email"], "test@example.com")
+
+    # Export tickets (invalid)
+    def test_export_tickets_invalid(self):
+        response = self.client.get("/service-tickets/export")
+        self.assertEqual(response.status_code, 401)
+
 # Assign mechanic
     def test_assign_mechanic(self):
         response = self.client.put(
@@ -139,6 +381,51 @@ class TestServiceTickets(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json["error"], "Service ticket not found.")
 
+# Assign several mechanics
+    def test_assign_mechanics(self):
+        with self.app.app_context():
+            second = Mechanic(
+                name="Second Mechanic",
+                email="second@example.com",
+                phone="999-999-9999",
+                salary=45000
+            )
+            db.session.add(second)
+            db.session.commit()
+            second_id = second.id
+
+        self.client.put(
+            f"/service-tickets/{self.ticket_id}/assign-mechanic/{self.mech_id}"
+        )
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/mechanics",
+            json={"mechanic_ids": [self.mech_id, second_id, second_id]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(m["id"] for m in response.json["mechanics"]),
+            sorted([self.mech_id, second_id])
+        )
+
+    # Assign several mechanics (invalid)
+    def test_assign_mechanics_invalid(self):
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/mechanics",
+            json={"mechanic_ids": [self.mech_id, 9998, 9999]}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json["mechanic_ids"], [9998, 9999])
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/mechanics",
+            json={"mechanic_ids": []}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
 # Remove mechanic
     def test_remove_mechanic(self):
         self.client.put(
@@ -161,6 +448,119 @@ class TestServiceTickets(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json["error"], "Service ticket not found.")
 
+# Auto-assign the least loaded mechanic
+    def test_auto_assign(self):
+        with self.app.app_context():
+            idle = Mechanic(name="Idle Mechanic", email="idle@example.com", phone="222", salary=50000)
+            second_ticket = ServiceTicket(VIN="SECOND", service_desc="Oil", customer_id=self.customer_id)
+            db.session.add_all([idle, second_ticket])
+            db.session.commit()
+            idle_id, second_id = idle.id, second_ticket.id
+
+        self.client.put(f"/service-tickets/{self.ticket_id}/assign-mechanic/{self.mech_id}")
+
+        response = self.client.post(f"/service-tickets/{second_id}/auto-assign")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m["id"] for m in response.json["mechanics"]], [idle_id])
+        self.assertEqual(response.json["mechanics"][0]["ticket_load"], 1)
+
+        # Loads follow removals too
+        self.client.put(f"/service-tickets/{self.ticket_id}/remove-mechanic/{self.mech_id}")
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Mechanic, self.mech_id).ticket_load, 0)
+            self.assertEqual(db.session.get(Mechanic, idle_id).ticket_load, 1)
+
+    # Auto-assign several, skipping mechanics already on the ticket
+    def test_auto_assign_count(self):
+        with self.app.app_context():
+            db.session.add(Mechanic(name="Second", email="second@example.com", phone="222", salary=50000))
+            db.session.commit()
+
+        response = self.client.post(f"/service-tickets/{self.ticket_id}/auto-assign", json={"count": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json["mechanics"]), 2)
+
+        response = self.client.post(f"/service-tickets/{self.ticket_id}/auto-assign")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json["error"], "No mechanic available.")
+
+    # Auto-assign (invalid)
+    def test_auto_assign_invalid(self):
+        response = self.client.post("/service-tickets/9999/auto-assign")
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.post(f"/service-tickets/{self.ticket_id}/auto-assign", json={"count": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("count", response.json)
+
+    # A concurrent auto-assign linking the same mechanic first is a 409
+    def test_auto_assign_concurrent(self):
+        with self.app.app_context():
+            engine = db.engine
+        raced = []
+
+        # Commit the same link from another connection between this
+        # request's read of the loads and its INSERT
+        def link_first(conn, cursor, statement, *args):
+            if statement.startswith("INSERT INTO service_mechanics") and not raced:
+                raced.append(True)
+                with engine.begin() as other:
+                    other.execute(service_mechanics.insert().values(ticket_id=self.ticket_id, mechanic_id=self.mech_id))
+
+        event.listen(engine, "before_cursor_execute", link_first)
+        try:
+            response = self.client.post(f"/service-tickets/{self.ticket_id}/auto-assign")
+        finally:
+            event.remove(engine, "before_cursor_execute", link_first)
+
+        self.assertEqual(response.status_code, 409)
+        with self.app.app_context():
+            # The load was not counted for the rolled-back link
+            self.assertEqual(db.session.get(Mechanic, self.mech_id).ticket_load, 0)
+
+    # Auto-assign rate limit comes from config
+    def test_auto_assign_rate_limit(self):
+        for _ in range(5):
+            self.assertEqual(self.client.post("/service-tickets/9999/auto-assign").status_code, 404)
+
+        self.app.config["AUTO_ASSIGN_RATE_LIMIT"] = "1 per minute"
+        self.client.post("/service-tickets/9999/auto-assign")
+        self.assertEqual(self.client.post("/service-tickets/9999/auto-assign").status_code, 429)
+
+    # Deleting a customer releases their tickets' mechanics
+    def test_delete_customer_releases_load(self):
+        self.client.put(f"/service-tickets/{self.ticket_id}/assign-mechanic/{self.mech_id}")
+
+        response = self.client.delete(f"/customers/{self.customer_id}")
+        self.assertEqual(response.status_code, 200)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Mechanic, self.mech_id).ticket_load, 0)
+
+    # Deleting a customer returns their tickets' reserved parts to stock
+    def test_delete_customer_restocks_parts(self):
+        with self.app.app_context():
+            db.session.get(Inventory, self.part_id).reorder_threshold = 2
+            db.session.commit()
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/add-part/{self.part_id}",
+            json={"quantity": 4},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.delete(f"/customers/{self.customer_id}")
+        self.assertEqual(response.status_code, 200)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 5)
+            events = db.session.execute(
+                db.select(InventoryEvent.kind, InventoryEvent.quantity).order_by(InventoryEvent.id)
+            ).all()
+        self.assertEqual([tuple(event) for event in events], [("low_stock", 1), ("restocked", 5)])
+
 # Add part to ticket
     def test_add_part_to_ticket(self):
         response = self.client.put(
@@ -170,6 +570,109 @@ class TestServiceTickets(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json["parts"]), 1)
+        self.assertEqual(response.json["parts"][0]["quantity"], 4)
+
+    # Consuming stock below the reorder threshold records an event
+    def test_add_part_low_stock_event(self):
+        with self.app.app_context():
+            db.session.get(Inventory, self.part_id).reorder_threshold = 2
+            db.session.commit()
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/add-part/{self.part_id}",
+            json={"quantity": 3},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/inventory/events", headers=self.auth_header())
+        self.assertEqual(len(response.json), 1)
+        self.assertEqual(response.json[0]["kind"], "low_stock")
+        self.assertEqual(response.json[0]["quantity"], 2)
+
+    # Add part to ticket with a quantity
+    def test_add_part_quantity(self):
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/add-part/{self.part_id}",
+            json={"quantity": 3},
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 2)
+            line = db.session.execute(db.select(service_ticket_inventory.c.quantity)).scalar_one()
+            self.assertEqual(line, 3)
+
+        # The line quantity is returned apart from the part's stock on hand
+        self.assertEqual(response.json["lines"], [{"inventory_id": self.part_id, "quantity": 3}])
+        self.assertEqual(response.json["parts"][0]["quantity"], 2)
+
+        response = self.client.get("/service-tickets")
+        self.assertEqual(response.json[0]["lines"], [{"inventory_id": self.part_id, "quantity": 3}])
+
+    # Add part to ticket (not enough stock)
+    def test_add_part_insufficient_stock(self):
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/add-part/{self.part_id}",
+            json={"quantity": 6},
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json["part_ids"], [self.part_id])
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/add-part/{self.part_id}",
+            json={"quantity": 0},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 400)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 5)
+            self.assertEqual(db.session.get(ServiceTicket, self.ticket_id).parts, [])
+
+    # Many concurrent requests for the same part never oversell it
+    def test_add_part_concurrent(self):
+        threads_count = 20
+
+        with self.app.app_context():
+            tickets = [
+                ServiceTicket(VIN=f"RACE{i}", customer_id=self.customer_id)
+                for i in range(threads_count)
+            ]
+            db.session.add_all(tickets)
+            db.session.commit()
+            ticket_ids = [ticket.id for ticket in tickets]
+
+        statuses = []
+        barrier = threading.Barrier(threads_count)
+
+        def reserve(ticket_id):
+            client = self.app.test_client()
+            barrier.wait()
+            response = client.put(
+                f"/service-tickets/{ticket_id}/add-part/{self.part_id}",
+                headers=self.auth_header()
+            )
+            statuses.append(response.status_code)
+
+        threads = [threading.Thread(target=reserve, args=(ticket_id,)) for ticket_id in ticket_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(statuses.count(200), 5)
+        self.assertEqual(statuses.count(409), threads_count - 5)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 0)
+            lines = db.session.execute(
+                db.select(db.func.count()).select_from(service_ticket_inventory)
+            ).scalar_one()
+            self.assertEqual(lines, 5)
 
     # Add part to ticket (invalid)
     def test_add_part_to_ticket_invalid(self):
@@ -194,5 +697,72 @@ class TestServiceTickets(unittest.TestCase):
         self.assertEqual(response.json["error"], "Not authorized to modify this ticket")
 
 
+# Add several parts
+    def test_add_parts_to_ticket(self):
+        with self.app.app_context():
+            rotor = Inventory(name="Rotor", price=80.00, quantity=4)
+            db.session.add(rotor)
+            db.session.commit()
+            rotor_id = rotor.id
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/parts",
+            json={"part_ids": [self.part_id, rotor_id]},
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json["parts"]), 2)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 4)
+            self.assertEqual(db.session.get(Inventory, rotor_id).quantity, 3)
+
+        # Parts already on the ticket are not reserved again
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/parts",
+            json={"part_ids": [self.part_id]},
+            headers=self.auth_header()
+        )
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 4)
+
+    # Add several parts (invalid)
+    def test_add_parts_to_ticket_invalid(self):
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/parts",
+            json={"part_ids": [self.part_id, 9999]},
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json["part_ids"], [9999])
+
+        with self.app.app_context():
+            empty = Inventory(name="Out of stock", price=5.00, quantity=0)
+            db.session.add(empty)
+            db.session.commit()
+            empty_id = empty.id
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/parts",
+            json={"part_ids": [self.part_id, empty_id]},
+            headers=self.auth_header()
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json["part_ids"], [empty_id])
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Inventory, self.part_id).quantity, 5)
+            self.assertEqual(db.session.get(ServiceTicket, self.ticket_id).parts, [])
+
+        response = self.client.put(
+            f"/service-tickets/{self.ticket_id}/parts",
+            json={"part_ids": [self.part_id]}
+        )
+
+        self.assertEqual(response.status_code, 401)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from app.extensions import db
+from app.models import Mechanic
+from app.utils.ratelimit_storage import SQLiteStorage
+from config import TestingConfig
+
+
+class TestSQLiteRateLimitStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.uri = f"sqlite:///{os.path.join(self.tmpdir, 'limits.db')}"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+# Counters are shared between storages (one per worker)
+    def test_counters_shared(self):
+        worker_a = SQLiteStorage(self.uri)
+        worker_b = SQLiteStorage(self.uri)
+
+        self.assertEqual(worker_a.incr("assign", 3600), 1)
+        self.assertEqual(worker_b.incr("assign", 3600), 2)
+        self.assertEqual(worker_a.get("assign"), 2)
+        self.assertGreater(worker_b.get_expiry("assign"), 0)
+
+        worker_b.clear("assign")
+        self.assertEqual(worker_a.get("assign"), 0)
+
+    # Expired windows start over
+    def test_expired_window_resets(self):
+        storage = SQLiteStorage(self.uri)
+
+        storage.incr("assign", 0)
+        self.assertEqual(storage.get("assign"), 0)
+        self.assertEqual(storage.incr("assign", 3600), 1)
+
+    # Storage requires a file path
+    def test_requires_path(self):
+        with self.assertRaises(ValueError):
+            SQLiteStorage("sqlite://")
+
+
+class TestSharedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+        class SharedConfig(TestingConfig):
+            CACHE_TYPE = "FileSystemCache"
+            CACHE_DIR = os.path.join(self.tmpdir, "cache")
+
+        # Two apps stand in for two gunicorn workers
+        self.worker_a = create_app(SharedConfig)
+        self.worker_b = create_app(SharedConfig)
+
+        with self.worker_a.app_context():
+            db.drop_all()
+            db.create_all()
+
+            mechanic = Mechanic(
+                name="Shared Mechanic",
+                email="shared@example.com",
+                phone="111-222-3333",
+                salary=55000
+            )
+            db.session.add(mechanic)
+            db.session.commit()
+            self.mechanic_id = mechanic.id
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+# A write on one worker invalidates the other worker's cached reads
+    def test_invalidation_across_workers(self):
+        client_a = self.worker_a.test_client()
+        client_b = self.worker_b.test_client()
+
+        self.assertEqual(client_a.get("/mechanics").json[0]["name"], "Shared Mechanic")
+
+        client_b.put(f"/mechanics/{self.mechanic_id}", json={"name": "Renamed"})
+
+        self.assertEqual(client_a.get("/mechanics").json[0]["name"], "Renamed")
+
+
+if __name__ == "__main__":
+    unittest.main()